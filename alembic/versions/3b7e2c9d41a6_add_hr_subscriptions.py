@@ -0,0 +1,42 @@
+"""add hr_subscriptions
+
+Revision ID: 3b7e2c9d41a6
+Revises: f98fdce4da0e
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b7e2c9d41a6'
+down_revision: Union[str, Sequence[str], None] = 'f98fdce4da0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('hr_subscriptions',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.String(length=255), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'position', name='uq_hr_subscriptions_user_position')
+    )
+    op.create_index(op.f('ix_hr_subscriptions_id'), 'hr_subscriptions', ['id'], unique=False)
+    op.create_index(op.f('ix_hr_subscriptions_user_id'), 'hr_subscriptions', ['user_id'], unique=False)
+    op.create_index(op.f('ix_hr_subscriptions_position'), 'hr_subscriptions', ['position'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_hr_subscriptions_position'), table_name='hr_subscriptions')
+    op.drop_index(op.f('ix_hr_subscriptions_user_id'), table_name='hr_subscriptions')
+    op.drop_index(op.f('ix_hr_subscriptions_id'), table_name='hr_subscriptions')
+    op.drop_table('hr_subscriptions')
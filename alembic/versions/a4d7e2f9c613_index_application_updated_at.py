@@ -0,0 +1,32 @@
+"""index application updated_at
+
+Revision ID: a4d7e2f9c613
+Revises: 5e9a1c7b3d20
+Create Date: 2026-10-19 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7e2f9c613'
+down_revision: Union[str, Sequence[str], None] = '5e9a1c7b3d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Заявки, що ще не змінювались, отримують курсор з дати створення
+    op.execute("UPDATE applications SET updated_at = created_at WHERE updated_at IS NULL")
+    op.alter_column('applications', 'updated_at', server_default=sa.text('now()'))
+    op.create_index(op.f('ix_applications_updated_at'), 'applications', ['updated_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_applications_updated_at'), table_name='applications')
+    op.alter_column('applications', 'updated_at', server_default=None)
@@ -0,0 +1,42 @@
+"""add contact hashes and duplicate_of_id to applications
+
+Revision ID: a9d4e7c2b513
+Revises: f3c6b9d1e428
+Create Date: 2026-10-19 19:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a9d4e7c2b513'
+down_revision: Union[str, Sequence[str], None] = 'f3c6b9d1e428'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('applications', sa.Column('email_hash', sa.String(length=32), nullable=True))
+    op.add_column('applications', sa.Column('phone_hash', sa.String(length=32), nullable=True))
+    op.add_column('applications', sa.Column('duplicate_of_id', sa.Integer(), nullable=True))
+    op.create_foreign_key(
+        'fk_applications_duplicate_of_id', 'applications', 'applications',
+        ['duplicate_of_id'], ['id'], ondelete='SET NULL'
+    )
+    op.create_index(op.f('ix_applications_email_hash'), 'applications', ['email_hash'], unique=False)
+    op.create_index(op.f('ix_applications_phone_hash'), 'applications', ['phone_hash'], unique=False)
+    # Існуючі заявки: python scripts/cluster_duplicate_applications.py
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_applications_phone_hash'), table_name='applications')
+    op.drop_index(op.f('ix_applications_email_hash'), table_name='applications')
+    op.drop_constraint('fk_applications_duplicate_of_id', 'applications', type_='foreignkey')
+    op.drop_column('applications', 'duplicate_of_id')
+    op.drop_column('applications', 'phone_hash')
+    op.drop_column('applications', 'email_hash')
@@ -0,0 +1,28 @@
+"""add index on interviews.application_id
+
+Revision ID: b6e2f8a4c915
+Revises: a9d4e7c2b513
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e2f8a4c915'
+down_revision: Union[str, Sequence[str], None] = 'a9d4e7c2b513'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_interviews_application_id'), 'interviews', ['application_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_interviews_application_id'), table_name='interviews')
@@ -0,0 +1,52 @@
+"""add application search_vector
+
+Revision ID: c7f3a9e1b845
+Revises: a4d7e2f9c613
+Create Date: 2026-10-19 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c7f3a9e1b845'
+down_revision: Union[str, Sequence[str], None] = 'a4d7e2f9c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Копія app.models.application.SEARCH_VECTOR_SQL на момент міграції
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(full_name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(email, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(position, '')), 'B') || "
+    "setweight(jsonb_to_tsvector('simple', coalesce(skills::jsonb, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(previous_work, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(additional_info, '')), 'D')"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute(
+        f"ALTER TABLE applications ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    )
+    # Без блокування запису на великій таблиці
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_applications_search_vector "
+            "ON applications USING gin (search_vector)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX IF EXISTS ix_applications_search_vector")
+    op.drop_column('applications', 'search_vector')
@@ -0,0 +1,28 @@
+"""add index on applications.candidate_id
+
+Revision ID: c8a5d2f7e346
+Revises: b6e2f8a4c915
+Create Date: 2026-10-19 22:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8a5d2f7e346'
+down_revision: Union[str, Sequence[str], None] = 'b6e2f8a4c915'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(op.f('ix_applications_candidate_id'), 'applications', ['candidate_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_applications_candidate_id'), table_name='applications')
@@ -0,0 +1,40 @@
+"""add application autocomplete trigram index
+
+Revision ID: d2b8f4a6e917
+Revises: c7f3a9e1b845
+Create Date: 2026-10-19 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b8f4a6e917'
+down_revision: Union[str, Sequence[str], None] = 'c7f3a9e1b845'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Копія app.models.application.AUTOCOMPLETE_SQL на момент міграції
+AUTOCOMPLETE_SQL = "(full_name || ' ' || email || ' ' || coalesce(phone, ''))"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        op.execute(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_applications_autocomplete_trgm "
+            f"ON applications USING gist ({AUTOCOMPLETE_SQL} gist_trgm_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute("DROP INDEX IF EXISTS ix_applications_autocomplete_trgm")
@@ -0,0 +1,49 @@
+"""add skills and application_skills
+
+Revision ID: e5a1c3d7f284
+Revises: d2b8f4a6e917
+Create Date: 2026-10-19 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a1c3d7f284'
+down_revision: Union[str, Sequence[str], None] = 'd2b8f4a6e917'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('skills',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('key', sa.String(length=100), nullable=False),
+    sa.Column('name', sa.String(length=100), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key')
+    )
+    op.create_index(op.f('ix_skills_id'), 'skills', ['id'], unique=False)
+    op.create_table('application_skills',
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('skill_id', sa.Integer(), nullable=False),
+    sa.Column('years', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['skill_id'], ['skills.id'], ),
+    sa.PrimaryKeyConstraint('application_id', 'skill_id')
+    )
+    op.create_index('ix_application_skills_skill_years', 'application_skills', ['skill_id', 'years', 'application_id'], unique=False)
+    # Існуючі заявки: python scripts/backfill_application_skills.py
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_application_skills_skill_years', table_name='application_skills')
+    op.drop_table('application_skills')
+    op.drop_index(op.f('ix_skills_id'), table_name='skills')
+    op.drop_table('skills')
@@ -0,0 +1,52 @@
+"""add similarity terms and application vectors
+
+Revision ID: f3c6b9d1e428
+Revises: e5a1c3d7f284
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f3c6b9d1e428'
+down_revision: Union[str, Sequence[str], None] = 'e5a1c3d7f284'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('similarity_terms',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('term', sa.String(length=100), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('term')
+    )
+    op.create_table('application_vectors',
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('built_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('application_id')
+    )
+    op.create_table('application_terms',
+    sa.Column('term_id', sa.Integer(), nullable=False),
+    sa.Column('application_id', sa.Integer(), nullable=False),
+    sa.Column('weight', sa.Float(), nullable=False),
+    sa.ForeignKeyConstraint(['application_id'], ['applications.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['term_id'], ['similarity_terms.id'], ),
+    sa.PrimaryKeyConstraint('term_id', 'application_id')
+    )
+    op.create_index('ix_application_terms_application', 'application_terms', ['application_id'], unique=False)
+    # Існуючі заявки: python scripts/refresh_application_vectors.py
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_application_terms_application', table_name='application_terms')
+    op.drop_table('application_terms')
+    op.drop_table('application_vectors')
+    op.drop_table('similarity_terms')
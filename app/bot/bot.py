@@ -12,7 +12,14 @@ from app.database import get_db, init_db
 
 def create_bot_application() -> Application:
     """Створити додаток бота"""
-    application = Application.builder().token(settings.BOT_TOKEN).build()
+    builder = Application.builder().token(settings.BOT_TOKEN)
+    
+    # Альтернативний Bot API сервер (напр. scripts/fake_telegram_api.py для бенчмарків)
+    if settings.TELEGRAM_API_BASE_URL:
+        base_url = settings.TELEGRAM_API_BASE_URL.rstrip("/")
+        builder = builder.base_url(f"{base_url}/bot").base_file_url(f"{base_url}/file/bot")
+    
+    application = builder.build()
     
     # Додаємо обробники
     application.add_handler(CommandHandler("start", start_command))
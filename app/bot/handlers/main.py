@@ -58,8 +58,8 @@ async def start_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         director_id = settings.get_director_id()
         if director_id and user_data.id == director_id:
             if user.role != UserRole.DIRECTOR:
-                user.role = UserRole.DIRECTOR
-                db.commit()
+                # Через сервіс - скидає кешовану ідентичність веб-застосунку
+                UserService.assign_role(db, user.id, UserRole.DIRECTOR)
                 db.refresh(user)
     
     keyboard = build_main_menu_keyboard(user)
@@ -1,6 +1,6 @@
 """Конфігурація додатку"""
 from pydantic_settings import BaseSettings
-from typing import Optional
+from typing import Dict, List, Optional
 
 
 class Settings(BaseSettings):
@@ -10,6 +10,7 @@ class Settings(BaseSettings):
     BOT_TOKEN: str
     DIRECTOR_TELEGRAM_ID: Optional[str] = None  # Telegram ID директора (автоматично отримує роль)
     AUTO_ASSIGN_DIRECTOR: bool = False  # Автоматично призначати роль директора (для тестування можна встановити False)
+    TELEGRAM_API_BASE_URL: Optional[str] = None  # Альтернативний Bot API сервер (None - api.telegram.org)
     
     def get_director_id(self) -> Optional[int]:
         """Отримати Telegram ID директора як число"""
@@ -36,9 +37,102 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
     
+    # Автентифікація Mini App
+    INIT_DATA_MAX_AGE_SECONDS: int = 86400  # Термін дії initData від Telegram (0 - без обмеження)
+    INIT_DATA_CACHE_SIZE: int = 10000  # Скільки перевірених initData тримати в кеші
+    ALLOW_INSECURE_AUTH: bool = False  # Довіряти заголовку X-Telegram-User-Id без підпису (лише для розробки)
+    USER_CACHE_TTL_SECONDS: int = 60  # Як довго довіряти закешованій ролі користувача
+    USER_CACHE_SIZE: int = 10000
+    SESSION_TOKEN_TTL_SECONDS: int = 900  # Термін дії токена сесії (роль оновлюється при refresh)
+    SESSION_MAX_AGE_SECONDS: int = 86400  # Скільки сесію можна оновлювати без нового initData
+    
+    # Обмеження частоти запитів
+    RATE_LIMIT_BACKEND: str = "memory"  # memory (в межах процесу) або database (спільний для воркерів)
+    RATE_LIMIT_MAX_KEYS: int = 100000  # Максимум ключів у пам'яті
+    API_RATE_LIMIT_ENABLED: bool = True
+    # Квоти API "запитів/секунд" за класом маршруту (read, write, analytics) або "роль:клас"
+    API_RATE_LIMITS: Dict[str, str] = {
+        "read": "120/60",
+        "write": "30/60",
+        "analytics": "10/60",
+        "analyst:analytics": "30/60",
+        "director:analytics": "30/60",
+        "anonymous:read": "30/60",
+        "anonymous:write": "10/60",
+    }
+    API_ANALYTICS_PREFIXES: List[str] = ["/web/analyst"]  # Важкі (аналітичні) маршрути
+    
+    # Стиснення відповідей (gzip, brotli якщо встановлено пакет brotli)
+    COMPRESSION_MIN_SIZE: int = 1024  # Менші відповіді не стискаємо - виграш менший за накладні витрати
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5  # Для динамічних відповідей; статика стискається заздалегідь з якістю 11
+    COMPRESSION_CONTENT_TYPES: List[str] = [
+        "application/json",
+        "text/html",
+        "text/css",
+        "text/plain",
+        "application/javascript",
+        "text/javascript",
+        "image/svg+xml",
+    ]
+    
+    # Дельта-синхронізація списків (?since=<cursor>)
+    SYNC_CURSOR_OVERLAP_SECONDS: int = 5  # Перекриття для транзакцій, що закомітились пізніше свого updated_at
+    
+    # Автодоповнення кандидатів (pg_trgm)
+    AUTOCOMPLETE_LIMIT: int = 10
+    AUTOCOMPLETE_MIN_SIMILARITY: float = 0.3  # Поріг word_similarity: нижче - пропускає одруківки, але більше шуму
+    AUTOCOMPLETE_TIMEOUT_MS: int = 200  # statement_timeout - повільний запит краще обірвати, ніж тримати з'єднання
+    
+    # Словник синонімів навичок ("py", "Python 3" -> "Python")
+    SKILL_ALIASES_PATH: Optional[str] = None  # JSON {канонічна назва: [синоніми]}; за замовчуванням app/data/skill_aliases.json
+    SKILL_ALIASES_RELOAD_SECONDS: int = 30  # Як часто перевіряти, чи змінився файл
+    
+    # Ранжування пулу за профілем позиції (?sort=match); ваги незаданих критеріїв перерозподіляються
+    MATCH_WEIGHT_SKILLS: float = 0.6
+    MATCH_WEIGHT_ENGLISH: float = 0.2
+    MATCH_WEIGHT_EXPERIENCE: float = 0.2
+    
+    # Схожі кандидати (TF-IDF вектори заявок)
+    SIMILAR_MAX_TERMS: int = 64  # Термів у векторі заявки - решта відкидається як малозначуща
+    SIMILAR_QUERY_TERMS: int = 24  # Термів у запиті - обмежує кількість прочитаних posting lists
+    SIMILAR_MAX_DF_RATIO: float = 0.5  # Терми, що є в більшій частці заявок, ігноруються
+    SIMILAR_MIN_CORPUS: int = 100  # ...але лише коли заявок достатньо для такої статистики
+    SIMILAR_MIN_SCORE: float = 0.05  # Косинусна близькість, нижче якої заявка не вважається схожою
+    SIMILAR_CORPUS_TTL_SECONDS: int = 300  # Як довго кешувати кількість проіндексованих заявок (N для IDF)
+    
     # Web App (буде встановлено автоматично через ngrok або вручну)
     WEB_APP_URL: Optional[str] = None
     
+    # Дайджест сповіщень (коли подій для одного отримувача забагато)
+    DIGEST_THRESHOLD: int = 5  # Скільки подій за вікно відправляти окремими повідомленнями
+    DIGEST_WINDOW_SECONDS: int = 300  # Тривалість вікна та інтервал відправки дайджесту
+    
+    # Маршрутизація сповіщень HR за позиціями
+    ROUTING_REFRESH_SECONDS: int = 60  # Максимальний вік кешу маршрутизації
+    
+    # Ідемпотентність сповіщень
+    IDEMPOTENCY_TTL_SECONDS: int = 86400  # Скільки пам'ятати відправлені сповіщення
+    IDEMPOTENCY_MAX_KEYS: int = 50000  # Максимальна кількість ключів у пам'яті
+    
+    # Черга відправки сповіщень (ліміт Telegram ~30 повідомлень/с на бота)
+    NOTIFY_RATE_PER_SECOND: float = 25.0
+    NOTIFY_QUEUE_SIZE: int = 1000  # Окремо для кожного пріоритету
+    NOTIFY_MAX_IN_FLIGHT: int = 10  # Одночасних запитів до Telegram
+    NOTIFY_MAX_RETRIES: int = 3
+    # Ваги пріоритетів: з кожних 12 відправок при повних чергах 8 - кандидатам
+    NOTIFY_WEIGHT_CRITICAL: int = 8
+    NOTIFY_WEIGHT_NORMAL: int = 3
+    NOTIFY_WEIGHT_BULK: int = 1
+    
+    # Масові розсилки
+    BROADCAST_BATCH_SIZE: int = 500  # Розмір пакета отримувачів, що читається з БД
+    BROADCAST_MAX_JOBS: int = 100  # Скільки останніх розсилок зберігати в пам'яті
+    
+    # Метрики (/web/metrics): потрібен заголовок Authorization: Bearer <token>.
+    # Без токена ендпоінт доступний лише при ENVIRONMENT=development
+    METRICS_TOKEN: Optional[str] = None
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -3,6 +3,11 @@ from app.models.user import User, UserRole, InviteLink
 from app.models.application import Application, ApplicationStatus
 from app.models.interview import Interview, InterviewType, InterviewSlot
 from app.models.feedback import Feedback
+from app.models.subscription import HRSubscription
+from app.models.rate_limit import RateLimitBucket
+from app.models.skill import Skill, ApplicationSkill
+from app.models.similarity import SimilarityTerm, ApplicationVector, ApplicationTerm
+from app.models import versioning  # noqa: F401 - реєструє before_flush для Application.version
 
 __all__ = [
     "User",
@@ -14,6 +19,13 @@ __all__ = [
     "InterviewType",
     "InterviewSlot",
     "Feedback",
+    "HRSubscription",
+    "RateLimitBucket",
+    "Skill",
+    "ApplicationSkill",
+    "SimilarityTerm",
+    "ApplicationVector",
+    "ApplicationTerm",
 ]
 
 
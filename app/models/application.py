@@ -1,5 +1,5 @@
 """Моделі заявок"""
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, ForeignKey, JSON
+from sqlalchemy import DDL, Column, Integer, String, Text, DateTime, Enum, ForeignKey, JSON, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -35,7 +35,7 @@ class Application(Base):
     __tablename__ = "applications"
     
     id = Column(Integer, primary_key=True, index=True)
-    candidate_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    candidate_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)  # Відбиток списку заявок кандидата
     hr_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     tech_interviewer_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     
@@ -44,6 +44,11 @@ class Application(Base):
     email = Column(String(255), nullable=False)
     phone = Column(String(50), nullable=True)
     
+    # Нормалізовані контакти (app.utils.contacts) для пошуку дублікатів
+    email_hash = Column(String(32), nullable=True, index=True)
+    phone_hash = Column(String(32), nullable=True, index=True)
+    duplicate_of_id = Column(Integer, ForeignKey("applications.id", ondelete="SET NULL"), nullable=True)  # Можливий дублікат заявки #N (перша в кластері)
+    
     # Резюме
     position = Column(String(255), nullable=False)  # Позиція, на яку подається
     experience_years = Column(Integer, nullable=True)
@@ -58,10 +63,13 @@ class Application(Base):
     status = Column(Enum(ApplicationStatus), default=ApplicationStatus.SCREENING_PENDING, index=True, nullable=False)
     rejection_reason = Column(Text, nullable=True)  # Причина відхилення
     
+    # Версія для ETag (збільшується при зміні заявки, її співбесід, слотів чи фідбеків)
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    
     # Дати
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     reviewed_at = Column(DateTime(timezone=True), nullable=True)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), index=True)  # Курсор дельта-синхронізації
     
     # Зв'язки
     candidate = relationship("User", foreign_keys=[candidate_id], back_populates="applications")
@@ -74,3 +82,50 @@ class Application(Base):
         return f"<Application {self.id} - {self.full_name} ({self.status})>"
 
 
+# Повнотекстовий пошук (лише PostgreSQL): генерована колонка tsvector, яку БД
+# перераховує при кожному INSERT/UPDATE, та GIN-індекс над нею.
+# Колонка не відображена в ORM, щоб звичайні запити її не вантажили.
+# Конфігурація 'simple' - без стемінгу (імена, email, назви технологій, змішані мови).
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(full_name, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(email, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(position, '')), 'B') || "
+    "setweight(jsonb_to_tsvector('simple', coalesce(skills::jsonb, '[]'::jsonb), '[\"string\"]'), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(previous_work, '')), 'C') || "
+    "setweight(to_tsvector('simple', coalesce(additional_info, '')), 'D')"
+)
+
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL(
+        f"ALTER TABLE applications ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR_SQL}) STORED"
+    ).execute_if(dialect="postgresql")
+)
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL(
+        "CREATE INDEX ix_applications_search_vector ON applications USING gin (search_vector)"
+    ).execute_if(dialect="postgresql")
+)
+
+# Автодоповнення кандидатів (лише PostgreSQL): GiST-індекс pg_trgm над ім'ям, email та телефоном.
+# GiST (а не GIN) - бо підтримує впорядкування за відстанню (KNN) і віддає топ-N без сортування всіх збігів.
+# Запити мають використовувати той самий вираз, інакше індекс не застосується.
+AUTOCOMPLETE_SQL = "(full_name || ' ' || email || ' ' || coalesce(phone, ''))"
+
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+event.listen(
+    Application.__table__,
+    "after_create",
+    DDL(
+        f"CREATE INDEX ix_applications_autocomplete_trgm ON applications "
+        f"USING gist ({AUTOCOMPLETE_SQL} gist_trgm_ops)"
+    ).execute_if(dialect="postgresql")
+)
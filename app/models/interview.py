@@ -37,7 +37,7 @@ class Interview(Base):
     __tablename__ = "interviews"
     
     id = Column(Integer, primary_key=True, index=True)
-    application_id = Column(Integer, ForeignKey("applications.id"), nullable=False)
+    application_id = Column(Integer, ForeignKey("applications.id"), nullable=False, index=True)  # Списки заявок перевіряють скринінг по кожній заявці
     candidate_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     interviewer_id = Column(Integer, ForeignKey("users.id"), nullable=False) # Generic interviewer (HR or Tech)
     
@@ -0,0 +1,14 @@
+"""Модель стану лімітера запитів (спільного для всіх процесів)"""
+from sqlalchemy import Column, String, Float
+from app.database import Base
+
+
+class RateLimitBucket(Base):
+    """Стан GCRA для одного ключа лімітера"""
+    __tablename__ = "rate_limit_buckets"
+    
+    key = Column(String(255), primary_key=True)  # "<назва лімітера>:<ключ>"
+    tat = Column(Float, nullable=False, index=True)  # Теоретичний час наступного запиту (unix time)
+    
+    def __repr__(self):
+        return f"<RateLimitBucket {self.key} tat={self.tat}>"
@@ -0,0 +1,49 @@
+"""Моделі векторів заявок для пошуку схожих кандидатів"""
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import backref, relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SimilarityTerm(Base):
+    """Словник термів (у векторах зберігається лише ціле id)"""
+    __tablename__ = "similarity_terms"
+
+    id = Column(Integer, primary_key=True)
+    term = Column(String(100), nullable=False, unique=True)  # "skill:python", "pos:backend", "work:fintech"
+
+    def __repr__(self):
+        return f"<SimilarityTerm {self.id} {self.term}>"
+
+
+class ApplicationVector(Base):
+    """Заголовок вектора заявки: коли його побудовано (для інкрементального оновлення)"""
+    __tablename__ = "application_vectors"
+
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    built_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    application = relationship(
+        "Application",
+        backref=backref("vector", uselist=False, cascade="all, delete-orphan", passive_deletes=True)
+    )
+
+    def __repr__(self):
+        return f"<ApplicationVector app={self.application_id} built_at={self.built_at}>"
+
+
+class ApplicationTerm(Base):
+    """Вага терма у векторі заявки (TF, нормований за L2) - розріджений вектор як інвертований індекс"""
+    __tablename__ = "application_terms"
+    __table_args__ = (
+        # Видалення та читання вектора однієї заявки
+        Index("ix_application_terms_application", "application_id"),
+    )
+
+    # PK (term_id, application_id) - posting list терма: пошук схожих читає лише терми запиту
+    term_id = Column(Integer, ForeignKey("similarity_terms.id"), primary_key=True)
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    weight = Column(Float, nullable=False)
+
+    def __repr__(self):
+        return f"<ApplicationTerm app={self.application_id} term={self.term_id} weight={self.weight}>"
@@ -0,0 +1,42 @@
+"""Моделі довідника навичок"""
+from sqlalchemy import Column, Integer, Float, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import backref, relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class Skill(Base):
+    """Навичка з довідника (одна на кожну нормалізовану назву)"""
+    __tablename__ = "skills"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String(100), nullable=False, unique=True)  # Нормалізована назва (для пошуку та фільтрів)
+    name = Column(String(100), nullable=False)  # Назва для відображення
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self):
+        return f"<Skill {self.id} {self.key}>"
+
+
+class ApplicationSkill(Base):
+    """Навичка кандидата в заявці (нормалізована копія Application.skills)"""
+    __tablename__ = "application_skills"
+    __table_args__ = (
+        # Фільтр "навичка X від N років": пошук за skill_id + years без звернення до таблиці
+        Index("ix_application_skills_skill_years", "skill_id", "years", "application_id"),
+    )
+
+    # PK (application_id, skill_id) - також індекс для EXISTS-перевірок по заявці
+    application_id = Column(Integer, ForeignKey("applications.id", ondelete="CASCADE"), primary_key=True)
+    skill_id = Column(Integer, ForeignKey("skills.id"), primary_key=True)
+    years = Column(Float, nullable=False, default=0)  # Досвід у роках
+
+    # Зв'язки
+    application = relationship(
+        "Application",
+        backref=backref("skill_links", cascade="all, delete-orphan", passive_deletes=True)
+    )
+    skill = relationship("Skill")
+
+    def __repr__(self):
+        return f"<ApplicationSkill app={self.application_id} skill={self.skill_id} years={self.years}>"
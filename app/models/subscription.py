@@ -0,0 +1,24 @@
+"""Модель підписок HR на позиції"""
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class HRSubscription(Base):
+    """Підписка HR менеджера на позицію (для маршрутизації сповіщень)"""
+    __tablename__ = "hr_subscriptions"
+    __table_args__ = (
+        UniqueConstraint("user_id", "position", name="uq_hr_subscriptions_user_position"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    position = Column(String(255), nullable=False, index=True)  # Нормалізована назва позиції
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # Зв'язки
+    user = relationship("User", backref="hr_subscriptions")
+    
+    def __repr__(self):
+        return f"<HRSubscription user={self.user_id} position={self.position}>"
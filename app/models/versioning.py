@@ -0,0 +1,42 @@
+"""Автоматичне збільшення версії заявки при зміні пов'язаних записів"""
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from app.models.application import Application
+from app.models.interview import Interview, InterviewSlot
+from app.models.feedback import Feedback
+
+
+def _owning_application(session: Session, obj) -> Optional[Application]:
+    """Заявка, до якої належить змінений об'єкт"""
+    if isinstance(obj, Application):
+        return obj
+    if isinstance(obj, InterviewSlot):
+        interview = obj.interview
+        if interview is None and obj.interview_id:
+            interview = session.get(Interview, obj.interview_id)
+        return _owning_application(session, interview) if interview is not None else None
+    if isinstance(obj, (Interview, Feedback)):
+        app = obj.application
+        if app is None and obj.application_id:
+            app = session.get(Application, obj.application_id)
+        return app
+    return None
+
+
+@event.listens_for(Session, "before_flush")
+def bump_application_versions(session: Session, flush_context, instances) -> None:
+    """Збільшити version у заявок, чиї дані змінюються в цьому flush"""
+    touched = {}
+    for obj in list(session.new) + list(session.dirty) + list(session.deleted):
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        app = _owning_application(session, obj)
+        # Нові заявки отримують version=1, видалені не потребують версії
+        if app is None or app in session.new or app in session.deleted:
+            continue
+        touched[id(app)] = app
+
+    for app in touched.values():
+        # SQL-вираз: інкремент атомарний навіть при паралельних транзакціях
+        app.version = Application.version + 1
@@ -1,10 +1,12 @@
 """Pydantic схеми для валідації даних"""
 from app.schemas.application import ApplicationCreate
 from app.schemas.interview import InterviewConfirm, InterviewSlotBase
+from app.schemas.analytics import AnalyticsDashboard
 
 __all__ = [
     "ApplicationCreate",
     "InterviewConfirm",
     "InterviewSlotBase",
+    "AnalyticsDashboard",
 ]
 
@@ -0,0 +1,76 @@
+"""Схеми відповідей аналітики"""
+from typing import Any, Dict, List
+from pydantic import BaseModel
+
+
+class OverviewStats(BaseModel):
+    """Загальна статистика заявок"""
+    total_applications: int
+    pending: int
+    accepted: int
+    rejected: int
+    interviews_scheduled: int
+    hired: int
+    cancelled: int
+    rejection_rate: float
+    acceptance_rate: float
+    hiring_rate: float
+    cancellation_rate: float
+
+
+class DailyCount(BaseModel):
+    date: str
+    count: int
+
+
+class PeriodStats(BaseModel):
+    period_days: int
+    applications_by_date: List[DailyCount]
+
+
+class Dynamics(BaseModel):
+    """Кількість заявок по днях за період"""
+    period: str
+    start_date: str
+    end_date: str
+    daily_data: List[DailyCount]
+
+
+class HRPerformanceItem(BaseModel):
+    hr_id: int
+    hr_name: str
+    role: str
+    reviewed: int
+    accepted: int
+    rejected: int
+    acceptance_rate: float
+    avg_review_time_hours: float
+
+
+class HRActivity(BaseModel):
+    total_hr_count: int
+    total_reviewed: int
+    total_accepted: int
+    total_rejected: int
+    overall_acceptance_rate: float
+    hr_details: List[HRPerformanceItem]
+
+
+class AnalyticsDashboard(BaseModel):
+    """Повна аналітика (дашборд аналітика)"""
+    overview: OverviewStats
+    by_period_30d: PeriodStats
+    by_period_7d: PeriodStats
+    by_status: Dict[str, int]
+    by_position: Dict[str, int]
+    interviews: Dict[str, Any]
+    hr_performance: List[HRPerformanceItem]
+    time_to_review: Dict[str, Any]
+    skills_distribution: Dict[str, int]
+    english_level: Dict[str, int]
+    conversion_metrics: Dict[str, Any]
+    experience_distribution: Dict[str, int]
+    weekly_dynamics: Dynamics
+    monthly_dynamics: Dynamics
+    hr_activity: HRActivity
+    rejection_reasons: Dict[str, int]
@@ -1,6 +1,10 @@
+from datetime import datetime
 from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Any
+from typing import Optional, List, Any, Dict, Union
+from app.models.application import ApplicationStatus
+from app.schemas.interview import ActiveInterview, HRInterviewItem
 from app.utils.security import sanitize_html
+from app.utils.skill_aliases import skill_canonicalizer
 
 class ApplicationCreate(BaseModel):
     """Schema for application creation"""
@@ -35,4 +39,219 @@ class ApplicationCreate(BaseModel):
                 exp = skill.get('exp', 0)
                 if exp < 0 or exp > 70:
                     raise ValueError(f"Experience for {skill.get('name', 'skill')} must be between 0 and 70 years")
+            # "py", "Python 3", "Python/Django" -> канонічні назви зі словника синонімів
+            v = skill_canonicalizer.canonicalize_skills(v)
         return v
+
+
+class FeedbackItem(BaseModel):
+    """Відгук інтерв'юера у деталях заявки"""
+    interviewer_name: str
+    score: int
+    pros: Optional[str] = None
+    cons: Optional[str] = None
+    summary: Optional[str] = None
+    created_at: Optional[datetime] = None
+
+
+class ScreeningInfo(BaseModel):
+    has_selected_time: bool
+
+
+class HRApplicationItem(BaseModel):
+    """Заявка у списку HR (великі текстові поля - лише в HRApplicationDetail)"""
+    id: int
+    candidate_name: str
+    email: str
+    phone: Optional[str] = None
+    position: str
+    experience_years: Optional[Union[int, float]] = None
+    skills: Optional[List[Any]] = None
+    english_level: Optional[str] = None
+    portfolio_url: Optional[str] = None
+    status: ApplicationStatus
+    created_at: Optional[datetime] = None
+    duplicate_of_id: Optional[int] = None  # Можливий дублікат заявки #N
+    screening_info: Optional[ScreeningInfo] = None
+
+
+class HRApplicationList(BaseModel):
+    counts: Dict[str, int]
+    applications: List[HRApplicationItem]
+    cursor: Optional[str] = None  # Передати як ?since= у наступному запиті
+    removed: List[int] = []  # Дельта: заявки, що змінились і більше не належать до вкладки
+
+
+class SearchHighlight(BaseModel):
+    """Фрагменти зі збігами, виділеними <mark>...</mark>"""
+    name: Optional[str] = None
+    position: Optional[str] = None
+    snippet: Optional[str] = None
+
+
+class ApplicationSearchItem(BaseModel):
+    id: int
+    candidate_name: str
+    email: str
+    position: str
+    status: ApplicationStatus
+    created_at: Optional[datetime] = None
+    rank: Optional[float] = None
+    highlight: SearchHighlight
+
+
+class ApplicationSearchResult(BaseModel):
+    items: List[ApplicationSearchItem]
+    next_cursor: Optional[str] = None  # Передати як ?cursor= для наступної сторінки
+
+
+class CandidateSuggestion(BaseModel):
+    application_id: int
+    candidate_id: int
+    candidate_name: str
+    email: str
+    phone: Optional[str] = None
+    position: str
+    score: Optional[float] = None  # word_similarity (0..1)
+
+
+class CandidateAutocomplete(BaseModel):
+    query: str  # Відповідь на застарілий запит можна відкинути, порівнявши query з полем вводу
+    items: List[CandidateSuggestion]
+
+
+class SimilarApplication(BaseModel):
+    id: int
+    candidate_id: int
+    candidate_name: str
+    position: str
+    status: ApplicationStatus
+    created_at: Optional[datetime] = None
+    score: float  # Косинусна близькість векторів (0..1)
+
+
+class SimilarApplications(BaseModel):
+    application_id: int
+    items: List[SimilarApplication]
+
+
+class HRApplicationDetail(BaseModel):
+    """Повні дані заявки для HR"""
+    id: int
+    candidate_name: str
+    email: str
+    phone: Optional[str] = None
+    position: str
+    experience_years: Optional[Union[int, float]] = None
+    skills: Optional[List[Any]] = None
+    english_level: Optional[str] = None
+    education: Optional[str] = None
+    previous_work: Optional[str] = None
+    portfolio_url: Optional[str] = None
+    additional_info: Optional[str] = None
+    status: ApplicationStatus
+    rejection_reason: Optional[str] = None
+    tech_interviewer_name: Optional[str] = None
+    created_at: Optional[datetime] = None
+    duplicate_of_id: Optional[int] = None  # Можливий дублікат заявки #N
+    feedbacks: List[FeedbackItem]
+    interviews: List[HRInterviewItem]
+
+
+class ApplicationStatusInfo(BaseModel):
+    id: int
+    status: ApplicationStatus
+
+
+class ApplicationStatusChange(BaseModel):
+    """Результат зміни статусу заявки"""
+    success: bool
+    message: str
+    application: ApplicationStatusInfo
+
+
+class CandidateApplicationItem(BaseModel):
+    """Заявка у кабінеті кандидата"""
+    id: int
+    position: str
+    status: ApplicationStatus
+    created_at: Optional[datetime] = None
+    rejection_reason: Optional[str] = None
+
+
+class CandidateApplicationList(BaseModel):
+    applications: List[CandidateApplicationItem]
+
+
+class CandidateCancelResult(BaseModel):
+    success: bool
+    message: str
+    application_id: int
+    new_status: ApplicationStatus
+
+
+class InterviewerApplicationItem(BaseModel):
+    """Заявка у кабінеті інтерв'юера"""
+    id: int
+    candidate_name: str
+    position: str
+    status: ApplicationStatus
+    experience_years: Optional[Union[int, float]] = None
+    skills: Optional[List[Any]] = None
+    english_level: Optional[str] = None
+    created_at: Optional[datetime] = None
+    tech_interviewer_id: Optional[int] = None
+
+
+class InterviewerDashboard(BaseModel):
+    my_candidates: List[InterviewerApplicationItem]
+    archive: List[InterviewerApplicationItem]
+    pool: List[InterviewerApplicationItem]
+    cursor: Optional[str] = None
+    removed: List[int] = []
+
+
+class InterviewerApplicationDetail(BaseModel):
+    """Повні дані заявки для інтерв'юера"""
+    id: int
+    candidate_name: str
+    email: str
+    phone: Optional[str] = None
+    position: str
+    experience_years: Optional[Union[int, float]] = None
+    skills: Optional[List[Any]] = None
+    english_level: Optional[str] = None
+    education: Optional[str] = None
+    previous_work: Optional[str] = None
+    portfolio_url: Optional[str] = None
+    additional_info: Optional[str] = None
+    status: ApplicationStatus
+    created_at: Optional[datetime] = None
+    tech_interviewer_id: Optional[int] = None
+    tech_interviewer_name: Optional[str] = None
+    feedbacks: List[FeedbackItem]
+    active_interview: Optional[ActiveInterview] = None
+
+
+class FeedbackScore(BaseModel):
+    score: int
+    pros: Optional[str] = None
+    cons: Optional[str] = None
+    summary: Optional[str] = None
+
+
+class InterviewerFeedback(BaseModel):
+    feedback: Optional[FeedbackScore] = None
+
+
+class PoolApplicationItem(BaseModel):
+    id: int
+    candidate_name: str
+    position: str
+    status: ApplicationStatus
+    created_at: Optional[datetime] = None
+    match_score: Optional[float] = None  # 0..1, лише для sort=match
+
+
+class PoolApplicationList(BaseModel):
+    applications: List[PoolApplicationItem]
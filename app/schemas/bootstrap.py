@@ -0,0 +1,39 @@
+"""Схеми стартового запиту WebApp (/web/bootstrap)"""
+from pydantic import BaseModel
+from typing import List, Optional
+from app.schemas.application import CandidateApplicationItem, HRApplicationList, InterviewerDashboard
+from app.schemas.interview import CandidateInterviewItem
+
+
+class UserProfile(BaseModel):
+    """Профіль поточного користувача (як у /web/me)"""
+    id: int
+    telegram_id: int
+    username: Optional[str] = None
+    first_name: Optional[str] = None
+    last_name: Optional[str] = None
+    role: str
+
+
+class SessionInfo(BaseModel):
+    """Токен сесії (як у /web/session)"""
+    token: str
+    token_type: str
+    expires_in: int
+    refresh_token: str
+    refresh_expires_in: int
+    role: str
+
+
+class CandidateDashboard(BaseModel):
+    applications: List[CandidateApplicationItem]
+    interviews: List[CandidateInterviewItem]
+
+
+class BootstrapResponse(BaseModel):
+    """Профіль + перша сторінка дашборду ролі одним запитом"""
+    profile: UserProfile
+    session: Optional[SessionInfo] = None  # Лише якщо запит автентифіковано через initData
+    hr: Optional[HRApplicationList] = None
+    interviewer: Optional[InterviewerDashboard] = None
+    candidate: Optional[CandidateDashboard] = None
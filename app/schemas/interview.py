@@ -1,6 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel
+from app.models.interview import InterviewType, LocationType
 
 
 class InterviewSlotBase(BaseModel):
@@ -17,3 +18,51 @@ class InterviewConfirm(BaseModel):
     """Підтвердження вибору часу інтерв'ю кандидатом"""
     interview_id: int
     slot_id: int  # Using slot_id instead of raw date
+
+
+class SlotItem(BaseModel):
+    """Слот інтерв'ю у відповідях API"""
+    id: int
+    start_time: datetime
+    end_time: datetime
+    is_booked: Optional[bool] = None
+
+
+class HRInterviewItem(BaseModel):
+    """Інтерв'ю у деталях заявки для HR"""
+    id: int
+    type: InterviewType
+    location: Optional[LocationType] = None
+    slots: List[SlotItem]
+    selected_time: Optional[datetime] = None
+    confirmed: Optional[bool] = None
+    link: Optional[str] = None
+    address: Optional[str] = None
+
+
+class CandidateInterviewItem(BaseModel):
+    """Інтерв'ю у кабінеті кандидата"""
+    id: int
+    application_id: int
+    interview_type: InterviewType
+    location_type: Optional[LocationType] = None
+    meet_link: Optional[str] = None
+    address: Optional[str] = None
+    slots: List[SlotItem]
+    selected_time: Optional[datetime] = None
+    is_confirmed: Optional[bool] = None
+    notes: Optional[str] = None
+
+
+class CandidateInterviewList(BaseModel):
+    interviews: List[CandidateInterviewItem]
+
+
+class ActiveInterview(BaseModel):
+    """Поточне технічне інтерв'ю заявки"""
+    id: int
+    selected_time: Optional[datetime] = None
+    is_confirmed: Optional[bool] = None
+    location_type: Optional[LocationType] = None
+    link: Optional[str] = None
+    address: Optional[str] = None
@@ -5,6 +5,8 @@ from app.services.interview_service import InterviewService
 from app.services.analytics_service import AnalyticsService
 from app.services.interviewer_service import InterviewerService
 from app.services.notification_service import NotificationService
+from app.services.subscription_service import SubscriptionService
+from app.services.broadcast_service import BroadcastService
 from app.services.base_service import BaseService
 
 __all__ = [
@@ -14,5 +16,7 @@ __all__ = [
     "InterviewerService",
     "AnalyticsService",
     "NotificationService",
+    "SubscriptionService",
+    "BroadcastService",
     "BaseService",
 ]
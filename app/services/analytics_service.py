@@ -3,6 +3,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func, extract
 from app.models.application import Application, ApplicationStatus
 from app.models.interview import Interview, InterviewType
+from app.models.skill import ApplicationSkill, Skill
 from app.models.user import User, UserRole
 from typing import Dict, Any, List
 from datetime import datetime, timedelta
@@ -93,7 +94,7 @@ class AnalyticsService:
             func.count(Application.id).label('count')
         ).group_by(Application.status).all()
         
-        return {status: count for status, count in statuses}
+        return {status.value: count for status, count in statuses}
     
     @staticmethod
     def get_applications_by_position(db: Session) -> Dict[str, int]:
@@ -176,24 +177,14 @@ class AnalyticsService:
     
     @staticmethod
     def get_skills_distribution(db: Session) -> Dict[str, int]:
-        """Розподіл кандидатів за технологіями (з навичок)"""
-        applications = db.query(Application).filter(
-            Application.skills.isnot(None)
-        ).all()
-        
-        all_skills = []
-        for app in applications:
-            if app.skills and isinstance(app.skills, list):
-                for skill_obj in app.skills:
-                    if isinstance(skill_obj, dict) and "name" in skill_obj:
-                        all_skills.append(skill_obj["name"].lower().strip())
-                    elif isinstance(skill_obj, str):
-                        all_skills.append(skill_obj.lower().strip())
-        
-        # Підрахунок популярних технологій
-        skill_counter = Counter(all_skills)
+        """Розподіл кандидатів за технологіями (з довідника навичок)"""
+        # Синоніми вже зведені до канонічної навички - "py" та "Python 3" рахуються як Python
+        count = func.count(ApplicationSkill.application_id)
+        rows = db.query(Skill.name, count).join(
+            ApplicationSkill, ApplicationSkill.skill_id == Skill.id
+        ).group_by(Skill.id, Skill.name).order_by(count.desc(), Skill.name).limit(20).all()
         # Повертаємо топ-20 найпопулярніших
-        return dict(skill_counter.most_common(20))
+        return {name: total for name, total in rows}
     
     @staticmethod
     def get_english_level_distribution(db: Session) -> Dict[str, int]:
@@ -1,11 +1,21 @@
 """Сервіс для роботи з заявками"""
-from sqlalchemy.orm import Session
+from sqlalchemy import case, func, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Query, Session
 from app.models.application import Application, ApplicationStatus
+from app.models.interview import Interview, InterviewType
 from app.services.base_service import BaseService
+from app.utils.contacts import email_hash, phone_hash
 from app.utils.exceptions import ApplicationNotFoundError
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from datetime import datetime, timezone
 
+# Чи обрав кандидат час HR-скринінгу: корельований підзапит замість завантаження всіх співбесід
+SCREENING_SELECTED = select(Interview.selected_time.isnot(None)).where(
+    Interview.application_id == Application.id,
+    Interview.interview_type == InterviewType.HR_SCREENING
+).order_by(Interview.id).limit(1).correlate(Application).scalar_subquery()
+
 
 class ApplicationService(BaseService[Application]):
     """Сервіс для управління заявками"""
@@ -37,6 +47,55 @@ class ApplicationService(BaseService[Application]):
         ]
     }
 
+    # Колонки карток у списках - без великих Text-полів (education, previous_work, additional_info)
+    HR_LIST_COLUMNS = (
+        Application.id,
+        Application.full_name,
+        Application.email,
+        Application.phone,
+        Application.position,
+        Application.experience_years,
+        Application.skills,
+        Application.english_level,
+        Application.portfolio_url,
+        Application.status,
+        Application.created_at,
+        Application.duplicate_of_id
+    )
+    INTERVIEWER_LIST_COLUMNS = (
+        Application.id,
+        Application.full_name,
+        Application.position,
+        Application.status,
+        Application.experience_years,
+        Application.skills,
+        Application.english_level,
+        Application.created_at,
+        Application.tech_interviewer_id
+    )
+    POOL_LIST_COLUMNS = (
+        Application.id,
+        Application.full_name,
+        Application.position,
+        Application.status,
+        Application.created_at
+    )
+
+    @staticmethod
+    def find_duplicate_of(db: Session, email_key: Optional[str], phone_key: Optional[str]) -> Optional[int]:
+        """ID першої заявки з тим самим email чи телефоном (корінь кластера дублікатів) або None"""
+        conditions = []
+        if email_key:
+            conditions.append(Application.email_hash == email_key)
+        if phone_key:
+            conditions.append(Application.phone_hash == phone_key)
+        if not conditions:
+            return None
+        # Два пошуки за індексами хешів; заявка, що вже є дублікатом, веде до свого кореня
+        return db.query(
+            func.min(func.coalesce(Application.duplicate_of_id, Application.id))
+        ).filter(or_(*conditions)).scalar()
+
     @staticmethod
     def create_application(
         db: Session,
@@ -44,11 +103,16 @@ class ApplicationService(BaseService[Application]):
         data: Dict[str, Any]
     ) -> Application:
         """Створити нову заявку"""
+        email_key = email_hash(data.get("email"))
+        phone_key = phone_hash(data.get("phone"))
         application = Application(
             candidate_id=candidate_id,
             full_name=data.get("full_name"),
             email=data.get("email"),
             phone=data.get("phone"),
+            email_hash=email_key,
+            phone_hash=phone_key,
+            duplicate_of_id=ApplicationService.find_duplicate_of(db, email_key, phone_key),
             position=data.get("position"),
             experience_years=data.get("experience_years"),
             skills=data.get("skills", []),
@@ -60,6 +124,14 @@ class ApplicationService(BaseService[Application]):
             status=ApplicationStatus.SCREENING_PENDING
         )
         db.add(application)
+        db.flush()
+        
+        # Нормалізовані навички та вектор схожості - в тій самій транзакції, що й заявка
+        from app.services.similarity_service import SimilarityService
+        from app.services.skill_service import SkillService
+        SkillService.sync_application_skills(db, application)
+        SimilarityService.index_application(db, application)
+        
         db.commit()
         db.refresh(application)
         return application
@@ -76,6 +148,37 @@ class ApplicationService(BaseService[Application]):
             Application.candidate_id == candidate_id
         ).order_by(Application.created_at.desc()).all()
     
+    @staticmethod
+    def get_version(db: Session, application_id: int) -> Optional[int]:
+        """Поточна версія заявки (None, якщо заявки немає)"""
+        return db.query(Application.version).filter(Application.id == application_id).scalar()
+    
+    @staticmethod
+    def get_collection_version(db: Session, candidate_id: Optional[int] = None) -> Tuple[Optional[datetime], int]:
+        """
+        Відбиток набору заявок: max(updated_at) та max(id), обидва за індексами.
+        Будь-яка зміна заявки (зокрема збільшення version) оновлює updated_at, нова - max(id);
+        заявки не видаляються.
+        """
+        query = db.query(
+            func.max(Application.updated_at),
+            func.coalesce(func.max(Application.id), 0)
+        )
+        if candidate_id is not None:
+            query = query.filter(Application.candidate_id == candidate_id)
+        updated_at, max_id = query.one()
+        return updated_at, int(max_id)
+    
+    @staticmethod
+    def get_sync_cursor(db: Session) -> Optional[datetime]:
+        """Час останньої зміни серед усіх заявок (курсор для ?since=)"""
+        return db.query(func.max(Application.updated_at)).scalar()
+    
+    @staticmethod
+    def get_changed_ids(db: Session, updated_since: datetime) -> List[int]:
+        """ID заявок, змінених після updated_since (за індексом updated_at)"""
+        return [row[0] for row in db.query(Application.id).filter(Application.updated_at > updated_since)]
+    
     @staticmethod
     def get_pending_applications(db: Session) -> List[Application]:
         """Отримати заявки, що очікують розгляду"""
@@ -90,10 +193,55 @@ class ApplicationService(BaseService[Application]):
         db: Session, 
         status: Optional[str] = None,
         hr_id: Optional[int] = None,
-        interviewer_id: Optional[int] = None
+        interviewer_id: Optional[int] = None,
+        updated_since: Optional[datetime] = None,
+        skill_filter=None
     ) -> List[Application]:
-        """Отримати всі заявки з фільтрами по статусу та власнику"""
-        query = db.query(Application)
+        """Отримати всі заявки з фільтрами по статусу та власнику (або лише змінені після updated_since)"""
+        query = ApplicationService._filter_applications(
+            db.query(Application), status, hr_id, interviewer_id, updated_since, skill_filter
+        )
+        return query.order_by(Application.created_at.desc()).all()
+
+    @staticmethod
+    def get_application_rows(
+        db: Session,
+        columns: Tuple[Any, ...],
+        status: Optional[str] = None,
+        hr_id: Optional[int] = None,
+        interviewer_id: Optional[int] = None,
+        updated_since: Optional[datetime] = None,
+        skill_filter=None,
+        with_screening: bool = False
+    ) -> List[Row]:
+        """
+        Те саме, що get_all_applications, але лише вибрані колонки (для списків).
+        Повертає легкі Row без ORM-об'єктів; with_screening додає screening_selected
+        (None - немає HR-скринінгу, інакше чи обрано час) тим самим запитом.
+        """
+        entities = list(columns)
+        if with_screening:
+            entities.append(SCREENING_SELECTED.label("screening_selected"))
+        query = ApplicationService._filter_applications(
+            db.query(*entities), status, hr_id, interviewer_id, updated_since, skill_filter
+        )
+        return query.order_by(Application.created_at.desc()).all()
+
+    @staticmethod
+    def _filter_applications(
+        query: Query,
+        status: Optional[str],
+        hr_id: Optional[int],
+        interviewer_id: Optional[int],
+        updated_since: Optional[datetime],
+        skill_filter
+    ) -> Query:
+        """Фільтри по статусу та власнику для запиту по applications"""
+        if skill_filter is not None:
+            # Умова з SkillService.build_filter
+            query = query.filter(skill_filter)
+        if updated_since is not None:
+            query = query.filter(Application.updated_at > updated_since)
         
         # Ownership filter
         if hr_id:
@@ -135,7 +283,7 @@ class ApplicationService(BaseService[Application]):
                 except ValueError:
                     pass
                 
-        return query.order_by(Application.created_at.desc()).all()
+        return query
                 
     @staticmethod
     def get_status_counts(
@@ -144,19 +292,25 @@ class ApplicationService(BaseService[Application]):
         interviewer_id: Optional[int] = None
     ) -> Dict[str, int]:
         """Отримати кількість заявок для кожної групи статусів з урахуванням власності"""
-        from sqlalchemy import func
-        
         # Base query for counts
         query = db.query(Application.status, func.count(Application.status))
         
         # Apply ownership filtering for counts as well
+        owned_map: Dict[Any, int] = {}
         if hr_id:
-            # For HR: counts for owned apps + total pending (which they can claim)
-            # Actually, standard tabs in HR dashboard should probably show TOTAL pending 
-            # and OWNED for others.
-            pass # We will handle filtering inside the loop for specific groups
+            # For HR: counts for owned apps + total pending (which they can claim).
+            # One grouped query by (status, owner) instead of a query per tab.
+            owner = case(
+                (Application.hr_id == None, "none"),
+                (Application.hr_id == hr_id, "mine"),
+                else_="other"
+            )
+            for status, owner_key, count in db.query(
+                Application.status, owner, func.count(Application.id)
+            ).group_by(Application.status, owner):
+                owned_map[(status, owner_key)] = count
             
-        results = query.group_by(Application.status).all()
+        results = query.group_by(Application.status).all() if not hr_id else []
         status_map = {r[0]: r[1] for r in results}
         
         # More precise counts if filtered
@@ -165,22 +319,16 @@ class ApplicationService(BaseService[Application]):
             if hr_id:
                 if group_name == "pending":
                     # Inbox: NOT owned, SCREENING_PENDING
-                    count = db.query(func.count(Application.id)).filter(
-                        Application.status == ApplicationStatus.SCREENING_PENDING,
-                        Application.hr_id == None
-                    ).scalar()
+                    count = owned_map.get((ApplicationStatus.SCREENING_PENDING, "none"), 0)
                 elif group_name == "interviews":
                     # My invitations: Owned, SCREENING_PENDING or TECH_PENDING
-                    count = db.query(func.count(Application.id)).filter(
-                        Application.status.in_([ApplicationStatus.SCREENING_PENDING, ApplicationStatus.TECH_PENDING]),
-                        Application.hr_id == hr_id
-                    ).scalar()
+                    count = sum(
+                        owned_map.get((s, "mine"), 0)
+                        for s in (ApplicationStatus.SCREENING_PENDING, ApplicationStatus.TECH_PENDING)
+                    )
                 else:
                     # Regular tabs (processing, planned, archive) show only OWNED
-                    count = db.query(func.count(Application.id)).filter(
-                        Application.status.in_(statuses),
-                        Application.hr_id == hr_id
-                    ).scalar()
+                    count = sum(owned_map.get((s, "mine"), 0) for s in statuses)
             elif interviewer_id and group_name == "tech":
                  # Interviewer counts their OWN tech apps
                  count = db.query(func.count(Application.id)).filter(
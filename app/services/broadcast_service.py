@@ -0,0 +1,194 @@
+"""Сервіс масових розсилок кандидатам"""
+import asyncio
+import secrets
+from collections import OrderedDict
+from datetime import datetime, timezone
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import Any, Dict, List, Optional
+from app.config import settings
+from app.database import SessionLocal
+from app.models.application import Application, ApplicationStatus
+from app.models.user import User
+from app.services.notification_dispatcher import notification_dispatcher, spawn
+from app.utils.exceptions import BusinessError
+
+
+class BroadcastJob:
+    """Стан однієї розсилки"""
+
+    def __init__(self, position: str, message: str, statuses: List[ApplicationStatus], created_by: int):
+        self.id = secrets.token_hex(8)
+        self.position = position
+        self.message = message
+        self.statuses = statuses
+        self.created_by = created_by
+        self.status = "pending"  # pending -> running -> completed / cancelled / failed
+        self.error: Optional[str] = None
+        self.total = 0
+        self.enqueued = 0
+        self.sent = 0
+        self.failed = 0
+        self.skipped = 0
+        self.cancel_requested = False
+        self.created_at = datetime.now(timezone.utc)
+        self.finished_at: Optional[datetime] = None
+
+    def on_delivered(self, ok: Optional[bool]) -> None:
+        # None - повідомлення відкинуто після скасування (рахується лише як пропущене)
+        if ok is None:
+            self.skipped += 1
+        elif ok:
+            self.sent += 1
+        else:
+            self.failed += 1
+
+    def is_cancelled(self) -> bool:
+        return self.cancel_requested
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "position": self.position,
+            "statuses": [s.value for s in self.statuses],
+            "status": self.status,
+            "error": self.error,
+            "total": self.total,
+            "enqueued": self.enqueued,
+            "sent": self.sent,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "progress": round(((self.sent + self.failed + self.skipped) / self.total * 100) if self.total > 0 else 0, 2),
+            "created_at": self.created_at.isoformat(),
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None
+        }
+
+
+# Останні розсилки (найстаріші витісняються)
+_jobs: "OrderedDict[str, BroadcastJob]" = OrderedDict()
+
+
+class BroadcastService:
+    """Сервіс для розсилок кандидатам певної позиції"""
+
+    @staticmethod
+    def recipients_query(position: str, statuses: List[ApplicationStatus]):
+        """Запит Telegram ID кандидатів, що подавалися на позицію"""
+        query = select(User.telegram_id).join(
+            Application, Application.candidate_id == User.id
+        ).where(
+            func.lower(func.trim(Application.position)) == position.strip().lower()
+        )
+        if statuses:
+            query = query.where(Application.status.in_(statuses))
+        return query.distinct()
+
+    @staticmethod
+    def start_broadcast(
+        db: Session,
+        position: str,
+        message: str,
+        created_by: int,
+        statuses: Optional[List[str]] = None
+    ) -> BroadcastJob:
+        """Створити розсилку та запустити її у фоні"""
+        if not notification_dispatcher.running:
+            raise BusinessError("Notification dispatcher is not running")
+
+        try:
+            status_enums = [ApplicationStatus(s) for s in (statuses or [])]
+        except ValueError:
+            raise BusinessError("Invalid application status")
+
+        job = BroadcastJob(position, message, status_enums, created_by)
+        job.total = db.execute(
+            select(func.count()).select_from(
+                BroadcastService.recipients_query(position, status_enums).subquery()
+            )
+        ).scalar() or 0
+
+        _jobs[job.id] = job
+        while len(_jobs) > settings.BROADCAST_MAX_JOBS:
+            _jobs.popitem(last=False)
+
+        spawn(BroadcastService._run(job))
+        return job
+
+    @staticmethod
+    def _fetch_recipients(job: BroadcastJob, after: Optional[int]) -> List[int]:
+        """Сторінка Telegram ID після `after` (keyset) у короткій власній сесії"""
+        query = BroadcastService.recipients_query(job.position, job.statuses)
+        if after is not None:
+            query = query.where(User.telegram_id > after)
+        db = SessionLocal()
+        try:
+            return list(db.execute(
+                query.order_by(User.telegram_id).limit(settings.BROADCAST_BATCH_SIZE)
+            ).scalars())
+        finally:
+            db.close()
+
+    @staticmethod
+    async def _run(job: BroadcastJob) -> None:
+        """Читати отримувачів сторінками та ставити в чергу"""
+        job.status = "running"
+        try:
+            last_id: Optional[int] = None
+            while not job.cancel_requested:
+                # Запит у пулі потоків, з'єднання повертається до того, як чекаємо на чергу:
+                # розсилка на десятки хвилин не тримає транзакцію та знімок бази
+                page = await run_in_threadpool(BroadcastService._fetch_recipients, job, last_id)
+                if not page:
+                    break
+                for telegram_id in page:
+                    if job.cancel_requested:
+                        break
+                    # Чекає, поки в черзі звільниться місце - пам'ять не росте з кількістю отримувачів
+                    await notification_dispatcher.enqueue(
+                        telegram_id,
+                        job.message,
+                        parse_mode=None,
+                        on_done=job.on_delivered,
+                        is_cancelled=job.is_cancelled,
+                        event="broadcast"
+                    )
+                    job.enqueued += 1
+                last_id = page[-1]
+                if len(page) < settings.BROADCAST_BATCH_SIZE:
+                    break
+            
+            # Розсилка завершена, коли черга обробила все поставлене
+            # (зупинена черга завершує залишок через on_done(False))
+            while job.sent + job.failed + job.skipped < job.enqueued:
+                await asyncio.sleep(0.5)
+            job.status = "cancelled" if job.cancel_requested else "completed"
+        except asyncio.CancelledError:
+            # notification_dispatcher.stop() при завершенні застосунку
+            job.status = "failed"
+            job.error = "Stopped during shutdown"
+            raise
+        except Exception as e:
+            print(f"Broadcast {job.id} failed: {e}")
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished_at = datetime.now(timezone.utc)
+
+    @staticmethod
+    def get_job(job_id: str) -> Optional[BroadcastJob]:
+        """Отримати розсилку за ID"""
+        return _jobs.get(job_id)
+
+    @staticmethod
+    def list_jobs() -> List[BroadcastJob]:
+        """Отримати останні розсилки (нові першими)"""
+        return list(reversed(_jobs.values()))
+
+    @staticmethod
+    def cancel(job_id: str) -> Optional[BroadcastJob]:
+        """Скасувати розсилку (вже поставлені в чергу повідомлення теж не відправляться)"""
+        job = _jobs.get(job_id)
+        if job and job.status in ("pending", "running"):
+            job.cancel_requested = True
+        return job
@@ -1,5 +1,5 @@
 """Сервіс для роботи з співбесідами"""
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from datetime import datetime
 from typing import List, Dict, Optional, Any
 from app.models.interview import Interview, InterviewType, LocationType, InterviewSlot
@@ -142,7 +142,7 @@ class InterviewService(BaseService[Interview]):
     def get_candidate_interviews(db: Session, candidate_id: int) -> List[Interview]:
         """Отримати співбесіди кандидата"""
         # Filter where selected_time is set or confirmed?
-        return db.query(Interview).filter(
+        return db.query(Interview).options(selectinload(Interview.slots)).filter(
             Interview.candidate_id == candidate_id
         ).order_by(Interview.id.desc()).all()
     
@@ -0,0 +1,115 @@
+"""Ранжування заявок пулу за відповідністю профілю позиції"""
+from sqlalchemy import Row, case, func, literal, null
+from sqlalchemy.orm import Query, Session
+from typing import Dict, List, Optional, Tuple
+from app.config import settings
+from app.models.application import Application
+from app.models.skill import ApplicationSkill, Skill
+from app.utils.exceptions import BusinessError
+
+ENGLISH_LEVELS = {"A1": 1, "A2": 2, "B1": 3, "B2": 4, "C1": 5, "C2": 6}
+
+
+def parse_english_level(value: Optional[str]) -> Optional[int]:
+    """"B2" -> 4; None, якщо рівень не задано"""
+    if not value or not value.strip():
+        return None
+    level = ENGLISH_LEVELS.get(value.strip().upper())
+    if level is None:
+        raise BusinessError(f"Invalid English level (expected one of {', '.join(ENGLISH_LEVELS)})")
+    return level
+
+
+def _ratio(value, required: float):
+    """Частка вимоги, яку покриває значення: 0..1"""
+    return case((value >= required, 1.0), else_=value / required)
+
+
+class MatchService:
+    """Оцінка кандидатів пулу проти профілю позиції (навички з досвідом, англійська, досвід)"""
+
+    @staticmethod
+    def match_score(
+        db: Session,
+        skills: List[Tuple[str, float]],
+        english_level: Optional[int] = None,
+        experience_years: Optional[float] = None
+    ):
+        """
+        SQL-вираз оцінки 0..1 та підзапит оцінки навичок (для outerjoin), або (None, None) для порожнього профілю.
+        Навички беруться з application_skills (skill_id, years) - одна агрегація на весь пул,
+        без завантаження заявок у Python.
+        """
+        parts: List[Tuple[float, object]] = []
+        skill_scores = None
+
+        if skills:
+            required: Dict[str, float] = {}
+            for key, years in skills:
+                required[key] = max(required.get(key, 0.0), years)
+            skill_ids = dict(db.query(Skill.key, Skill.id).filter(Skill.key.in_(list(required))).all())
+            # Навички, яких немає в довіднику, ніхто не має - вони лише знижують частку покриття
+            known = {skill_ids[key]: years for key, years in required.items() if key in skill_ids}
+            if known:
+                per_skill = case(
+                    *[
+                        (ApplicationSkill.skill_id == skill_id, _ratio(ApplicationSkill.years, years) if years > 0 else 1.0)
+                        for skill_id, years in known.items()
+                    ],
+                    else_=0.0
+                )
+                skill_scores = db.query(
+                    ApplicationSkill.application_id.label("application_id"),
+                    (func.sum(per_skill) / len(required)).label("score")
+                ).filter(
+                    ApplicationSkill.skill_id.in_(list(known))
+                ).group_by(ApplicationSkill.application_id).subquery()
+                parts.append((settings.MATCH_WEIGHT_SKILLS, func.coalesce(skill_scores.c.score, 0.0)))
+            else:
+                parts.append((settings.MATCH_WEIGHT_SKILLS, literal(0.0)))
+
+        if english_level:
+            rank = case(
+                *[(func.upper(func.trim(Application.english_level)) == name, value) for name, value in ENGLISH_LEVELS.items()],
+                else_=0
+            )
+            parts.append((settings.MATCH_WEIGHT_ENGLISH, _ratio(rank, float(english_level))))
+
+        if experience_years:
+            experience = func.coalesce(Application.experience_years, 0)
+            parts.append((settings.MATCH_WEIGHT_EXPERIENCE, _ratio(experience, float(experience_years))))
+
+        total_weight = sum(weight for weight, _ in parts)
+        if not parts or total_weight <= 0:
+            return None, None
+        # Ваги незаданих критеріїв перерозподіляються між заданими
+        score = sum(expression * (weight / total_weight) for weight, expression in parts)
+        return score, skill_scores
+
+    @staticmethod
+    def rank(
+        db: Session,
+        query: Query,
+        skills: List[Tuple[str, float]],
+        english_level: Optional[int] = None,
+        experience_years: Optional[float] = None,
+        limit: Optional[int] = None
+    ) -> List[Row]:
+        """
+        Рядки запиту (зазвичай лише колонки картки) з колонкою match_score, найкращі першими
+        (при рівній оцінці - раніші). Для порожнього профілю match_score = None і порядок за датою.
+        """
+        score, skill_scores = MatchService.match_score(db, skills, english_level, experience_years)
+        if score is None:
+            ranked = query.add_columns(null().label("match_score")).order_by(
+                Application.created_at.asc(), Application.id.asc()
+            )
+        else:
+            score = score.label("match_score")
+            ranked = query.add_columns(score)
+            if skill_scores is not None:
+                ranked = ranked.outerjoin(skill_scores, skill_scores.c.application_id == Application.id)
+            ranked = ranked.order_by(score.desc(), Application.created_at.asc(), Application.id.asc())
+        if limit:
+            ranked = ranked.limit(limit)
+        return ranked.all()
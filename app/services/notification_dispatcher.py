@@ -0,0 +1,298 @@
+"""Черга вихідних повідомлень з обмеженням швидкості відправки"""
+import asyncio
+import time
+from typing import Callable, Coroutine, Dict, Optional, Set
+
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter
+
+from app.config import settings
+from app.utils.metrics import (
+    NOTIFICATIONS_DROPPED,
+    NOTIFICATIONS_ENQUEUED,
+    NOTIFICATIONS_FAILED,
+    NOTIFICATIONS_SENT,
+    NOTIFICATION_QUEUE_DEPTH,
+    NOTIFICATION_QUEUE_LATENCY,
+    NOTIFICATION_RETRIES,
+    NOTIFICATION_SEND_DURATION
+)
+
+# True - відправлено, False - не доставлено, None - пропущено (розсилку скасовано)
+DoneCallback = Callable[[Optional[bool]], None]
+CancelCheck = Callable[[], bool]
+
+# Класи пріоритету (смуги черги)
+PRIORITY_CRITICAL = "critical"  # Результати та запрошення для кандидатів
+PRIORITY_NORMAL = "normal"  # Робочі сповіщення персоналу
+PRIORITY_BULK = "bulk"  # Розсилки та дайджести
+PRIORITIES = (PRIORITY_CRITICAL, PRIORITY_NORMAL, PRIORITY_BULK)
+
+# Цикл подій тримає лише слабкі посилання на задачі - без цього набору
+# відправка чи розсилка може бути зібрана GC посеред роботи
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def spawn(coro: Coroutine) -> asyncio.Task:
+    """Запустити фонову задачу, що живе до завершення (або до stop())"""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
+
+
+class OutboundMessage:
+    """Повідомлення в черзі на відправку"""
+    __slots__ = ("telegram_id", "text", "parse_mode", "event", "on_done", "is_cancelled", "attempts", "enqueued_at")
+
+    def __init__(
+        self,
+        telegram_id: int,
+        text: str,
+        parse_mode: Optional[str],
+        event: str,
+        on_done: Optional[DoneCallback],
+        is_cancelled: Optional[CancelCheck]
+    ):
+        self.telegram_id = telegram_id
+        self.text = text
+        self.parse_mode = parse_mode
+        self.event = event
+        self.on_done = on_done
+        self.is_cancelled = is_cancelled
+        self.attempts = 0
+        self.enqueued_at = time.monotonic()
+
+
+class NotificationDispatcher:
+    """
+    Відправляє повідомлення через бота не швидше за заданий ліміт.
+
+    Кожен клас пріоритету має власну обмежену чергу: `enqueue` чекає на
+    вільне місце (зворотний тиск для масових розсилок), `submit` - ні.
+    Черги обслуговуються зваженим циклічним вибором, тож повідомлення
+    кандидатам не чекають, поки розбереться розсилка, а нижчі смуги не голодують.
+    Після RetryAfter від Telegram призупиняється вся відправка.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        max_queue: int,
+        max_in_flight: int,
+        max_retries: int,
+        weights: Optional[Dict[str, int]] = None
+    ):
+        self.rate_per_second = rate_per_second
+        self.max_queue = max_queue
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.weights = {p: 1 for p in PRIORITIES}
+        self.weights.update(weights or {})
+        self._bot = None
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._pending: Optional[asyncio.Semaphore] = None
+        self._credits = {p: 0 for p in PRIORITIES}
+        self._worker: Optional[asyncio.Task] = None
+        self._in_flight: Optional[asyncio.Semaphore] = None
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None and not self._worker.done()
+
+    def start(self, bot) -> None:
+        """Запустити обробку черги"""
+        self._bot = bot
+        self._queues = {p: asyncio.Queue(maxsize=self.max_queue) for p in PRIORITIES}
+        self._pending = asyncio.Semaphore(0)
+        self._credits = {p: 0 for p in PRIORITIES}
+        self._in_flight = asyncio.Semaphore(self.max_in_flight)
+        self._worker = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Зупинити обробку черги, відправки та розсилки (скасовуються)"""
+        if self._worker:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+        self._worker = None
+        
+        tasks = list(_background_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        self._drop_queued()
+
+    def _drop_queued(self) -> None:
+        """Повідомлення, що залишились у черзі без обробника: завершити з on_done(False)"""
+        for queue in self._queues.values():
+            while not queue.empty():
+                item = queue.get_nowait()
+                queue.task_done()
+                NOTIFICATIONS_DROPPED.inc(event=item.event, reason="shutdown")
+                self._finish(item, False)
+
+    def qsize(self, priority: Optional[str] = None) -> int:
+        if priority:
+            queue = self._queues.get(priority)
+            return queue.qsize() if queue else 0
+        return sum(queue.qsize() for queue in self._queues.values())
+
+    def submit(
+        self,
+        telegram_id: int,
+        text: str,
+        parse_mode: Optional[str] = "Markdown",
+        on_done: Optional[DoneCallback] = None,
+        event: str = "other",
+        priority: str = PRIORITY_NORMAL
+    ) -> bool:
+        """Додати повідомлення без очікування. False якщо черга переповнена"""
+        try:
+            self._queues[priority].put_nowait(OutboundMessage(telegram_id, text, parse_mode, event, on_done, None))
+        except asyncio.QueueFull:
+            NOTIFICATIONS_DROPPED.inc(event=event, reason="queue_full")
+            return False
+        self._pending.release()
+        NOTIFICATIONS_ENQUEUED.inc(event=event)
+        return True
+
+    async def enqueue(
+        self,
+        telegram_id: int,
+        text: str,
+        parse_mode: Optional[str] = "Markdown",
+        on_done: Optional[DoneCallback] = None,
+        is_cancelled: Optional[CancelCheck] = None,
+        event: str = "other",
+        priority: str = PRIORITY_BULK
+    ) -> None:
+        """Додати повідомлення, чекаючи на вільне місце в черзі (RuntimeError, якщо черга зупинена)"""
+        if not self.running:
+            raise RuntimeError("Notification dispatcher is not running")
+        await self._queues[priority].put(OutboundMessage(telegram_id, text, parse_mode, event, on_done, is_cancelled))
+        if not self.running:
+            # Черга зупинилась, поки чекали на місце - повідомлення ніхто не обробить
+            self._drop_queued()
+            raise RuntimeError("Notification dispatcher is not running")
+        self._pending.release()
+        NOTIFICATIONS_ENQUEUED.inc(event=event)
+
+    def _next_priority(self) -> str:
+        """Згладжений зважений циклічний вибір серед непорожніх черг"""
+        ready = [p for p in PRIORITIES if not self._queues[p].empty()]
+        total = 0
+        for p in ready:
+            self._credits[p] += self.weights[p]
+            total += self.weights[p]
+        chosen = max(ready, key=lambda p: self._credits[p])
+        self._credits[chosen] -= total
+        return chosen
+
+    async def _wait_for_slot(self) -> None:
+        """Дочекатися наступного дозволеного моменту відправки"""
+        now = time.monotonic()
+        slot = max(now, self._next_slot, self._paused_until)
+        self._next_slot = slot + 1.0 / self.rate_per_second
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    async def _run(self) -> None:
+        while True:
+            await self._pending.acquire()
+            queue = self._queues[self._next_priority()]
+            item = queue.get_nowait()
+            try:
+                if item.is_cancelled and item.is_cancelled():
+                    NOTIFICATIONS_DROPPED.inc(event=item.event, reason="cancelled")
+                    self._finish(item, None)
+                    continue
+                await self._in_flight.acquire()
+                try:
+                    await self._wait_for_slot()
+                except asyncio.CancelledError:
+                    self._in_flight.release()
+                    raise
+                spawn(self._deliver(item))
+            except asyncio.CancelledError:
+                # stop(), поки повідомлення вже взяте з черги, але ще не відправляється
+                NOTIFICATIONS_DROPPED.inc(event=item.event, reason="shutdown")
+                self._finish(item, False)
+                raise
+            finally:
+                queue.task_done()
+
+    async def _deliver(self, item: OutboundMessage) -> None:
+        try:
+            while True:
+                item.attempts += 1
+                started = time.monotonic()
+                try:
+                    await self._bot.send_message(item.telegram_id, item.text, parse_mode=item.parse_mode)
+                    finished = time.monotonic()
+                    NOTIFICATION_SEND_DURATION.observe(finished - started, event=item.event)
+                    NOTIFICATION_QUEUE_LATENCY.observe(finished - item.enqueued_at, event=item.event)
+                    NOTIFICATIONS_SENT.inc(event=item.event)
+                    self._finish(item, True)
+                    return
+                except RetryAfter as e:
+                    # Flood control діє на весь бот - пригальмовуємо всю чергу
+                    self._paused_until = time.monotonic() + float(e.retry_after)
+                    delay = float(e.retry_after)
+                    error = e
+                except (BadRequest, Forbidden) as e:
+                    # Повтор не допоможе (бот заблоковано, невірний chat_id тощо)
+                    print(f"Error sending notification to {item.telegram_id}: {e}")
+                    NOTIFICATIONS_FAILED.inc(event=item.event, error=type(e).__name__)
+                    self._finish(item, False)
+                    return
+                except NetworkError as e:
+                    delay = min(2 ** item.attempts, 30)
+                    error = e
+                    print(f"Network error sending notification to {item.telegram_id}: {e}")
+                NOTIFICATION_SEND_DURATION.observe(time.monotonic() - started, event=item.event)
+
+                if item.attempts > self.max_retries:
+                    NOTIFICATIONS_FAILED.inc(event=item.event, error=type(error).__name__)
+                    self._finish(item, False)
+                    return
+                NOTIFICATION_RETRIES.inc(event=item.event, error=type(error).__name__)
+                await asyncio.sleep(delay)
+                await self._wait_for_slot()
+        except asyncio.CancelledError:
+            # stop() під час відправки
+            NOTIFICATIONS_DROPPED.inc(event=item.event, reason="shutdown")
+            self._finish(item, False)
+            raise
+        except Exception as e:
+            print(f"Error sending notification to {item.telegram_id}: {e}")
+            NOTIFICATIONS_FAILED.inc(event=item.event, error=type(e).__name__)
+            self._finish(item, False)
+        finally:
+            self._in_flight.release()
+
+    @staticmethod
+    def _finish(item: OutboundMessage, ok: Optional[bool]) -> None:
+        if item.on_done:
+            try:
+                item.on_done(ok)
+            except Exception as e:
+                print(f"Error in notification callback: {e}")
+
+
+notification_dispatcher = NotificationDispatcher(
+    rate_per_second=settings.NOTIFY_RATE_PER_SECOND,
+    max_queue=settings.NOTIFY_QUEUE_SIZE,
+    max_in_flight=settings.NOTIFY_MAX_IN_FLIGHT,
+    max_retries=settings.NOTIFY_MAX_RETRIES,
+    weights={
+        PRIORITY_CRITICAL: settings.NOTIFY_WEIGHT_CRITICAL,
+        PRIORITY_NORMAL: settings.NOTIFY_WEIGHT_NORMAL,
+        PRIORITY_BULK: settings.NOTIFY_WEIGHT_BULK
+    }
+)
+NOTIFICATION_QUEUE_DEPTH.set_function(notification_dispatcher.qsize)
@@ -1,15 +1,38 @@
 """Сервіс для відправки повідомлень через бота"""
 import asyncio
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Optional, Any
 from fastapi import Request
 
 
 class NotificationService:
     """Сервіс для централізованої відправки повідомлень"""
     
+    # Пріоритет відправки за типом події (решта - звичайний)
+    EVENT_PRIORITIES = {
+        "application_accepted": "critical",
+        "application_rejected": "critical",
+        "slots_available": "critical",
+        "interview_confirmed": "critical",
+        "candidate_result": "critical",
+        "hr_new_application_digest": "bulk",
+    }
+    
+    @staticmethod
+    def idempotency_key(event: str, entity_id: int, telegram_id: int, version: Any = None) -> str:
+        """Детермінований ключ сповіщення: подія + сутність + отримувач + версія"""
+        return f"{event}:{entity_id}:{telegram_id}:{version if version is not None else ''}"
+    
     @staticmethod
-    async def send_message(request: Request, telegram_id: int, message: str) -> bool:
+    async def send_message(
+        request: Request,
+        telegram_id: int,
+        message: str,
+        event: Optional[str] = None,
+        entity_id: Optional[int] = None,
+        version: Any = None,
+        priority: Optional[str] = None
+    ) -> bool:
         """
         Відправити повідомлення користувачу через Telegram бота
         
@@ -17,24 +40,70 @@ class NotificationService:
             request: FastAPI Request для доступу до bot_app
             telegram_id: Telegram ID користувача
             message: Текст повідомлення
+            event: Тип події (разом з entity_id вмикає захист від дублікатів)
+            entity_id: ID сутності, якої стосується подія
+            version: Версія стану сутності (напр. статус або час)
+            priority: Клас пріоритету черги (за замовчуванням - за типом події)
             
         Returns:
-            True якщо повідомлення відправлено успішно
+            True якщо повідомлення відправлено (або вже було відправлено раніше)
         """
+        from app.utils.idempotency import notification_keys
+        from app.utils.metrics import NOTIFICATIONS_DROPPED, NOTIFICATIONS_SENT, NOTIFICATIONS_FAILED
+        from app.services.notification_dispatcher import notification_dispatcher, spawn
+        
+        event_label = event or "other"
+        key = None
+        if event and entity_id is not None:
+            key = NotificationService.idempotency_key(event, entity_id, telegram_id, version)
+            if not notification_keys.claim(key):
+                # Дублікат (повторний клік, повтор запиту) - не турбуємо користувача вдруге
+                NOTIFICATIONS_DROPPED.inc(event=event_label, reason="duplicate")
+                return True
+        
+        def on_done(ok: Optional[bool]) -> None:
+            # Невдалу відправку можна буде повторити з тим самим ключем
+            if not ok and key:
+                notification_keys.release(key)
+        
+        # Основний шлях - через чергу з обмеженням швидкості та повторами
+        if notification_dispatcher.running:
+            priority = priority or NotificationService.EVENT_PRIORITIES.get(event_label, "normal")
+            if notification_dispatcher.submit(
+                telegram_id, message, on_done=on_done, event=event_label, priority=priority
+            ):
+                return True
+            print(f"Notification queue is full, dropping message to {telegram_id}")
+            on_done(False)
+            return False
+        
+        async def deliver(bot) -> bool:
+            try:
+                await bot.send_message(telegram_id, message, parse_mode="Markdown")
+                NOTIFICATIONS_SENT.inc(event=event_label)
+                return True
+            except Exception as e:
+                NOTIFICATIONS_FAILED.inc(event=event_label, error=type(e).__name__)
+                on_done(False)
+                print(f"Error sending notification: {e}")
+                return False
+        
         try:
             if not hasattr(request.app.state, 'bot_app') or not request.app.state.bot_app:
+                on_done(False)
                 return False
                 
             bot = request.app.state.bot_app.bot
             
             loop = asyncio.get_event_loop()
             if loop.is_running():
-                asyncio.create_task(bot.send_message(telegram_id, message, parse_mode="Markdown"))
+                spawn(deliver(bot))
             else:
-                await bot.send_message(telegram_id, message, parse_mode="Markdown")
+                return await deliver(bot)
             
             return True
         except Exception as e:
+            on_done(False)
             print(f"Error sending notification: {e}")
             return False
     
@@ -42,7 +111,8 @@ class NotificationService:
     async def notify_application_accepted(
         request: Request, 
         telegram_id: int, 
-        position: str
+        position: str,
+        application_id: Optional[int] = None
     ) -> bool:
         """Повідомлення про прийняття заявки"""
         message = (
@@ -50,14 +120,17 @@ class NotificationService:
             "Наші HR менеджери вже вивчають ваші дані. Найближчим часом ви отримаєте повідомлення про наступні кроки або пропозицію обрати час для співбесіди.\n\n"
             "Дякуємо за інтерес до нашої компанії! 🙌"
         )
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "application_accepted", application_id
+        )
     
     @staticmethod
     async def notify_application_rejected(
         request: Request, 
         telegram_id: int, 
         position: str, 
-        reason: str
+        reason: str,
+        application_id: Optional[int] = None
     ) -> bool:
         """Повідомлення про відхилення заявки"""
         message = (
@@ -65,7 +138,9 @@ class NotificationService:
             f"**Причина:** {reason}\n\n"
             "Дякуємо за ваш час та бажаємо успіхів у пошуку нових можливостей! 🌱"
         )
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "application_rejected", application_id
+        )
     
     @staticmethod
     async def notify_interview_scheduled(
@@ -95,7 +170,8 @@ class NotificationService:
         interview_type: str,
         slots: list,
         location_type: str = "online",
-        details: Optional[dict] = None
+        details: Optional[dict] = None,
+        interview_id: Optional[int] = None
     ) -> bool:
         """Повідомлення про доступні слоти для вибору"""
         type_name = "HR скрінінг" if interview_type == "hr_screening" else "Технічне інтерв'ю"
@@ -139,7 +215,9 @@ class NotificationService:
             f"**Доступні варіанти:**\n{slots_text}\n"
             "Будь ласка, перейдіть у застосунок та оберіть зручний для вас слот. 🕒"
         )
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "slots_available", interview_id
+        )
     
     @staticmethod
     async def notify_interview_confirmed(
@@ -149,7 +227,8 @@ class NotificationService:
         interview_type: str,
         datetime_str: str,
         location_type: str,
-        details: dict
+        details: dict,
+        interview_id: Optional[int] = None
     ) -> bool:
         """Повідомлення про підтверджене собесідування з деталями"""
         type_name = "HR скрінінг" if interview_type == "hr_screening" else "Технічне інтерв'ю"
@@ -172,36 +251,67 @@ class NotificationService:
             f"{location_info}\n\n"
             "Ми будемо раді поспілкуватися з вами! Бажаємо успіху! 🍀"
         )
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "interview_confirmed", interview_id, datetime_str
+        )
 
     @staticmethod
     async def notify_hr_new_application(
         request: Request,
         db: Session,
         candidate_name: str,
-        position: str
+        position: str,
+        application_id: Optional[int] = None
     ) -> None:
-        """Повідомити всіх HR про нову заявку"""
-        from app.services.user_service import UserService
-        from app.models.user import UserRole
+        """Повідомити HR, що ведуть цю позицію, про нову заявку"""
+        from app.services.subscription_service import SubscriptionService
+        from app.utils.coalescer import hr_digest_coalescer
         
-        hrs = UserService.get_users_by_role(db, UserRole.HR)
+        hr_telegram_ids = SubscriptionService.get_hr_recipients(db, position)
         message = (
             f"🆕 **Нова заявка!**\n\n"
             f"👤 **Кандидат:** {candidate_name}\n"
             f"💼 **Позиція:** {position}\n\n"
             "Перегляньте деталі в HR панелі. 🔎"
         )
-        for hr in hrs:
-            if hr.telegram_id:
-                await NotificationService.send_message(request, hr.telegram_id, message)
+        digest_item = f"👤 {candidate_name} — 💼 {position}"
+        
+        def make_flush(telegram_id: int):
+            async def flush(items: list):
+                digest = NotificationService.format_new_applications_digest(
+                    items, hr_digest_coalescer.window_seconds
+                )
+                await NotificationService.send_message(request, telegram_id, digest, "hr_new_application_digest")
+            return flush
+        
+        for telegram_id in hr_telegram_ids:
+            # При високій частоті заявок HR отримує один дайджест замість потоку повідомлень
+            if hr_digest_coalescer.offer(telegram_id, digest_item, make_flush(telegram_id)):
+                await NotificationService.send_message(
+                    request, telegram_id, message, "hr_new_application", application_id
+                )
+
+    @staticmethod
+    def format_new_applications_digest(items: list, window_seconds: int) -> str:
+        """Сформувати дайджест нових заявок"""
+        minutes = max(1, round(window_seconds / 60))
+        shown = items[:10]
+        lines = "\n".join(f"• {item}" for item in shown)
+        if len(items) > len(shown):
+            lines += f"\n... та ще {len(items) - len(shown)}"
+        return (
+            f"📦 **{len(items)} нових заявок за останні {minutes} хв:**\n\n"
+            f"{lines}\n\n"
+            "Перегляньте деталі в HR панелі. 🔎"
+        )
 
     @staticmethod
     async def notify_interviewer_assigned(
         request: Request,
         telegram_id: int,
         candidate_name: str,
-        position: str
+        position: str,
+        application_id: Optional[int] = None
     ) -> bool:
         """Повідомити інтерв'юера про призначення на заявку"""
         message = (
@@ -210,7 +320,9 @@ class NotificationService:
             f"💼 **Позиція:** {position}\n\n"
             "Будь ласка, перегляньте деталі та запропонуйте слоти для зустрічі в панелі інтерв'юера. 📅"
         )
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "interviewer_assigned", application_id
+        )
 
     @staticmethod
     async def notify_staff_slot_selected(
@@ -219,7 +331,8 @@ class NotificationService:
         candidate_name: str,
         position: str,
         datetime_str: str,
-        interview_type: str
+        interview_type: str,
+        interview_id: Optional[int] = None
     ) -> bool:
         """Повідомити HR/Інтерв'юера про те, що кандидат обрав час"""
         type_name = "HR скрінінг" if interview_type == "hr_screening" else "Технічне інтерв'ю"
@@ -230,20 +343,22 @@ class NotificationService:
             f"⏰ **Обраний час:** {datetime_str}\n\n"
             "Будь ласка, перейдіть у систему, щоб підтвердити зустріч та надіслати деталі. ✅"
         )
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "staff_slot_selected", interview_id, datetime_str
+        )
     @staticmethod
     async def notify_hr_application_claimed(
         request: Request,
         db: Session,
         hr_name: str,
         candidate_name: str,
-        position: str
+        position: str,
+        application_id: Optional[int] = None
     ) -> None:
-        """Повідомити всіх HR про те, що колега взяв заявку в роботу"""
-        from app.services.user_service import UserService
-        from app.models.user import UserRole
+        """Повідомити HR, що ведуть цю позицію, про те, що колега взяв заявку в роботу"""
+        from app.services.subscription_service import SubscriptionService
         
-        hrs = UserService.get_users_by_role(db, UserRole.HR)
+        hr_telegram_ids = SubscriptionService.get_hr_recipients(db, position)
         message = (
             f"🤝 **Заявку взято в роботу!**\n\n"
             f"👤 **HR:** {hr_name}\n"
@@ -251,9 +366,10 @@ class NotificationService:
             f"💼 **Позиція:** {position}\n\n"
             "Заявка тепер закріплена за цим менеджером. ✅"
         )
-        for hr in hrs:
-            if hr.telegram_id:
-                await NotificationService.send_message(request, hr.telegram_id, message)
+        for telegram_id in hr_telegram_ids:
+            await NotificationService.send_message(
+                request, telegram_id, message, "hr_application_claimed", application_id
+            )
 
     @staticmethod
     async def notify_interviewer_claimed(
@@ -261,7 +377,8 @@ class NotificationService:
         db: Session,
         interviewer_name: str,
         candidate_name: str,
-        position: str
+        position: str,
+        application_id: Optional[int] = None
     ) -> None:
         """Повідомити всіх тех. спеціалістів про те, що колега взяв заявку з пулу"""
         from app.services.user_service import UserService
@@ -277,7 +394,9 @@ class NotificationService:
         )
         for interviewer in interviewers:
             if interviewer.telegram_id:
-                await NotificationService.send_message(request, interviewer.telegram_id, message)
+                await NotificationService.send_message(
+                    request, interviewer.telegram_id, message, "interviewer_claimed", application_id
+                )
 
     @staticmethod
     async def notify_hr_feedback_submitted(
@@ -290,17 +409,15 @@ class NotificationService:
         score: int
     ) -> None:
         """Повідомити HR про те, що тех. спеціаліст залишив фідбек"""
-        from app.services.user_service import UserService
-        from app.models.user import UserRole
+        from app.services.subscription_service import SubscriptionService
         from app.models.application import Application
         
         app = db.query(Application).get(application_id)
-        hrs_to_notify = []
         
         if app and app.hr and app.hr.telegram_id:
-            hrs_to_notify = [app.hr]
+            hr_telegram_ids = [app.hr.telegram_id]
         else:
-            hrs_to_notify = UserService.get_users_by_role(db, UserRole.HR)
+            hr_telegram_ids = SubscriptionService.get_hr_recipients(db, position)
             
         score_icon = "🟢" if score >= 8 else "🟡" if score >= 5 else "🔴"
         
@@ -313,9 +430,10 @@ class NotificationService:
             "Перегляньте деталі та прийміть фінальне рішення в HR панелі. ⚖️"
         )
         
-        for hr in hrs_to_notify:
-            if hr.telegram_id:
-                await NotificationService.send_message(request, hr.telegram_id, message)
+        for telegram_id in hr_telegram_ids:
+            await NotificationService.send_message(
+                request, telegram_id, message, "hr_feedback_submitted", application_id, score
+            )
 
     @staticmethod
     async def notify_candidate_result(
@@ -323,7 +441,8 @@ class NotificationService:
         telegram_id: int,
         position: str,
         result: str,
-        reason: Optional[str] = None
+        reason: Optional[str] = None,
+        application_id: Optional[int] = None
     ) -> bool:
         """Повідомлення кандидата про фінальний результат (Hire/Reject)"""
         if result == "hired":
@@ -342,4 +461,6 @@ class NotificationService:
                 "Бажаємо успіхів у професійному розвитку!"
             )
         
-        return await NotificationService.send_message(request, telegram_id, message)
+        return await NotificationService.send_message(
+            request, telegram_id, message, "candidate_result", application_id, result
+        )
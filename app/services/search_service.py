@@ -0,0 +1,237 @@
+"""Сервіс пошуку заявок"""
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+from sqlalchemy import REAL, and_, cast, func, literal, literal_column, or_, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.models.application import AUTOCOMPLETE_SQL, Application, ApplicationStatus
+from app.services.application_service import ApplicationService
+from app.utils.exceptions import BusinessError
+
+# Колонка та конфігурація з app.models.application (колонка не відображена в ORM)
+SEARCH_VECTOR = literal_column("applications.search_vector")
+TS_CONFIG = literal_column("'simple'::regconfig")
+AUTOCOMPLETE_TEXT = literal_column(AUTOCOMPLETE_SQL)
+
+# Виділення збігів у ts_headline
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxWords=30, MinWords=10, MaxFragments=2, FragmentDelimiter=\" … \""
+FIELD_HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, HighlightAll=true"
+
+SORT_RANK = "rank"
+SORT_RECENT = "recent"
+
+
+def encode_search_cursor(rank: Optional[float], application_id: int) -> str:
+    """Курсор keyset-пагінації: (rank, id) останнього рядка сторінки"""
+    raw = json.dumps([rank, application_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_search_cursor(cursor: str) -> Tuple[Optional[float], int]:
+    """Розібрати курсор (BusinessError, якщо він пошкоджений)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        rank, application_id = json.loads(raw)
+        return (float(rank) if rank is not None else None), int(application_id)
+    except (ValueError, TypeError):
+        raise BusinessError("Invalid search cursor")
+
+
+class SearchService:
+    """Повнотекстовий пошук заявок для HR"""
+
+    @staticmethod
+    def status_filter(status: Optional[str]):
+        """Умова за групою статусів (як у вкладках) або окремим статусом"""
+        if not status or status == "all":
+            return None
+        if status in ApplicationService.STATUS_GROUPS:
+            return Application.status.in_(ApplicationService.STATUS_GROUPS[status])
+        try:
+            return Application.status == ApplicationStatus(status)
+        except ValueError:
+            raise BusinessError("Invalid status")
+
+    @staticmethod
+    def search_applications(
+        db: Session,
+        query: str,
+        limit: int = 20,
+        cursor: Optional[str] = None,
+        status: Optional[str] = None,
+        sort: str = SORT_RANK
+    ) -> Dict[str, Any]:
+        """
+        Пошук по імені, email, позиції, навичках, досвіду та додатковій інформації.
+        Повертає сторінку результатів і курсор наступної сторінки.
+        """
+        if sort not in (SORT_RANK, SORT_RECENT):
+            raise BusinessError("Invalid sort")
+        after = decode_search_cursor(cursor) if cursor else None
+
+        if db.get_bind().dialect.name == "postgresql":
+            rows = SearchService._search_fulltext(db, query, limit + 1, after, status, sort)
+        else:
+            rows = SearchService._search_like(db, query, limit + 1, after, status)
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_search_cursor(last["rank"] if sort == SORT_RANK else None, last["application"].id)
+        return {"items": rows, "next_cursor": next_cursor}
+
+    @staticmethod
+    def _search_fulltext(
+        db: Session,
+        query: str,
+        limit: int,
+        after: Optional[Tuple[Optional[float], int]],
+        status: Optional[str],
+        sort: str
+    ) -> List[Dict[str, Any]]:
+        """tsvector @@ websearch_to_tsquery по GIN-індексу, ранжування ts_rank"""
+        tsquery = func.websearch_to_tsquery(TS_CONFIG, query)
+        rank = func.ts_rank(SEARCH_VECTOR, tsquery)
+
+        # Крок 1: лише id та rank сторінки - дешево, без читання великих текстових полів
+        page = db.query(Application.id.label("id"), rank.label("rank")).filter(
+            SEARCH_VECTOR.op("@@")(tsquery)
+        )
+        condition = SearchService.status_filter(status)
+        if condition is not None:
+            page = page.filter(condition)
+
+        if sort == SORT_RANK:
+            if after is not None:
+                # ts_rank повертає real - порівнюємо в тій самій точності
+                after_rank = cast(after[0] or 0.0, REAL)
+                page = page.filter(or_(
+                    rank < after_rank,
+                    and_(rank == after_rank, Application.id < after[1])
+                ))
+            page = page.order_by(rank.desc(), Application.id.desc())
+        else:
+            if after is not None:
+                page = page.filter(Application.id < after[1])
+            page = page.order_by(Application.id.desc())
+        page = page.limit(limit).subquery()
+
+        # Крок 2: ts_headline лише для рядків сторінки
+        snippet_source = func.concat_ws(" … ", Application.previous_work, Application.additional_info)
+        rows = db.query(
+            Application,
+            page.c.rank,
+            func.ts_headline(TS_CONFIG, Application.full_name, tsquery, FIELD_HEADLINE_OPTIONS),
+            func.ts_headline(TS_CONFIG, Application.position, tsquery, FIELD_HEADLINE_OPTIONS),
+            func.ts_headline(TS_CONFIG, snippet_source, tsquery, HEADLINE_OPTIONS)
+        ).join(page, page.c.id == Application.id)
+        if sort == SORT_RANK:
+            rows = rows.order_by(page.c.rank.desc(), Application.id.desc())
+        else:
+            rows = rows.order_by(Application.id.desc())
+
+        return [
+            {
+                "application": app,
+                "rank": float(app_rank),
+                "highlight": {"name": name, "position": position, "snippet": snippet or None}
+            }
+            for app, app_rank, name, position, snippet in rows
+        ]
+
+    @staticmethod
+    def _search_like(
+        db: Session,
+        query: str,
+        limit: int,
+        after: Optional[Tuple[Optional[float], int]],
+        status: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        """Запасний варіант для інших СУБД (локальна розробка на SQLite): ILIKE, нові першими"""
+        pattern = f"%{query.strip()}%"
+        rows = db.query(Application).filter(or_(
+            Application.full_name.ilike(pattern),
+            Application.email.ilike(pattern),
+            Application.position.ilike(pattern),
+            Application.previous_work.ilike(pattern),
+            Application.additional_info.ilike(pattern)
+        ))
+        condition = SearchService.status_filter(status)
+        if condition is not None:
+            rows = rows.filter(condition)
+        if after is not None:
+            rows = rows.filter(Application.id < after[1])
+        rows = rows.order_by(Application.id.desc()).limit(limit)
+        return [{"application": app, "rank": None, "highlight": {}} for app in rows]
+
+    @staticmethod
+    def autocomplete_candidates(db: Session, query: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Топ кандидатів за частиною імені, email чи телефону (з одруківками).
+        Один рядок на кандидата - заявка з найкращим збігом.
+        """
+        limit = limit or settings.AUTOCOMPLETE_LIMIT
+        query = query.strip()
+        # Той самий кандидат може мати кілька заявок - беремо з запасом і відкидаємо повтори
+        fetch = limit * 3
+        columns = (
+            Application.id,
+            Application.candidate_id,
+            Application.full_name,
+            Application.email,
+            Application.phone,
+            Application.position
+        )
+
+        if db.get_bind().dialect.name == "postgresql":
+            try:
+                # Параметри діють лише до кінця транзакції
+                db.execute(select(
+                    func.set_config("pg_trgm.word_similarity_threshold", str(settings.AUTOCOMPLETE_MIN_SIMILARITY), True),
+                    func.set_config("statement_timeout", str(settings.AUTOCOMPLETE_TIMEOUT_MS), True)
+                ))
+                # <% фільтрує за GiST-індексом, <<-> віддає найближчі першими (KNN) без сортування всіх збігів
+                rows = db.query(
+                    *columns,
+                    func.word_similarity(query, AUTOCOMPLETE_TEXT)
+                ).filter(
+                    literal(query).op("<%")(AUTOCOMPLETE_TEXT)
+                ).order_by(
+                    literal(query).op("<<->")(AUTOCOMPLETE_TEXT)
+                ).limit(fetch).all()
+            except OperationalError as e:
+                # Перевищено statement_timeout - краще порожня підказка, ніж зависле поле вводу
+                print(f"Autocomplete query failed: {e}")
+                rows = []
+            finally:
+                # Скидаємо таймаут та поріг, щоб вони не вплинули на інші запити цієї сесії
+                db.rollback()
+        else:
+            pattern = f"%{query}%"
+            rows = db.query(*columns, literal(None)).filter(or_(
+                Application.full_name.ilike(pattern),
+                Application.email.ilike(pattern),
+                Application.phone.ilike(pattern)
+            )).order_by(Application.id.desc()).limit(fetch).all()
+
+        results = []
+        seen = set()
+        for application_id, candidate_id, full_name, email, phone, position, score in rows:
+            if candidate_id in seen:
+                continue
+            seen.add(candidate_id)
+            results.append({
+                "application_id": application_id,
+                "candidate_id": candidate_id,
+                "candidate_name": full_name,
+                "email": email,
+                "phone": phone,
+                "position": position,
+                "score": float(score) if score is not None else None
+            })
+            if len(results) >= limit:
+                break
+        return results
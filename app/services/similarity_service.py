@@ -0,0 +1,231 @@
+"""Сервіс пошуку схожих кандидатів (TF-IDF вектори заявок)"""
+import math
+import re
+import time
+from collections import Counter
+from datetime import datetime
+from sqlalchemy import bindparam, case, delete, func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from app.config import settings
+from app.models.application import Application
+from app.models.similarity import ApplicationTerm, ApplicationVector, SimilarityTerm
+from app.services.skill_service import extract_skills
+
+WORD = re.compile(r"[^\W\d_][\w+#]*")
+STOP_WORDS = {
+    "the", "and", "for", "with", "from", "that", "this", "was", "were", "have", "has", "are", "our",
+    "years", "year", "work", "worked", "working", "company", "team", "project", "projects",
+    "для", "та", "або", "що", "як", "при", "про", "над", "під", "від", "було", "роки", "років", "рік",
+    "роботи", "робота", "працював", "працювала", "компанія", "компанії", "команді", "проєкт", "проект"
+}
+
+# Внесок полів у вектор: навички важать більше, ніж слова з опису досвіду
+SKILL_WEIGHT = 2.0
+POSITION_WEIGHT = 1.5
+WORK_WEIGHT = 1.0
+
+# (application_id, skills, position, previous_work, updated_at заявки або None)
+VectorSource = Tuple[int, Any, Optional[str], Optional[str], Optional[datetime]]
+
+vectors_table = ApplicationVector.__table__
+INSERT_VECTOR = vectors_table.insert().values(
+    application_id=bindparam("b_application_id"),
+    # Час версії заявки, з якої побудовано вектор (None - поточна транзакція)
+    built_at=func.coalesce(bindparam("b_built_at"), func.now())
+)
+
+
+class CorpusSize:
+    """
+    Кеш кількості проіндексованих заявок (N для IDF).
+    Повний count по application_vectors виконується не частіше за раз на TTL -
+    для IDF достатньо приблизного значення.
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._value = 0
+        self._counted_at: Optional[float] = None
+
+    def get(self, db: Session) -> int:
+        if self._counted_at is None or time.monotonic() - self._counted_at >= self.ttl_seconds:
+            self._value = db.query(func.count(ApplicationVector.application_id)).scalar() or 0
+            self._counted_at = time.monotonic()
+        return self._value
+
+
+corpus_size = CorpusSize(ttl_seconds=settings.SIMILAR_CORPUS_TTL_SECONDS)
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Слова тексту в нижньому регістрі без коротких та службових"""
+    return [
+        word for word in WORD.findall((text or "").lower())
+        if len(word) >= 3 and word not in STOP_WORDS
+    ]
+
+
+def build_vector(skills: Any, position: Optional[str], previous_work: Optional[str]) -> Dict[str, float]:
+    """Розріджений вектор заявки: терм -> вага (TF з вагою поля, нормований за L2)"""
+    weights: Dict[str, float] = {}
+    for key, (_, years) in extract_skills(skills).items():
+        weights[f"skill:{key}"[:100]] = SKILL_WEIGHT * (1 + math.log1p(years) / 2)
+    for prefix, text, field_weight in (("pos", position, POSITION_WEIGHT), ("work", previous_work, WORK_WEIGHT)):
+        for word, count in Counter(tokenize(text)).items():
+            term = f"{prefix}:{word}"[:100]
+            # Сублінійний TF: десяте повторення слова важить менше за перше
+            weights[term] = weights.get(term, 0.0) + field_weight * (1 + math.log(count))
+
+    # Компактність: лише найвагоміші терми
+    top = sorted(weights.items(), key=lambda item: item[1], reverse=True)[:settings.SIMILAR_MAX_TERMS]
+    norm = math.sqrt(sum(weight * weight for _, weight in top))
+    if not norm:
+        return {}
+    return {term: weight / norm for term, weight in top}
+
+
+class SimilarityService:
+    """Векторизація заявок та пошук найближчих сусідів"""
+
+    @staticmethod
+    def get_or_create_terms(db: Session, terms: List[str]) -> Dict[str, int]:
+        """ID термів; відсутні додаються в словник"""
+        if not terms:
+            return {}
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            db.execute(
+                insert(SimilarityTerm).values([{"term": term} for term in terms])
+                .on_conflict_do_nothing(index_elements=[SimilarityTerm.term])
+            )
+        else:
+            existing = {term for (term,) in db.query(SimilarityTerm.term).filter(SimilarityTerm.term.in_(terms))}
+            db.add_all(SimilarityTerm(term=term) for term in terms if term not in existing)
+            db.flush()
+        return dict(db.query(SimilarityTerm.term, SimilarityTerm.id).filter(SimilarityTerm.term.in_(terms)).all())
+
+    @staticmethod
+    def index_application(db: Session, application: Application) -> None:
+        """Перебудувати вектор заявки (без commit)"""
+        db.flush()
+        SimilarityService.index_applications(
+            db, [(application.id, application.skills, application.position, application.previous_work, None)]
+        )
+
+    @staticmethod
+    def index_applications(db: Session, rows: List[VectorSource]) -> int:
+        """
+        Перебудувати вектори пакета заявок. Кількість запитів не залежить від розміру пакета.
+        Повертає кількість записаних термів.
+        """
+        if not rows:
+            return 0
+        vectors = {row[0]: build_vector(row[1], row[2], row[3]) for row in rows}
+        terms = sorted({term for vector in vectors.values() for term in vector})
+        term_ids = SimilarityService.get_or_create_terms(db, terms)
+
+        ids = list(vectors)
+        db.execute(delete(ApplicationTerm).where(ApplicationTerm.application_id.in_(ids)))
+        db.execute(delete(ApplicationVector).where(ApplicationVector.application_id.in_(ids)))
+        db.execute(INSERT_VECTOR, [{"b_application_id": row[0], "b_built_at": row[4]} for row in rows])
+        postings = [
+            {"term_id": term_ids[term], "application_id": application_id, "weight": weight}
+            for application_id, vector in vectors.items()
+            for term, weight in vector.items()
+        ]
+        if postings:
+            db.execute(ApplicationTerm.__table__.insert(), postings)
+        return len(postings)
+
+    @staticmethod
+    def query_vector(db: Session, application: Application) -> Dict[int, float]:
+        """Вектор-запит для заявки: term_id -> TF-IDF вага (нормована), лише інформативні терми"""
+        vector = dict(
+            db.query(ApplicationTerm.term_id, ApplicationTerm.weight)
+            .filter(ApplicationTerm.application_id == application.id).all()
+        )
+        if not vector:
+            # Заявку ще не проіндексовано - будуємо вектор на льоту, без запису
+            built = build_vector(application.skills, application.position, application.previous_work)
+            if built:
+                term_ids = dict(
+                    db.query(SimilarityTerm.term, SimilarityTerm.id)
+                    .filter(SimilarityTerm.term.in_(list(built))).all()
+                )
+                vector = {term_ids[term]: weight for term, weight in built.items() if term in term_ids}
+        if not vector:
+            return {}
+
+        total = corpus_size.get(db)
+        # DF лише для термів запиту - рахується по PK (term_id, application_id)
+        frequencies = dict(
+            db.query(ApplicationTerm.term_id, func.count(ApplicationTerm.application_id))
+            .filter(ApplicationTerm.term_id.in_(list(vector)))
+            .group_by(ApplicationTerm.term_id).all()
+        )
+        weighted: Dict[int, float] = {}
+        for term_id, weight in vector.items():
+            df = frequencies.get(term_id, 0)
+            # Терм, що є майже в усіх заявках, не розрізняє кандидатів, а його posting list найдовший
+            if total >= settings.SIMILAR_MIN_CORPUS and df > total * settings.SIMILAR_MAX_DF_RATIO:
+                continue
+            weighted[term_id] = weight * (math.log((total + 1) / (df + 1)) + 1)
+
+        top = sorted(weighted.items(), key=lambda item: item[1], reverse=True)[:settings.SIMILAR_QUERY_TERMS]
+        norm = math.sqrt(sum(weight * weight for _, weight in top))
+        return {term_id: weight / norm for term_id, weight in top} if norm else {}
+
+    @staticmethod
+    def find_similar(db: Session, application: Application, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Найближчі заявки інших кандидатів (з будь-яким статусом, зокрема відхилені).
+        Читає лише posting lists термів запиту, а не всю таблицю заявок.
+        """
+        query = SimilarityService.query_vector(db, application)
+        if not query:
+            return []
+
+        score = func.sum(case(
+            *[(ApplicationTerm.term_id == term_id, ApplicationTerm.weight * weight) for term_id, weight in query.items()],
+            else_=0.0
+        )).label("score")
+        # Із запасом: заявки того самого кандидата відкидаються нижче
+        candidates = db.query(ApplicationTerm.application_id, score).filter(
+            ApplicationTerm.term_id.in_(list(query)),
+            ApplicationTerm.application_id != application.id
+        ).group_by(ApplicationTerm.application_id).order_by(
+            score.desc(), ApplicationTerm.application_id.desc()
+        ).limit(limit * 2).all()
+        scores = {application_id: float(value) for application_id, value in candidates if value >= settings.SIMILAR_MIN_SCORE}
+        if not scores:
+            return []
+
+        rows = db.query(
+            Application.id,
+            Application.candidate_id,
+            Application.full_name,
+            Application.position,
+            Application.status,
+            Application.created_at
+        ).filter(
+            Application.id.in_(list(scores)),
+            Application.candidate_id != application.candidate_id
+        ).all()
+        rows.sort(key=lambda row: (-scores[row[0]], -row[0]))
+        return [
+            {
+                "id": application_id,
+                "candidate_id": candidate_id,
+                "candidate_name": full_name,
+                "position": position,
+                "status": status,
+                "created_at": created_at,
+                "score": round(scores[application_id], 4)
+            }
+            for application_id, candidate_id, full_name, position, status, created_at in rows[:limit]
+        ]
@@ -0,0 +1,161 @@
+"""Сервіс довідника навичок та фільтрації заявок за навичками"""
+from sqlalchemy import and_, delete, exists, false, func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Tuple
+from app.models.application import Application
+from app.models.skill import ApplicationSkill, Skill
+from app.utils.exceptions import BusinessError
+from app.utils.skill_aliases import skill_canonicalizer
+
+# Максимум умов у фільтрі - кожна додає EXISTS-підзапит
+MAX_SKILL_FILTERS = 10
+
+
+def normalize_skill_name(name: Optional[str]) -> str:
+    """Нормалізувати назву навички для порівняння (регістр, пробіли)"""
+    return " ".join((name or "").lower().split())[:100]
+
+
+def extract_skills(skills: Any) -> Dict[str, Tuple[str, float]]:
+    """
+    Навички з JSON заявки: ключ -> (назва для відображення, роки досвіду).
+    Підтримує [{"name": ..., "exp": ...}] та старий формат списку рядків.
+    """
+    result: Dict[str, Tuple[str, float]] = {}
+    if not isinstance(skills, list):
+        return result
+    for item in skills:
+        if isinstance(item, dict):
+            name, exp = item.get("name"), item.get("exp")
+        elif isinstance(item, str):
+            name, exp = item, 0
+        else:
+            continue
+        if not isinstance(name, str):
+            continue
+        try:
+            years = max(float(exp or 0), 0.0)
+        except (TypeError, ValueError):
+            years = 0.0
+        # Старі заявки могли зберегти неканонічні назви - ключ завжди за словником синонімів
+        for canonical in skill_canonicalizer.canonical_names(name):
+            key = normalize_skill_name(canonical)
+            if not key:
+                continue
+            # Дублікат навички - залишаємо більший досвід
+            if key not in result or years > result[key][1]:
+                result[key] = (canonical[:100], years)
+    return result
+
+
+def parse_skill_filter(value: Optional[str]) -> List[Tuple[str, float]]:
+    """"python:3,django" -> [("python", 3.0), ("django", 0.0)]"""
+    predicates: List[Tuple[str, float]] = []
+    for part in (value or "").split(","):
+        name, _, years = part.partition(":")
+        key = normalize_skill_name(skill_canonicalizer.canonical_name(name))
+        if not key:
+            continue
+        try:
+            min_years = float(years) if years.strip() else 0.0
+        except ValueError:
+            raise BusinessError(f"Invalid years for skill '{key}'")
+        predicates.append((key, min_years))
+    if len(predicates) > MAX_SKILL_FILTERS:
+        raise BusinessError(f"Too many skill filters (max {MAX_SKILL_FILTERS})")
+    return predicates
+
+
+class SkillService:
+    """Сервіс для роботи з довідником навичок"""
+
+    @staticmethod
+    def get_or_create_skills(db: Session, names: Dict[str, str]) -> Dict[str, int]:
+        """ID навичок за ключами; відсутні додаються в довідник (ключ -> назва)"""
+        if not names:
+            return {}
+        dialect = db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+            # Паралельні заявки з новою навичкою не конфліктують
+            db.execute(
+                insert(Skill).values([{"key": key, "name": name} for key, name in names.items()])
+                .on_conflict_do_nothing(index_elements=[Skill.key])
+            )
+        else:
+            existing = {key for (key,) in db.query(Skill.key).filter(Skill.key.in_(list(names)))}
+            db.add_all(Skill(key=key, name=name) for key, name in names.items() if key not in existing)
+            db.flush()
+        return dict(db.query(Skill.key, Skill.id).filter(Skill.key.in_(list(names))).all())
+
+    @staticmethod
+    def sync_application_skills(db: Session, application: Application) -> None:
+        """Перезаписати нормалізовані навички заявки з її JSON (без commit)"""
+        db.flush()
+        SkillService.sync_skills(db, [(application.id, application.skills)])
+
+    @staticmethod
+    def sync_skills(db: Session, rows: List[Tuple[int, Any]]) -> int:
+        """
+        Перезаписати навички пакета заявок: rows - пари (application_id, JSON навичок).
+        Три запити на пакет незалежно від його розміру. Повертає кількість записаних зв'язків.
+        """
+        if not rows:
+            return 0
+        extracted = {application_id: extract_skills(skills) for application_id, skills in rows}
+        names: Dict[str, str] = {}
+        for skills in extracted.values():
+            for key, (name, _) in skills.items():
+                names.setdefault(key, name)
+        skill_ids = SkillService.get_or_create_skills(db, names)
+
+        db.execute(delete(ApplicationSkill).where(ApplicationSkill.application_id.in_(list(extracted))))
+        links = [
+            {"application_id": application_id, "skill_id": skill_ids[key], "years": years}
+            for application_id, skills in extracted.items()
+            for key, (_, years) in skills.items()
+        ]
+        if links:
+            db.execute(ApplicationSkill.__table__.insert(), links)
+        return len(links)
+
+    @staticmethod
+    def build_filter(db: Session, predicates: List[Tuple[str, float]]):
+        """
+        Умова для запиту заявок: усі навички з мінімальним досвідом (AND).
+        Кожна умова - EXISTS по індексу (skill_id, years, application_id).
+        """
+        if not predicates:
+            return None
+        keys = {key for key, _ in predicates}
+        skill_ids = dict(db.query(Skill.key, Skill.id).filter(Skill.key.in_(keys)).all())
+        if len(skill_ids) < len(keys):
+            # Невідома навичка - жодна заявка не підходить
+            return false()
+
+        conditions = []
+        for key, min_years in predicates:
+            link = exists().where(
+                ApplicationSkill.application_id == Application.id,
+                ApplicationSkill.skill_id == skill_ids[key]
+            )
+            if min_years > 0:
+                link = link.where(ApplicationSkill.years >= min_years)
+            conditions.append(link)
+        return and_(*conditions)
+
+    @staticmethod
+    def list_skills(db: Session, query: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Навички довідника з кількістю заявок (найпопулярніші першими)"""
+        count = func.count(ApplicationSkill.application_id)
+        rows = db.query(Skill.key, Skill.name, count).outerjoin(
+            ApplicationSkill, ApplicationSkill.skill_id == Skill.id
+        )
+        key = normalize_skill_name(query)
+        if key:
+            rows = rows.filter(Skill.key.startswith(key, autoescape=True))
+        rows = rows.group_by(Skill.id, Skill.key, Skill.name).order_by(count.desc(), Skill.key).limit(limit)
+        return [{"key": key, "name": name, "applications": total} for key, name, total in rows]
@@ -0,0 +1,106 @@
+"""Сервіс підписок HR на позиції та маршрутизації сповіщень"""
+import time
+from sqlalchemy.orm import Session
+from typing import Dict, List, Optional
+from app.config import settings
+from app.models.subscription import HRSubscription
+from app.models.user import User, UserRole
+from app.services.base_service import BaseService
+
+
+def normalize_position(position: Optional[str]) -> str:
+    """Нормалізувати назву позиції для порівняння (регістр, пробіли)"""
+    return " ".join((position or "").lower().split())
+
+
+class HRRoutingTable:
+    """
+    Кеш маршрутизації: позиція -> Telegram ID підписаних HR.
+
+    HR без підписок отримують сповіщення про всі позиції.
+    Таблиця перебудовується після змін підписок/ролей (invalidate)
+    або після закінчення TTL (зміни з інших процесів, напр. change_role.py).
+    """
+
+    def __init__(self, ttl_seconds: int):
+        self.ttl_seconds = ttl_seconds
+        self._by_position: Dict[str, List[int]] = {}
+        self._unsubscribed: List[int] = []
+        self._all: List[int] = []
+        self._built_at: Optional[float] = None
+
+    def invalidate(self) -> None:
+        """Позначити таблицю застарілою"""
+        self._built_at = None
+
+    def _is_fresh(self) -> bool:
+        return self._built_at is not None and time.monotonic() - self._built_at < self.ttl_seconds
+
+    def rebuild(self, db: Session) -> None:
+        """Перебудувати таблицю одним запитом"""
+        rows = db.query(User.telegram_id, HRSubscription.position).outerjoin(
+            HRSubscription, HRSubscription.user_id == User.id
+        ).filter(
+            User.role == UserRole.HR,
+            User.is_active == True
+        ).all()
+
+        by_position: Dict[str, List[int]] = {}
+        unsubscribed: List[int] = []
+        all_ids: Dict[int, None] = {}
+        for telegram_id, position in rows:
+            if not telegram_id:
+                continue
+            all_ids[telegram_id] = None
+            if position is None:
+                unsubscribed.append(telegram_id)
+            else:
+                by_position.setdefault(position, []).append(telegram_id)
+
+        self._by_position = by_position
+        self._unsubscribed = unsubscribed
+        self._all = list(all_ids)
+        self._built_at = time.monotonic()
+
+    def get_recipients(self, db: Session, position: Optional[str]) -> List[int]:
+        """Отримати Telegram ID HR, яким адресована подія по позиції"""
+        if not self._is_fresh():
+            self.rebuild(db)
+
+        subscribed = self._by_position.get(normalize_position(position), [])
+        recipients = subscribed + [tid for tid in self._unsubscribed if tid not in subscribed]
+        # Якщо позицію ніхто не веде - не губимо подію, сповіщаємо всіх HR
+        return recipients or list(self._all)
+
+
+hr_routing_table = HRRoutingTable(ttl_seconds=settings.ROUTING_REFRESH_SECONDS)
+
+
+class SubscriptionService(BaseService[HRSubscription]):
+    """Сервіс для управління підписками HR на позиції"""
+
+    @staticmethod
+    def get_user_positions(db: Session, user_id: int) -> List[str]:
+        """Отримати позиції, на які підписаний HR"""
+        rows = db.query(HRSubscription.position).filter(
+            HRSubscription.user_id == user_id
+        ).order_by(HRSubscription.position).all()
+        return [position for (position,) in rows]
+
+    @staticmethod
+    def set_user_positions(db: Session, user_id: int, positions: List[str]) -> List[str]:
+        """Замінити набір підписок HR (порожній список - отримувати все)"""
+        normalized = sorted({normalize_position(p) for p in positions if normalize_position(p)})
+
+        db.query(HRSubscription).filter(HRSubscription.user_id == user_id).delete()
+        for position in normalized:
+            db.add(HRSubscription(user_id=user_id, position=position))
+        db.commit()
+
+        hr_routing_table.invalidate()
+        return normalized
+
+    @staticmethod
+    def get_hr_recipients(db: Session, position: Optional[str]) -> List[int]:
+        """Отримати Telegram ID HR для сповіщення по позиції"""
+        return hr_routing_table.get_recipients(db, position)
@@ -1,13 +1,122 @@
 """Сервіс для роботи з користувачами"""
+import threading
+import time
+from collections import OrderedDict
 from sqlalchemy.orm import Session
+from app.config import settings
 from app.models.user import User, UserRole, InviteLink
 from app.services.base_service import BaseService
 from app.utils.exceptions import UserNotFoundError, InviteInvalidError
+from app.utils.metrics import USER_CACHE_LOOKUPS, USER_CACHE_SIZE
 from app.constants import InviteExpiry
-from typing import Optional, List
+from typing import Any, Dict, Optional, List, Tuple
 from datetime import datetime, timedelta, timezone
 
 
+class UserIdentity:
+    """Знімок користувача для перевірки доступу (без прив'язки до сесії БД)"""
+    __slots__ = ("id", "telegram_id", "username", "first_name", "last_name", "role", "is_active")
+
+    def __init__(self, user: User):
+        self.id = user.id
+        self.telegram_id = user.telegram_id
+        self.username = user.username
+        self.first_name = user.first_name
+        self.last_name = user.last_name
+        self.role = user.role
+        self.is_active = user.is_active
+
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any]) -> "UserIdentity":
+        """Відновити знімок з токена сесії"""
+        identity = cls.__new__(cls)
+        identity.id = claims["uid"]
+        identity.telegram_id = int(claims["sub"])
+        identity.username = claims.get("un")
+        identity.first_name = claims.get("fn")
+        identity.last_name = claims.get("ln")
+        identity.role = UserRole(claims["role"])
+        identity.is_active = True
+        return identity
+
+    def to_claims(self) -> Dict[str, Any]:
+        """Дані для токена сесії"""
+        return {
+            "sub": str(self.telegram_id),
+            "uid": self.id,
+            "role": self.role.value,
+            "un": self.username,
+            "fn": self.first_name,
+            "ln": self.last_name
+        }
+
+    @property
+    def full_name(self) -> str:
+        """Повне ім'я користувача без None"""
+        parts = [p for p in [self.first_name, self.last_name] if p]
+        return " ".join(parts) if parts else (self.username or f"user_{self.telegram_id}")
+
+
+class UserIdentityCache:
+    """
+    TTL + LRU кеш: Telegram ID -> UserIdentity.
+
+    Скидається при зміні ролей у цьому процесі; зміни з інших процесів
+    (напр. change_role.py) підхоплюються після закінчення TTL.
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[float, UserIdentity]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, telegram_id: int) -> Optional[UserIdentity]:
+        """Отримати користувача з кешу або з БД"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(telegram_id)
+            if entry and entry[0] > now:
+                self._entries.move_to_end(telegram_id)
+                USER_CACHE_LOOKUPS.inc(result="hit")
+                return entry[1]
+        USER_CACHE_LOOKUPS.inc(result="expired" if entry else "miss")
+
+        user = UserService.get_user_by_telegram_id(db, telegram_id)
+        if not user:
+            # Відсутніх не кешуємо - користувач може з'явитися після /start
+            self.invalidate(telegram_id)
+            return None
+
+        identity = UserIdentity(user)
+        with self._lock:
+            self._entries[telegram_id] = (now + self.ttl_seconds, identity)
+            self._entries.move_to_end(telegram_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return identity
+
+    def peek(self, telegram_id: int) -> Optional[UserIdentity]:
+        """Отримати користувача лише з кешу (без звернення до БД)"""
+        entry = self._entries.get(telegram_id)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+        return None
+
+    def invalidate(self, telegram_id: int) -> None:
+        """Видалити одного користувача з кешу"""
+        with self._lock:
+            self._entries.pop(telegram_id, None)
+
+    def clear(self) -> None:
+        """Очистити кеш"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
 class UserService(BaseService[User]):
     """Сервіс для управління користувачами"""
     
@@ -42,6 +151,7 @@ class UserService(BaseService[User]):
                 user.last_name = last_name
             db.commit()
             db.refresh(user)
+            user_identity_cache.invalidate(telegram_id)
         return user
     
     @staticmethod
@@ -57,6 +167,7 @@ class UserService(BaseService[User]):
             return False
         user.role = role
         db.commit()
+        UserService._on_role_changed()
         return True
     
     @staticmethod
@@ -115,8 +226,16 @@ class UserService(BaseService[User]):
         
         db.commit()
         db.refresh(invite)
+        UserService._on_role_changed()
         return invite
     
+    @staticmethod
+    def _on_role_changed() -> None:
+        """Скинути кеші, що залежать від ролей користувачів"""
+        from app.services.subscription_service import hr_routing_table
+        hr_routing_table.invalidate()
+        user_identity_cache.clear()
+    
     @staticmethod
     def get_users_by_role(db: Session, role: UserRole) -> List[User]:
         """Отримати користувачів за роллю"""
@@ -146,3 +265,9 @@ class UserService(BaseService[User]):
         db.commit()
         return True
 
+
+user_identity_cache = UserIdentityCache(
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    max_size=settings.USER_CACHE_SIZE
+)
+USER_CACHE_SIZE.set_function(lambda: len(user_identity_cache))
@@ -0,0 +1,92 @@
+"""Адаптивне об'єднання сповіщень у дайджести"""
+import asyncio
+import time
+from collections import deque
+from typing import Awaitable, Callable, Deque, Dict, List, Set
+
+from app.config import settings
+
+FlushCallback = Callable[[List[str]], Awaitable[object]]
+
+# Сильні посилання на задачі дайджестів (цикл подій тримає лише слабкі)
+_flush_tasks: Set[asyncio.Task] = set()
+
+
+class DigestCoalescer:
+    """
+    Перемикає отримувача в режим дайджесту при високій частоті подій.
+
+    Поки за вікно надходить не більше `threshold` подій, кожна з них
+    відправляється окремо. Після перевищення порогу події накопичуються
+    і відправляються одним повідомленням наприкінці вікна.
+    """
+
+    def __init__(self, threshold: int, window_seconds: int):
+        self.threshold = threshold
+        self.window_seconds = window_seconds
+        # Достатньо пам'ятати threshold + 1 останніх подій, щоб виявити перевищення
+        self._events: Dict[int, Deque[float]] = {}
+        self._buffers: Dict[int, List[str]] = {}
+        self._swept_at = time.monotonic()
+
+    def offer(self, recipient_id: int, item: str, flush: FlushCallback) -> bool:
+        """
+        Зареєструвати подію для отримувача.
+
+        Returns:
+            True якщо подію треба відправити одразу,
+            False якщо її додано до дайджесту (його відправить `flush`)
+        """
+        now = time.monotonic()
+        if now - self._swept_at >= self.window_seconds:
+            self._sweep(now)
+        events = self._events.get(recipient_id)
+        if events is None:
+            events = self._events[recipient_id] = deque(maxlen=self.threshold + 1)
+        while events and now - events[0] >= self.window_seconds:
+            events.popleft()
+        events.append(now)
+
+        if recipient_id in self._buffers:
+            self._buffers[recipient_id].append(item)
+            return False
+
+        if len(events) <= self.threshold:
+            return True
+
+        self._buffers[recipient_id] = [item]
+        task = asyncio.create_task(self._flush_later(recipient_id, flush))
+        _flush_tasks.add(task)
+        task.add_done_callback(_flush_tasks.discard)
+        return False
+
+    def _sweep(self, now: float) -> None:
+        """Прибрати отримувачів без подій за останнє вікно, щоб словник не ріс безмежно"""
+        self._swept_at = now
+        stale = [
+            recipient_id for recipient_id, events in self._events.items()
+            if recipient_id not in self._buffers and (not events or now - events[-1] >= self.window_seconds)
+        ]
+        for recipient_id in stale:
+            del self._events[recipient_id]
+
+    async def _flush_later(self, recipient_id: int, flush: FlushCallback) -> None:
+        """Відправити накопичений дайджест після завершення вікна"""
+        try:
+            await asyncio.sleep(self.window_seconds)
+        finally:
+            # Навіть якщо задачу скасовано - інакше всі наступні події отримувача застрягнуть у буфері
+            items = self._buffers.pop(recipient_id, [])
+
+        if items:
+            try:
+                await flush(items)
+            except Exception as e:
+                print(f"Error sending digest: {e}")
+
+
+# Дайджест нових заявок для HR
+hr_digest_coalescer = DigestCoalescer(
+    threshold=settings.DIGEST_THRESHOLD,
+    window_seconds=settings.DIGEST_WINDOW_SECONDS
+)
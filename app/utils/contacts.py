@@ -0,0 +1,51 @@
+"""Нормалізація контактів кандидата для пошуку дублікатів заявок"""
+import hashlib
+import re
+from typing import Optional
+
+# Поштові сервіси, що ігнорують крапки в імені скриньки
+DOTLESS_DOMAINS = {"gmail.com", "googlemail.com"}
+NON_DIGITS = re.compile(r"\D")
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    """"John.Doe+jobs@GMail.com " -> "johndoe@gmail.com" (без +тегів та крапок для Gmail)"""
+    if not email:
+        return None
+    local, sep, domain = email.strip().lower().partition("@")
+    if not sep or not local or not domain:
+        return None
+    local = local.split("+", 1)[0]
+    if domain == "googlemail.com":
+        domain = "gmail.com"
+    if domain in DOTLESS_DOMAINS:
+        local = local.replace(".", "")
+    return f"{local}@{domain}" if local else None
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """"+38 (050) 123-45-67", "0501234567" -> "380501234567"; None для закоротких номерів"""
+    if not phone:
+        return None
+    digits = NON_DIGITS.sub("", phone)
+    if digits.startswith("00"):
+        digits = digits[2:]
+    # Локальний український формат 0XXXXXXXXX
+    if len(digits) == 10 and digits.startswith("0"):
+        digits = "38" + digits
+    return digits if len(digits) >= 9 else None
+
+
+def contact_hash(value: Optional[str]) -> Optional[str]:
+    """Компактний ключ для індексу (сам контакт в індекс не потрапляє)"""
+    if not value:
+        return None
+    return hashlib.blake2b(value.encode(), digest_size=16).hexdigest()
+
+
+def email_hash(email: Optional[str]) -> Optional[str]:
+    return contact_hash(normalize_email(email))
+
+
+def phone_hash(phone: Optional[str]) -> Optional[str]:
+    return contact_hash(normalize_phone(phone))
@@ -0,0 +1,60 @@
+"""Сховище ключів ідемпотентності для вихідних повідомлень"""
+import hashlib
+import time
+from collections import OrderedDict
+
+from app.config import settings
+
+
+class RecentKeyStore:
+    """
+    Компактне сховище нещодавно використаних ключів з TTL.
+
+    Замість рядків зберігаються 8-байтові хеші. TTL однаковий для всіх
+    ключів, тож порядок вставки збігається з порядком закінчення терміну
+    і прострочені ключі прибираються з початку словника за O(1).
+    """
+
+    def __init__(self, ttl_seconds: int, max_size: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._keys: "OrderedDict[bytes, float]" = OrderedDict()
+
+    @staticmethod
+    def _digest(key: str) -> bytes:
+        return hashlib.blake2b(key.encode(), digest_size=8).digest()
+
+    def _evict_expired(self, now: float) -> None:
+        while self._keys:
+            oldest, expires_at = next(iter(self._keys.items()))
+            if expires_at > now:
+                break
+            del self._keys[oldest]
+
+    def claim(self, key: str) -> bool:
+        """Зайняти ключ. False якщо ключ уже використано протягом TTL"""
+        now = time.monotonic()
+        self._evict_expired(now)
+
+        digest = self._digest(key)
+        if digest in self._keys:
+            return False
+
+        self._keys[digest] = now + self.ttl_seconds
+        if len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+        return True
+
+    def release(self, key: str) -> None:
+        """Звільнити ключ (напр. якщо відправка не вдалася і її можна повторити)"""
+        self._keys.pop(self._digest(key), None)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+# Ключі вже відправлених сповіщень
+notification_keys = RecentKeyStore(
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    max_size=settings.IDEMPOTENCY_MAX_KEYS
+)
@@ -0,0 +1,207 @@
+"""Метрики додатку у форматі Prometheus (без зовнішніх залежностей)"""
+import threading
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+LabelValues = Tuple[str, ...]
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{str(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric:
+    """Базовий клас метрики з мітками"""
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(self._samples())
+        return lines
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """Лічильник, що лише зростає"""
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {value}" for key, value in items]
+
+
+class Gauge(_Metric):
+    """Поточне значення (встановлюється або обчислюється при зчитуванні)"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self._callback: Optional[Callable[[], float]] = None
+
+    def set(self, value: float, **labels: str) -> None:
+        with self._lock:
+            self._values[self._key(labels)] = value
+
+    def set_function(self, callback: Callable[[], float]) -> None:
+        """Обчислювати значення при кожному зчитуванні (для метрик без міток)"""
+        self._callback = callback
+
+    def _samples(self) -> List[str]:
+        if self._callback:
+            return [f"{self.name} {self._callback()}"]
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {value}" for key, value in items]
+
+
+class Histogram(_Metric):
+    """Гістограма з кумулятивними кошиками"""
+    kind = "histogram"
+
+    DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        # мітки -> [лічильники по кошиках..., сума, кількість]
+        self._values: Dict[LabelValues, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            data = self._values.get(key)
+            if data is None:
+                data = self._values[key] = [0] * (len(self.buckets) + 2)
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    data[i] += 1
+            data[-2] += value
+            data[-1] += 1
+
+    def _samples(self) -> List[str]:
+        with self._lock:
+            items = [(key, list(data)) for key, data in self._values.items()]
+        lines = []
+        for key, data in items:
+            for i, bound in enumerate(self.buckets):
+                labels = _format_labels(self.label_names, key, f'le="{bound}"')
+                lines.append(f"{self.name}_bucket{labels} {data[i]}")
+            labels = _format_labels(self.label_names, key, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{labels} {data[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, key)} {data[-2]}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, key)} {data[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """Реєстр метрик процесу"""
+
+    def __init__(self):
+        self._metrics: Dict[str, _Metric] = {}
+
+    def _register(self, metric: _Metric) -> _Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, labels))
+
+    def gauge(self, name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, labels))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labels: Sequence[str] = (),
+        buckets: Sequence[float] = Histogram.DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labels, buckets))
+
+    def render(self) -> str:
+        """Усі метрики у текстовому форматі Prometheus"""
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+
+# Сповіщення
+NOTIFICATIONS_ENQUEUED = registry.counter(
+    "recruit_notifications_enqueued_total", "Notifications accepted into the send queue", ["event"]
+)
+NOTIFICATIONS_SENT = registry.counter(
+    "recruit_notifications_sent_total", "Notifications delivered to Telegram", ["event"]
+)
+NOTIFICATIONS_FAILED = registry.counter(
+    "recruit_notifications_failed_total", "Notifications that could not be delivered", ["event", "error"]
+)
+NOTIFICATIONS_DROPPED = registry.counter(
+    "recruit_notifications_dropped_total", "Notifications dropped before sending", ["event", "reason"]
+)
+NOTIFICATION_RETRIES = registry.counter(
+    "recruit_notification_retries_total", "Send attempts retried after an error", ["event", "error"]
+)
+NOTIFICATION_QUEUE_LATENCY = registry.histogram(
+    "recruit_notification_delivery_seconds",
+    "Time from enqueue to successful delivery",
+    ["event"],
+    buckets=(0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+)
+NOTIFICATION_SEND_DURATION = registry.histogram(
+    "recruit_notification_send_seconds", "Duration of a single Telegram send call", ["event"]
+)
+NOTIFICATION_QUEUE_DEPTH = registry.gauge(
+    "recruit_notification_queue_depth", "Notifications waiting in the send queue"
+)
+
+
+# Кеш користувачів
+USER_CACHE_LOOKUPS = registry.counter(
+    "recruit_user_cache_lookups_total", "User identity cache lookups by result (hit, miss, expired)", ["result"]
+)
+USER_CACHE_SIZE = registry.gauge(
+    "recruit_user_cache_entries", "Users currently held in the identity cache"
+)
+
+
+# Обмеження частоти API
+API_REQUESTS_THROTTLED = registry.counter(
+    "recruit_api_throttled_total", "API requests rejected with 429 by role and route class", ["role", "route_class"]
+)
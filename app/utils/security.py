@@ -1,6 +1,14 @@
 import bleach
+import hashlib
+import hmac
+import json
+import threading
 import time
-from typing import Dict
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qsl
+from jose import JWTError, jwt
+from app.config import settings
 
 def sanitize_html(text: str) -> str:
     """
@@ -11,30 +19,231 @@ def sanitize_html(text: str) -> str:
     # Стрипаємо всі теги
     return bleach.clean(text, tags=[], attributes={}, strip=True)
 
+class MemoryRateLimitBackend:
+    """
+    Стан лімітерів у пам'яті процесу.
+    Ключі, що вже "відновилися" (TAT у минулому), витісняються, кількість ключів обмежена.
+    """
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._tat: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def acquire(self, key: str, now: float, interval: float, burst: float) -> float:
+        """Спробувати витратити запит. Повертає 0 або скільки секунд чекати"""
+        with self._lock:
+            tat = max(self._tat.get(key, now), now)
+            if tat - now > burst:
+                return tat - now - burst
+            self._tat[key] = tat + interval
+            self._tat.move_to_end(key)
+            self._evict(now)
+            return 0.0
+
+    def _evict(self, now: float) -> None:
+        # Найдавніше оновлені ключі на початку - прибираємо ті, що вже простоюють
+        while self._tat:
+            key, tat = next(iter(self._tat.items()))
+            if tat > now and len(self._tat) <= self.max_keys:
+                break
+            self._tat.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._tat)
+
+
+class DatabaseRateLimitBackend:
+    """
+    Стан лімітерів у таблиці rate_limit_buckets (спільний для всіх воркерів).
+    Перевірка - один атомарний upsert (PostgreSQL або SQLite).
+    """
+    def __init__(self, cleanup_every: int = 1000):
+        from app.database import engine
+        if engine.dialect.name not in ("postgresql", "sqlite"):
+            raise ValueError(f"Rate limit backend does not support {engine.dialect.name}")
+        self.dialect = engine.dialect.name
+        self.cleanup_every = cleanup_every
+        self._calls = 0
+
+    def acquire(self, key: str, now: float, interval: float, burst: float) -> float:
+        """Спробувати витратити запит. Повертає 0 або скільки секунд чекати"""
+        from sqlalchemy import delete, func, select
+        from app.database import SessionLocal
+        from app.models.rate_limit import RateLimitBucket
+
+        if self.dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+            current = func.greatest(RateLimitBucket.tat, now)
+        else:
+            from sqlalchemy.dialects.sqlite import insert
+            current = func.max(RateLimitBucket.tat, now)
+
+        stmt = insert(RateLimitBucket).values(key=key, tat=now + interval)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[RateLimitBucket.key],
+            set_={"tat": current + interval},
+            where=current - now <= burst
+        ).returning(RateLimitBucket.tat)
+
+        with SessionLocal() as db:
+            retry_after = 0.0
+            if db.execute(stmt).first() is None:
+                # Оновлення не відбулося - ліміт вичерпано
+                tat = db.execute(select(RateLimitBucket.tat).where(RateLimitBucket.key == key)).scalar() or now
+                retry_after = max(tat - now - burst, 0.0)
+
+            self._calls += 1
+            if self._calls % self.cleanup_every == 0:
+                db.execute(delete(RateLimitBucket).where(RateLimitBucket.tat < now))
+            db.commit()
+            return retry_after
+
+
+def create_rate_limit_backend():
+    """Сховище лімітерів згідно з RATE_LIMIT_BACKEND"""
+    if settings.RATE_LIMIT_BACKEND == "database":
+        return DatabaseRateLimitBackend()
+    return MemoryRateLimitBackend(max_keys=settings.RATE_LIMIT_MAX_KEYS)
+
+
 class RateLimiter:
     """
-    Простий лімітер запитів у пам'яті (для демо/академічних цілей).
-    У продакшені краще використовувати Redis.
+    Лімітер запитів за алгоритмом GCRA: requests_limit запитів за window_seconds.
+    Для кожного ключа зберігається лише одне число (теоретичний час наступного запиту).
     """
-    def __init__(self, requests_limit: int, window_seconds: int):
+    def __init__(self, name: str, requests_limit: int, window_seconds: float, backend=None):
+        self.name = name
         self.requests_limit = requests_limit
         self.window_seconds = window_seconds
-        self.cache: Dict[str, list] = {}
+        self.interval = window_seconds / requests_limit
+        self.burst = window_seconds - self.interval
+        self.backend = backend if backend is not None else rate_limit_backend
 
-    def is_allowed(self, key: str) -> bool:
-        now = time.time()
-        if key not in self.cache:
-            self.cache[key] = [now]
-            return True
+    def check(self, key: str) -> Tuple[bool, float]:
+        """Повертає (дозволено, через скільки секунд можна повторити)"""
+        try:
+            retry_after = self.backend.acquire(f"{self.name}:{key}", time.time(), self.interval, self.burst)
+        except Exception as e:
+            # Недоступне сховище не повинно блокувати користувачів
+            print(f"Rate limiter {self.name} error: {e}")
+            return True, 0.0
+        return retry_after <= 0, retry_after
 
-        # Видаляємо старі запити
-        self.cache[key] = [t for t in self.cache[key] if now - t < self.window_seconds]
+    def is_allowed(self, key: str) -> bool:
+        return self.check(key)[0]
 
-        if len(self.cache[key]) < self.requests_limit:
-            self.cache[key].append(now)
-            return True
-        
-        return False
+rate_limit_backend = create_rate_limit_backend()
 
 # Створюємо глобальний лімітер: 1 заявка за 5 хвилин на одного користувача
-application_limiter = RateLimiter(requests_limit=1, window_seconds=300)
+application_limiter = RateLimiter("application", requests_limit=1, window_seconds=300)
+
+
+class InitDataError(Exception):
+    """Невалідні або застарілі дані Telegram WebApp"""
+    pass
+
+
+class InitDataValidator:
+    """
+    Перевірка підпису initData Telegram WebApp (HMAC-SHA256 від BOT_TOKEN).
+    Вже перевірені рядки кешуються (LRU), тож повторні запити не рахують HMAC.
+    """
+    def __init__(self, bot_token: str, max_age_seconds: int, cache_size: int):
+        self.secret_key = hmac.new(b"WebAppData", bot_token.encode(), hashlib.sha256).digest()
+        self.max_age_seconds = max_age_seconds
+        self.cache_size = cache_size
+        # дайджест initData -> (telegram_id, auth_date)
+        self.cache: "OrderedDict[bytes, Tuple[int, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _check_fresh(self, auth_date: int) -> None:
+        if self.max_age_seconds and time.time() - auth_date > self.max_age_seconds:
+            raise InitDataError("initData expired")
+
+    def _verify(self, init_data: str) -> Tuple[int, int]:
+        params = dict(parse_qsl(init_data, keep_blank_values=True))
+        received_hash = params.pop("hash", None)
+        if not received_hash:
+            raise InitDataError("hash is missing")
+
+        data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(params.items()))
+        expected_hash = hmac.new(self.secret_key, data_check_string.encode(), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(expected_hash, received_hash):
+            raise InitDataError("invalid hash")
+
+        try:
+            auth_date = int(params["auth_date"])
+            telegram_id = int(json.loads(params["user"])["id"])
+        except (KeyError, ValueError, TypeError):
+            raise InitDataError("user or auth_date is missing")
+        return telegram_id, auth_date
+
+    def validate(self, init_data: str) -> int:
+        """Повертає Telegram ID користувача або кидає InitDataError"""
+        key = hashlib.blake2b(init_data.encode(), digest_size=16).digest()
+        with self._lock:
+            cached = self.cache.get(key)
+            if cached:
+                self.cache.move_to_end(key)
+        if cached:
+            telegram_id, auth_date = cached
+        else:
+            telegram_id, auth_date = self._verify(init_data)
+            with self._lock:
+                self.cache[key] = (telegram_id, auth_date)
+                while len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+        self._check_fresh(auth_date)
+        return telegram_id
+
+
+init_data_validator = InitDataValidator(
+    settings.BOT_TOKEN,
+    max_age_seconds=settings.INIT_DATA_MAX_AGE_SECONDS,
+    cache_size=settings.INIT_DATA_CACHE_SIZE
+)
+
+
+class SessionTokenError(Exception):
+    """Невалідний або прострочений токен сесії"""
+    pass
+
+
+SESSION_TOKEN_ALGORITHM = "HS256"
+ACCESS_TOKEN = "access"
+REFRESH_TOKEN = "refresh"
+
+
+def create_session_token(
+    claims: Dict[str, Any],
+    token_type: str = ACCESS_TOKEN,
+    session_started: Optional[int] = None
+) -> Tuple[str, int]:
+    """
+    Підписати токен сесії. Повертає (токен, термін дії в секундах).
+    sat - час входу з initData; переноситься без змін у всі оновлені токени.
+    Refresh-токен діє до sat + SESSION_MAX_AGE_SECONDS, далі потрібен новий initData.
+    """
+    now = int(time.time())
+    started = session_started or now
+    if token_type == REFRESH_TOKEN:
+        ttl = max(started + settings.SESSION_MAX_AGE_SECONDS - now, 0)
+    else:
+        ttl = settings.SESSION_TOKEN_TTL_SECONDS
+    payload = dict(claims, typ=token_type, sat=started, iat=now, exp=now + ttl)
+    return jwt.encode(payload, settings.SECRET_KEY, algorithm=SESSION_TOKEN_ALGORITHM), ttl
+
+
+def decode_session_token(token: str, token_type: str = ACCESS_TOKEN) -> Dict[str, Any]:
+    """Перевірити підпис, тип та термін дії токена"""
+    try:
+        claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[SESSION_TOKEN_ALGORITHM])
+        started = int(claims.get("sat", claims["iat"]))
+    except (JWTError, KeyError, ValueError, TypeError):
+        raise SessionTokenError("invalid token")
+    # Токени без typ видані до появи refresh-токенів - лише як access
+    if claims.get("typ", ACCESS_TOKEN) != token_type:
+        raise SessionTokenError("wrong token type")
+    if time.time() - started > settings.SESSION_MAX_AGE_SECONDS:
+        raise SessionTokenError("session expired")
+    return claims
@@ -0,0 +1,139 @@
+"""Канонізація назв навичок за словником синонімів"""
+import json
+import os
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional
+from app.config import settings
+
+DEFAULT_ALIASES_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "skill_aliases.json")
+
+# "Python 3", "python3.11", "Vue 3+", "Angular v17" -> основа без версії
+VERSION_SUFFIX = re.compile(r"[\s\-]*v?\d+(\.\d+)*\+?$")
+# "Python/Django", "Docker, Kubernetes" - кілька навичок в одному полі
+SEPARATORS = re.compile(r"\s*(?:/|,|;|&|\band\b)\s*")
+# _mtime після невдалого першого завантаження (не збігається з mtime жодного файлу)
+LOAD_FAILED = -1.0
+
+
+def alias_key(name: str) -> str:
+    """Ключ для пошуку в словнику: нижній регістр, одиночні пробіли"""
+    return " ".join(name.lower().split())
+
+
+def _years(value: Any) -> float:
+    try:
+        return float(value or 0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class SkillCanonicalizer:
+    """
+    Словник синонімів (alias -> канонічна назва), скомпільований у dict.
+    Файл перечитується, якщо змінився (перевірка не частіше ніж раз на reload_interval секунд),
+    тож словник можна оновлювати без перезапуску.
+    """
+
+    def __init__(self, path: Optional[str] = None, reload_interval: float = 30.0):
+        self.path = path or DEFAULT_ALIASES_PATH
+        self.reload_interval = reload_interval
+        self._aliases: Dict[str, str] = {}
+        self._mtime: Optional[float] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def load(self) -> None:
+        """Скомпілювати словник з файлу; при помилці залишається попередній"""
+        try:
+            mtime = os.path.getmtime(self.path)
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Failed to load skill aliases from {self.path}: {e}")
+            if self._mtime is None:
+                # Наступна спроба - через reload_interval або коли файл з'явиться чи зміниться
+                self._mtime = LOAD_FAILED
+            return
+
+        aliases: Dict[str, str] = {}
+        for canonical, names in data.items():
+            for name in [canonical, *names]:
+                aliases[alias_key(name)] = canonical
+        # Заміна посилання атомарна - читачі бачать або старий, або новий словник
+        self._aliases = aliases
+        self._mtime = mtime
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if self._mtime is not None and now - self._checked_at < self.reload_interval:
+            return
+        with self._lock:
+            if self._mtime is not None and now - self._checked_at < self.reload_interval:
+                return
+            self._checked_at = now
+            try:
+                changed = os.path.getmtime(self.path) != self._mtime
+            except OSError:
+                changed = False
+            if changed or self._mtime is None:
+                self.load()
+
+    def lookup(self, name: str) -> Optional[str]:
+        """Канонічна назва або None, якщо навички немає в словнику"""
+        self._maybe_reload()
+        key = alias_key(name)
+        canonical = self._aliases.get(key)
+        if canonical is None:
+            base = VERSION_SUFFIX.sub("", key)
+            if base and base != key:
+                canonical = self._aliases.get(base)
+        return canonical
+
+    def canonical_names(self, name: str) -> List[str]:
+        """
+        Канонічні назви для одного введеного значення.
+        "Python/Django" -> ["Python", "Django"]; невідома навичка залишається як є.
+        """
+        cleaned = " ".join(name.split())
+        if not cleaned:
+            return []
+        canonical = self.lookup(cleaned)
+        if canonical:
+            return [canonical]
+
+        parts = [part for part in SEPARATORS.split(cleaned) if part]
+        if len(parts) > 1 and any(self.lookup(part) for part in parts):
+            return [self.lookup(part) or part for part in parts]
+        return [cleaned]
+
+    def canonical_name(self, name: str) -> str:
+        """Одна канонічна назва (для фільтрів та пошуку)"""
+        names = self.canonical_names(name)
+        return names[0] if len(names) == 1 else " ".join(name.split())
+
+    def canonicalize_skills(self, skills: Any) -> Any:
+        """
+        Канонізувати список навичок заявки [{"name", "exp"}, ...] або список рядків.
+        Дублікати після канонізації об'єднуються (залишається більший досвід).
+        """
+        if not isinstance(skills, list):
+            return skills
+        merged: Dict[str, Dict[str, Any]] = {}
+        for item in skills:
+            if isinstance(item, str):
+                item = {"name": item, "exp": 0}
+            if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+                continue
+            for name in self.canonical_names(item["name"]):
+                key = alias_key(name)
+                current = merged.get(key)
+                if current is None:
+                    merged[key] = {**item, "name": name}
+                elif _years(item.get("exp")) > _years(current.get("exp")):
+                    merged[key] = {**current, "exp": item.get("exp")}
+        return list(merged.values())
+
+
+skill_canonicalizer = SkillCanonicalizer(settings.SKILL_ALIASES_PATH, settings.SKILL_ALIASES_RELOAD_SECONDS)
@@ -0,0 +1,37 @@
+"""Умовні GET-запити: ETag / If-None-Match"""
+import hashlib
+from typing import Optional
+from fastapi import Request, Response
+
+# Відповідь персональна - браузер може кешувати її, але має перевіряти ETag перед використанням
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    """Слабкий ETag з частин ключа (тіло може стискатися по-різному, тому W/)"""
+    key = "|".join(str(part) for part in parts)
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Чи є etag серед значень If-None-Match (слабке порівняння)"""
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def check_etag(request: Request, response: Response, *parts) -> Optional[Response]:
+    """
+    Повертає готову 304-відповідь, якщо клієнт вже має актуальну версію.
+    Інакше додає ETag до відповіді маршруту і повертає None.
+    """
+    etag = make_etag(*parts)
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
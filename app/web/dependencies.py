@@ -2,45 +2,59 @@
 from fastapi import Depends, HTTPException, Request
 from sqlalchemy.orm import Session
 from app.database import get_db
-from app.services.user_service import UserService
+from app.services.user_service import UserIdentity, user_identity_cache
 from app.models.user import UserRole
 from app.utils.exceptions import AccessDeniedError, UserNotFoundError
+from app.config import settings
 from app.utils.helpers import validate_telegram_id
+from app.utils.security import InitDataError, SessionTokenError, decode_session_token, init_data_validator
 
 
-def get_user_from_request(request: Request, db: Session = Depends(get_db)):
-    """Отримати користувача з запиту (з Telegram WebApp)"""
-    telegram_id = request.headers.get("X-Telegram-User-Id")
+def get_bearer_token(request: Request) -> str:
+    """Токен сесії із заголовка Authorization (або порожній рядок)"""
+    scheme, _, token = request.headers.get("Authorization", "").partition(" ")
+    return token.strip() if scheme.lower() == "bearer" else ""
+
+
+def get_user_from_init_data(request: Request, db: Session = Depends(get_db)) -> UserIdentity:
+    """Отримати користувача з підписаних даних Telegram WebApp"""
+    tg_data = request.headers.get("X-TG-Data")
     
-    # Спроба отримати з X-TG-Data (якщо фронтенд старий або не оновлений)
-    # Примітка: В ідеалі тут має бути валідація hash, але поки використовуємо ID
-    if not telegram_id:
-        tg_data = request.headers.get("X-TG-Data")
-        if tg_data and "user=" in tg_data:
-            import json
-            from urllib.parse import parse_qs, unquote
-            try:
-                params = parse_qs(tg_data)
-                if 'user' in params:
-                    user_data = json.loads(unquote(params['user'][0]))
-                    telegram_id = str(user_data.get('id'))
-            except Exception:
-                pass
-
-    if not telegram_id:
+    if tg_data:
+        # Підписані дані від Telegram - перевіряємо hash та термін дії
+        try:
+            user_id = init_data_validator.validate(tg_data)
+        except InitDataError:
+            raise HTTPException(status_code=401, detail="Не авторизовано")
+    elif settings.ALLOW_INSECURE_AUTH and request.headers.get("X-Telegram-User-Id"):
+        # Лише для локальної розробки поза Telegram
+        user_id = validate_telegram_id(request.headers.get("X-Telegram-User-Id"))
+        if not user_id:
+            raise HTTPException(status_code=400, detail="Невірний формат Telegram ID")
+    else:
         raise HTTPException(status_code=401, detail="Не авторизовано")
     
-    user_id = validate_telegram_id(telegram_id)
-    if not user_id:
-        raise HTTPException(status_code=400, detail="Невірний формат Telegram ID")
-    
-    user = UserService.get_user_by_telegram_id(db, user_id)
+    user = user_identity_cache.get(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="Користувач не знайдений")
+    if user.is_active is False:
+        raise HTTPException(status_code=403, detail="Доступ заборонено")
     
     return user
 
 
+def get_user_from_request(request: Request, db: Session = Depends(get_db)) -> UserIdentity:
+    """Отримати користувача з токена сесії (без БД) або з initData"""
+    token = get_bearer_token(request)
+    if token:
+        try:
+            return UserIdentity.from_claims(decode_session_token(token))
+        except (SessionTokenError, KeyError, ValueError):
+            raise HTTPException(status_code=401, detail="Сесія застаріла")
+    
+    return get_user_from_init_data(request, db)
+
+
 def require_role(*allowed_roles: UserRole):
     """Декоратор для перевірки ролі користувача"""
     def role_checker(user = Depends(get_user_from_request)):
@@ -0,0 +1,274 @@
+"""Проміжні обробники (middleware) веб-додатку"""
+import json
+import math
+import zlib
+from typing import Dict, List, Optional, Tuple
+from starlette.concurrency import run_in_threadpool
+from app.config import settings
+from app.services.user_service import user_identity_cache
+from app.utils.metrics import API_REQUESTS_THROTTLED
+from app.utils.security import (
+    InitDataError,
+    MemoryRateLimitBackend,
+    RateLimiter,
+    SessionTokenError,
+    decode_session_token,
+    init_data_validator
+)
+
+try:
+    import brotli
+except ImportError:  # brotli необов'язковий - тоді лише gzip
+    brotli = None
+
+WRITE_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+EXEMPT_PATHS = {"/web/health", "/web/metrics"}
+
+
+def parse_quota(quota: str) -> Tuple[int, float]:
+    """"120/60" -> (120 запитів, 60 секунд)"""
+    limit, _, seconds = quota.partition("/")
+    return int(limit), float(seconds or 60)
+
+
+class RateLimitMiddleware:
+    """
+    Обмеження частоти запитів до /web/* за користувачем, роллю та класом маршруту.
+
+    Користувач визначається без звернення до БД: з токена сесії, з initData
+    (роль - з кешу користувачів, якщо вона там є) або за IP для анонімних запитів.
+    """
+
+    def __init__(self, app, quotas: Optional[Dict[str, str]] = None):
+        self.app = app
+        self.quotas = {key: parse_quota(value) for key, value in (quotas or settings.API_RATE_LIMITS).items()}
+        self._limiters: Dict[Tuple[str, str], Optional[RateLimiter]] = {}
+
+    @staticmethod
+    def route_class(method: str, path: str) -> str:
+        if any(path.startswith(prefix) for prefix in settings.API_ANALYTICS_PREFIXES):
+            return "analytics"
+        return "write" if method in WRITE_METHODS else "read"
+
+    @staticmethod
+    def identify(headers: Dict[str, str], client: Optional[Tuple[str, int]]) -> Tuple[str, str]:
+        """Повертає (ключ лімітера, роль)"""
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() == "bearer" and token:
+            try:
+                claims = decode_session_token(token.strip())
+                return f"user:{claims['sub']}", claims["role"]
+            except (SessionTokenError, KeyError):
+                pass
+
+        tg_data = headers.get("x-tg-data")
+        if tg_data:
+            try:
+                telegram_id = init_data_validator.validate(tg_data)
+                identity = user_identity_cache.peek(telegram_id)
+                return f"user:{telegram_id}", identity.role.value if identity else "unknown"
+            except InitDataError:
+                pass
+
+        return f"ip:{client[0] if client else 'unknown'}", "anonymous"
+
+    def limiter_for(self, role: str, route_class: str) -> Optional[RateLimiter]:
+        key = (role, route_class)
+        if key not in self._limiters:
+            quota = self.quotas.get(f"{role}:{route_class}") or self.quotas.get(route_class)
+            self._limiters[key] = RateLimiter(f"api:{role}:{route_class}", *quota) if quota else None
+        return self._limiters[key]
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] != "http"
+            or not settings.API_RATE_LIMIT_ENABLED
+            or not scope["path"].startswith("/web/")
+            or scope["path"] in EXEMPT_PATHS
+            or scope["method"] == "OPTIONS"
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        headers = {k.decode("latin-1"): v.decode("latin-1") for k, v in scope["headers"]}
+        key, role = self.identify(headers, scope.get("client"))
+        route_class = self.route_class(scope["method"], scope["path"])
+        limiter = self.limiter_for(role, route_class)
+        if limiter:
+            if isinstance(limiter.backend, MemoryRateLimitBackend):
+                allowed, retry_after = limiter.check(key)
+            else:
+                # Спільне сховище в БД - не блокуємо цикл подій
+                allowed, retry_after = await run_in_threadpool(limiter.check, key)
+            if not allowed:
+                API_REQUESTS_THROTTLED.inc(role=role, route_class=route_class)
+                await self._reject(send, retry_after)
+                return
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(send, retry_after: float) -> None:
+        body = json.dumps({"detail": "Забагато запитів. Спробуйте пізніше."}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 429,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                (b"retry-after", str(max(1, math.ceil(retry_after))).encode()),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+
+def parse_accept_encoding(header: str) -> Dict[str, float]:
+    """"gzip, br;q=0.8" -> {"gzip": 1.0, "br": 0.8}"""
+    encodings = {}
+    for part in header.split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        encodings[name.strip().lower()] = quality
+    return encodings
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Найкраще кодування, яке підтримують і клієнт, і сервер"""
+    accepted = parse_accept_encoding(accept_encoding)
+    if brotli is not None and accepted.get("br", 0) > 0:
+        return "br"
+    if accepted.get("gzip", 0) > 0:
+        return "gzip"
+    return None
+
+
+class _Compressor:
+    """Потоковий компресор gzip/brotli з однаковим інтерфейсом"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits 16+ - формат gzip
+            self._zlib = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._brotli:
+            return self._brotli.process(data)
+        return self._zlib.compress(data)
+
+    def flush(self) -> bytes:
+        if self._brotli:
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """
+    Стиснення відповідей gzip/brotli.
+
+    Стискаються лише типи з COMPRESSION_CONTENT_TYPES, не менші за COMPRESSION_MIN_SIZE
+    і ще не стиснені (напр. заздалегідь стиснута статика).
+    """
+
+    def __init__(self, app, minimum_size: Optional[int] = None, content_types: Optional[List[str]] = None):
+        self.app = app
+        self.minimum_size = settings.COMPRESSION_MIN_SIZE if minimum_size is None else minimum_size
+        self.content_types = tuple(content_types or settings.COMPRESSION_CONTENT_TYPES)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept = ""
+        for key, value in scope["headers"]:
+            if key == b"accept-encoding":
+                accept = value.decode("latin-1")
+                break
+        encoding = choose_encoding(accept)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(send, encoding, self.minimum_size, self.content_types)
+        await self.app(scope, receive, responder)
+
+
+class _CompressionResponder:
+    """Обгортка send: вирішує за першим шматком тіла, чи стискати відповідь"""
+
+    def __init__(self, send, encoding: str, minimum_size: int, content_types: Tuple[str, ...]):
+        self.send = send
+        self.encoding = encoding
+        self.minimum_size = minimum_size
+        self.content_types = content_types
+        self.start_message = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    def _is_compressible(self, headers: Dict[bytes, bytes]) -> bool:
+        if b"content-encoding" in headers:
+            return False
+        content_type = headers.get(b"content-type", b"").decode("latin-1").split(";")[0].strip().lower()
+        return content_type in self.content_types
+
+    async def __call__(self, message) -> None:
+        if message["type"] == "http.response.start":
+            self.start_message = message
+            headers = {k.lower(): v for k, v in message.get("headers", [])}
+            status = message["status"]
+            self.passthrough = status < 200 or status in (204, 304) or not self._is_compressible(headers)
+            if self.passthrough:
+                await self.send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            if not more_body and len(body) < self.minimum_size:
+                # Мала відповідь - відправляємо як є
+                self.passthrough = True
+                await self.send(self.start_message)
+                await self.send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding)
+            headers = [
+                (k, v) for k, v in self.start_message.get("headers", [])
+                if k.lower() not in (b"content-length", b"vary")
+            ]
+            vary = [v for k, v in self.start_message.get("headers", []) if k.lower() == b"vary"]
+            vary_value = b", ".join(vary + [b"Accept-Encoding"])
+            headers += [(b"content-encoding", self.encoding.encode()), (b"vary", vary_value)]
+
+            if not more_body:
+                # Усе тіло відоме - можна вказати точну довжину
+                compressed = self.compressor.compress(body) + self.compressor.flush()
+                headers.append((b"content-length", str(len(compressed)).encode()))
+                await self.send(dict(self.start_message, headers=headers))
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+
+            await self.send(dict(self.start_message, headers=headers))
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.flush()
+        if chunk or not more_body:
+            await self.send({"type": "http.response.body", "body": chunk, "more_body": more_body})
@@ -4,10 +4,11 @@ from app.database import get_db
 from app.services.analytics_service import AnalyticsService
 from app.web.dependencies import require_role
 from app.models.user import UserRole
+from app.schemas.analytics import AnalyticsDashboard
 
 router = APIRouter(prefix="/analyst", tags=["analyst"])
 
-@router.get("/dashboard")
+@router.get("/dashboard", response_model=AnalyticsDashboard)
 async def get_analytics(
     user = Depends(require_role(UserRole.ANALYST, UserRole.DIRECTOR)),
     db: Session = Depends(get_db)
@@ -1,13 +1,16 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from datetime import datetime
+from typing import Any, Dict
+import math
 from app.database import get_db
 from app.services.application_service import ApplicationService
 from app.services.interview_service import InterviewService
+from app.web.conditional import check_etag
 from app.web.dependencies import require_role
 from app.models.user import UserRole
-from app.schemas.application import ApplicationCreate
-from app.schemas.interview import InterviewConfirm
+from app.schemas.application import ApplicationCreate, CandidateApplicationList, CandidateCancelResult
+from app.schemas.interview import CandidateInterviewList, InterviewConfirm
 
 router = APIRouter(prefix="/candidate", tags=["candidate"])
 
@@ -20,10 +23,12 @@ async def create_application(
 ):
     """Create a new application"""
     from app.utils.security import application_limiter
-    if not application_limiter.is_allowed(str(user.id)):
+    allowed, retry_after = application_limiter.check(str(user.id))
+    if not allowed:
         raise HTTPException(
             status_code=429, 
-            detail="Ви вже надіслали заявку нещодавно. Будь ласка, зачекайте 5 хвилин."
+            detail="Ви вже надіслали заявку нещодавно. Будь ласка, зачекайте 5 хвилин.",
+            headers={"Retry-After": str(math.ceil(retry_after))}
         )
     
     application = ApplicationService.create_application(
@@ -38,7 +43,8 @@ async def create_application(
         request, 
         db, 
         application.full_name, 
-        application.position
+        application.position,
+        application_id=application.id
     )
     
     return {
@@ -48,14 +54,9 @@ async def create_application(
     }
 
 
-@router.get("/applications")
-async def get_my_applications(
-    user = Depends(require_role(UserRole.CANDIDATE)),
-    db: Session = Depends(get_db)
-):
-    """Get candidate's applications"""
-    
-    applications = ApplicationService.get_user_applications(db, user.id)
+def build_candidate_applications(db: Session, candidate_id: int) -> Dict[str, Any]:
+    """Candidate applications payload (shared with /web/bootstrap)"""
+    applications = ApplicationService.get_user_applications(db, candidate_id)
     
     return {
         "applications": [
@@ -63,7 +64,7 @@ async def get_my_applications(
                 "id": app.id,
                 "position": app.position,
                 "status": app.status,
-                "created_at": app.created_at.isoformat(),
+                "created_at": app.created_at,
                 "rejection_reason": app.rejection_reason
             }
             for app in applications
@@ -71,34 +72,29 @@ async def get_my_applications(
     }
 
 
-@router.get("/interviews")
-async def get_my_interviews(
-    user = Depends(require_role(UserRole.CANDIDATE)),
-    db: Session = Depends(get_db)
-):
-    """Get candidate's interviews"""
-    
-    interviews = InterviewService.get_candidate_interviews(db, user.id)
+def build_candidate_interviews(db: Session, candidate_id: int) -> Dict[str, Any]:
+    """Candidate interviews payload (shared with /web/bootstrap)"""
+    interviews = InterviewService.get_candidate_interviews(db, candidate_id)
     
     return {
         "interviews": [
             {
                 "id": interview.id,
                 "application_id": interview.application_id,
-                "interview_type": interview.interview_type.value,
-                "location_type": interview.location_type.value if interview.location_type else None,
+                "interview_type": interview.interview_type,
+                "location_type": interview.location_type,
                 "meet_link": interview.meet_link,
                 "address": interview.address,
                 "slots": [
                     {
                         "id": slot.id,
-                        "start_time": slot.start_time.isoformat(),
-                        "end_time": slot.end_time.isoformat(),
+                        "start_time": slot.start_time,
+                        "end_time": slot.end_time,
                         "is_booked": slot.is_booked
                     }
                     for slot in interview.slots
                 ],
-                "selected_time": interview.selected_time.isoformat() if interview.selected_time else None,
+                "selected_time": interview.selected_time,
                 "is_confirmed": interview.is_confirmed,
                 "notes": interview.notes
             }
@@ -107,6 +103,33 @@ async def get_my_interviews(
     }
 
 
+@router.get("/applications", response_model=CandidateApplicationList)
+async def get_my_applications(
+    request: Request,
+    response: Response,
+    user = Depends(require_role(UserRole.CANDIDATE)),
+    db: Session = Depends(get_db)
+):
+    """Get candidate's applications"""
+    not_modified = check_etag(
+        request, response, "candidate-list", user.id,
+        *ApplicationService.get_collection_version(db, candidate_id=user.id)
+    )
+    if not_modified:
+        return not_modified
+    
+    return build_candidate_applications(db, user.id)
+
+
+@router.get("/interviews", response_model=CandidateInterviewList)
+async def get_my_interviews(
+    user = Depends(require_role(UserRole.CANDIDATE)),
+    db: Session = Depends(get_db)
+):
+    """Get candidate's interviews"""
+    return build_candidate_interviews(db, user.id)
+
+
 @router.post("/interviews/select-slot")
 async def select_slot(
     request: Request,
@@ -135,7 +158,8 @@ async def select_slot(
                 interview.application.full_name,
                 interview.application.position,
                 datetime_str,
-                interview.interview_type.value
+                interview.interview_type.value,
+                interview_id=interview.id
             )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -146,7 +170,7 @@ async def select_slot(
     }
 
 
-@router.post("/application/{application_id}/cancel")
+@router.post("/application/{application_id}/cancel", response_model=CandidateCancelResult)
 async def cancel_application(
     application_id: int,
     user = Depends(require_role(UserRole.CANDIDATE)),
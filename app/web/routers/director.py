@@ -4,6 +4,8 @@ from typing import Dict, Any
 
 from app.database import get_db
 from app.services.user_service import UserService
+from app.services.broadcast_service import BroadcastService
+from app.utils.exceptions import BusinessError
 from app.web.dependencies import require_role, get_bot_username
 from app.models.user import User, UserRole
 
@@ -176,3 +178,59 @@ async def assign_role_by_id(
         raise HTTPException(status_code=400, detail="Failed to assign role")
         
     return {"success": True}
+
+
+@router.post("/broadcasts")
+async def create_broadcast(
+    data: Dict[str, Any],
+    user = Depends(require_role(UserRole.DIRECTOR)),
+    db: Session = Depends(get_db)
+):
+    """Start a broadcast to all candidates who applied for a position"""
+    position = (data.get("position") or "").strip()
+    message = (data.get("message") or "").strip()
+    statuses = data.get("statuses") or []
+    
+    if not position or not message:
+        raise HTTPException(status_code=400, detail="Position and message are required")
+    if len(message) > 4096:
+        raise HTTPException(status_code=400, detail="Message is too long")
+    
+    try:
+        job = BroadcastService.start_broadcast(db, position, message, user.id, statuses)
+    except BusinessError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {"success": True, "broadcast": job.to_dict()}
+
+
+@router.get("/broadcasts")
+async def list_broadcasts(
+    user = Depends(require_role(UserRole.DIRECTOR))
+):
+    """List recent broadcasts with progress"""
+    return {"broadcasts": [job.to_dict() for job in BroadcastService.list_jobs()]}
+
+
+@router.get("/broadcasts/{job_id}")
+async def get_broadcast(
+    job_id: str,
+    user = Depends(require_role(UserRole.DIRECTOR))
+):
+    """Get broadcast progress"""
+    job = BroadcastService.get_job(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Broadcast not found")
+    return {"broadcast": job.to_dict()}
+
+
+@router.post("/broadcasts/{job_id}/cancel")
+async def cancel_broadcast(
+    job_id: str,
+    user = Depends(require_role(UserRole.DIRECTOR))
+):
+    """Cancel a running broadcast"""
+    job = BroadcastService.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Broadcast not found")
+    return {"success": True, "broadcast": job.to_dict()}
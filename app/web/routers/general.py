@@ -1,7 +1,22 @@
-from fastapi import APIRouter, Depends
-from app.web.dependencies import get_user_from_request
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, HTTPException, Request
+from sqlalchemy.orm import Session
+from app.config import settings
+from app.database import get_db
+from app.models.user import UserRole
+from app.schemas.bootstrap import BootstrapResponse
+from app.services.skill_service import SkillService
+from app.services.user_service import UserIdentity, user_identity_cache
+from app.web.dependencies import get_bearer_token, get_user_from_init_data, get_user_from_request, require_role
+from app.web.routers.candidate import build_candidate_applications, build_candidate_interviews
+from app.web.routers.hr import build_hr_list
+from app.web.routers.interviewer import build_interviewer_dashboard
+from app.utils.metrics import registry
+from app.utils.security import REFRESH_TOKEN, SessionTokenError, create_session_token, decode_session_token
+from fastapi.responses import FileResponse, PlainTextResponse
 import os
+import secrets
+import time
+from typing import Optional
 
 api_router = APIRouter(tags=["general"])
 spa_router = APIRouter(tags=["spa"])
@@ -20,6 +35,24 @@ async def health():
     """Health check endpoint"""
     return {"status": "healthy"}
 
+@api_router.get("/metrics", response_class=PlainTextResponse)
+async def metrics(request: Request):
+    """
+    Prometheus metrics (notification delivery, queue depth, ...).
+    Requires `Authorization: Bearer <METRICS_TOKEN>`; without a token it is only open in development.
+    """
+    if not settings.METRICS_TOKEN:
+        if settings.ENVIRONMENT != "development":
+            raise HTTPException(status_code=404, detail="Not Found")
+    else:
+        auth = request.headers.get("Authorization", "")
+        # Bytes: compare_digest on str raises TypeError for non-ASCII header values
+        if not secrets.compare_digest(
+            auth.encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+        ):
+            raise HTTPException(status_code=401, detail="Не авторизовано")
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
 @api_router.get("/")
 async def root():
     """Root endpoint"""
@@ -29,11 +62,7 @@ async def root():
         "status": "running"
     }
 
-@api_router.get("/me")
-async def get_current_user_profile(
-    user = Depends(get_user_from_request)
-):
-    """Отримати профіль поточного користувача з роллю"""
+def _profile(user: UserIdentity) -> dict:
     return {
         "id": user.id,
         "telegram_id": user.telegram_id,
@@ -43,6 +72,91 @@ async def get_current_user_profile(
         "role": user.role.value
     }
 
+@api_router.get("/me")
+async def get_current_user_profile(
+    user = Depends(get_user_from_request)
+):
+    """Отримати профіль поточного користувача з роллю"""
+    return _profile(user)
+
+def _session_response(user: UserIdentity, session_started: Optional[int] = None) -> dict:
+    started = session_started or int(time.time())
+    token, expires_in = create_session_token(user.to_claims(), session_started=started)
+    refresh_token, refresh_expires_in = create_session_token(
+        {"sub": str(user.telegram_id)}, REFRESH_TOKEN, session_started=started
+    )
+    return {
+        "token": token,
+        "token_type": "bearer",
+        "expires_in": expires_in,
+        "refresh_token": refresh_token,
+        "refresh_expires_in": refresh_expires_in,
+        "role": user.role.value
+    }
+
+@api_router.post("/session")
+async def create_session(
+    user = Depends(get_user_from_init_data)
+):
+    """Exchange verified Telegram initData for a short-lived session token and a refresh token"""
+    return _session_response(user)
+
+@api_router.post("/session/refresh")
+async def refresh_session(
+    request: Request,
+    db: Session = Depends(get_db)
+):
+    """
+    Exchange a refresh token (Bearer) for a new session token with the user's current role.
+    The original login time is kept, so after SESSION_MAX_AGE_SECONDS the client must
+    open a new session with fresh initData.
+    """
+    try:
+        claims = decode_session_token(get_bearer_token(request), REFRESH_TOKEN)
+        telegram_id = int(claims["sub"])
+    except (SessionTokenError, KeyError, ValueError):
+        raise HTTPException(status_code=401, detail="Сесія застаріла")
+    
+    user = user_identity_cache.get(db, telegram_id)
+    if not user or user.is_active is False:
+        raise HTTPException(status_code=401, detail="Сесія застаріла")
+    return _session_response(user, session_started=claims["sat"])
+
+@api_router.get("/skills")
+async def list_skills(
+    q: Optional[str] = None,
+    limit: int = 50,
+    user = Depends(require_role(UserRole.HR, UserRole.INTERVIEWER)),
+    db: Session = Depends(get_db)
+):
+    """Skill dictionary for filters (most common first, optional prefix `q`)"""
+    return {"skills": SkillService.list_skills(db, q, max(1, min(limit, 200)))}
+
+@api_router.get("/bootstrap", response_model=BootstrapResponse)
+async def bootstrap(
+    request: Request,
+    user = Depends(get_user_from_request),
+    db: Session = Depends(get_db)
+):
+    """
+    WebApp startup in one round trip: profile, a session token (when called with
+    initData) and the first page of the role's dashboard.
+    """
+    result = {"profile": _profile(user)}
+    if not get_bearer_token(request):
+        result["session"] = _session_response(user)
+    
+    if user.role == UserRole.HR:
+        result["hr"] = build_hr_list(db, user.id, status="pending")
+    elif user.role == UserRole.INTERVIEWER:
+        result["interviewer"] = build_interviewer_dashboard(db, user.id)
+    elif user.role == UserRole.CANDIDATE:
+        result["candidate"] = {
+            **build_candidate_applications(db, user.id),
+            **build_candidate_interviews(db, user.id)
+        }
+    return result
+
 # SPA Routes - Serve index.html for all frontend routes
 @spa_router.get("/candidate/application", response_class=FileResponse)
 async def candidate_application_page():
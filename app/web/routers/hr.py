@@ -1,36 +1,70 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 from typing import Optional, Dict, Any
+from datetime import datetime
 
+from app.config import settings
 from app.database import get_db
 from app.models.user import UserRole
 from app.services.application_service import ApplicationService
 from app.services.interview_service import InterviewService
 from app.services.notification_service import NotificationService
+from app.services.search_service import SearchService
+from app.services.similarity_service import SimilarityService
+from app.services.skill_service import SkillService, parse_skill_filter
+from app.services.subscription_service import SubscriptionService
 from app.models.interview import InterviewType, LocationType
+from app.utils.exceptions import BusinessError
+from app.schemas.application import (
+    ApplicationSearchResult,
+    ApplicationStatusChange,
+    CandidateAutocomplete,
+    HRApplicationDetail,
+    HRApplicationList,
+    SimilarApplications
+)
+from app.web.conditional import check_etag
 from app.web.dependencies import require_role
+from app.web.sync import encode_cursor, parse_since
 
 router = APIRouter(prefix="/hr", tags=["hr"])
 
-@router.get("/applications")
-async def get_hr_applications(
+def build_hr_list(
+    db: Session,
+    hr_id: int,
     status: Optional[str] = None,
-    user = Depends(require_role(UserRole.HR)),
-    db: Session = Depends(get_db)
-):
-    """Get applications for HR"""
+    updated_since: Optional[datetime] = None,
+    skill_filter=None
+) -> Dict[str, Any]:
+    """HR list payload (shared with /web/bootstrap)"""
+    # Read the cursor first: anything committed later is picked up by the next poll
+    cursor = ApplicationService.get_sync_cursor(db)
     
+    # Only the columns a list card needs - the large text fields are served by the detail endpoint
     if status:
-        applications = ApplicationService.get_all_applications(db, status=status, hr_id=user.id)
+        applications = ApplicationService.get_application_rows(
+            db, ApplicationService.HR_LIST_COLUMNS, status=status, hr_id=hr_id, updated_since=updated_since,
+            skill_filter=skill_filter, with_screening=True
+        )
     else:
         # For 'pending' (Inbox), we don't pass hr_id because anyone can claim
-        applications = ApplicationService.get_all_applications(db, status="pending")
+        applications = ApplicationService.get_application_rows(
+            db, ApplicationService.HR_LIST_COLUMNS, status="pending", updated_since=updated_since,
+            skill_filter=skill_filter, with_screening=True
+        )
+    
+    removed = []
+    if updated_since is not None:
+        in_tab = {app.id for app in applications}
+        removed = [app_id for app_id in ApplicationService.get_changed_ids(db, updated_since) if app_id not in in_tab]
     
     # Get counts for tabs - filtered by ownership
-    counts = ApplicationService.get_status_counts(db, hr_id=user.id)
+    counts = ApplicationService.get_status_counts(db, hr_id=hr_id)
     
     return {
         "counts": counts,
+        "cursor": encode_cursor(cursor),
+        "removed": removed,
         "applications": [
             {
                 "id": app.id,
@@ -41,32 +75,146 @@ async def get_hr_applications(
                 "experience_years": app.experience_years,
                 "skills": app.skills,
                 "english_level": app.english_level,
-                "education": app.education,
-                "previous_work": app.previous_work,
                 "portfolio_url": app.portfolio_url,
-                "additional_info": app.additional_info,
                 "status": app.status,
-                "created_at": app.created_at.isoformat(),
-                "screening_info": next((
-                    {
-                        "has_selected_time": i.selected_time is not None
-                    }
-                    for i in app.interviews
-                    if i.interview_type == InterviewType.HR_SCREENING
-                ), None)
+                "created_at": app.created_at,
+                "duplicate_of_id": app.duplicate_of_id,
+                "screening_info": {
+                    "has_selected_time": bool(app.screening_selected)
+                } if app.screening_selected is not None else None
             }
             for app in applications
         ]
     }
 
 
-@router.get("/applications/{application_id}")
+@router.get("/applications", response_model=HRApplicationList)
+async def get_hr_applications(
+    request: Request,
+    response: Response,
+    status: Optional[str] = None,
+    since: Optional[str] = None,
+    skills: Optional[str] = None,
+    user = Depends(require_role(UserRole.HR)),
+    db: Session = Depends(get_db)
+):
+    """
+    Get applications for HR.
+    With `since` (the `cursor` of a previous response) only rows changed after it are
+    returned, and `removed` lists changed rows that no longer belong to the tab.
+    `skills` narrows the list to candidates having all skills, e.g. `python:3,django`
+    (Python with at least 3 years and Django).
+    """
+    updated_since = parse_since(since)
+    try:
+        skill_filter = SkillService.build_filter(db, parse_skill_filter(skills))
+    except BusinessError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    # Tab counters depend on every application, so any change invalidates the list
+    not_modified = check_etag(
+        request, response, "hr-list", user.id, status, since, skills,
+        *ApplicationService.get_collection_version(db)
+    )
+    if not_modified:
+        return not_modified
+    
+    return build_hr_list(db, user.id, status, updated_since, skill_filter)
+
+
+@router.get("/applications/search", response_model=ApplicationSearchResult)
+async def search_applications(
+    q: str,
+    status: Optional[str] = None,
+    sort: str = "rank",
+    cursor: Optional[str] = None,
+    limit: int = 20,
+    user = Depends(require_role(UserRole.HR)),
+    db: Session = Depends(get_db)
+):
+    """
+    Full-text search over name, email, position, skills and experience.
+    Results are ranked (or newest first with sort=recent) and paginated by `next_cursor`.
+    """
+    q = q.strip()
+    if len(q) < 2:
+        raise HTTPException(status_code=400, detail="Query must be at least 2 characters")
+    
+    try:
+        result = SearchService.search_applications(
+            db, q, limit=max(1, min(limit, 100)), cursor=cursor, status=status, sort=sort
+        )
+    except BusinessError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    return {
+        "items": [
+            {
+                "id": row["application"].id,
+                "candidate_name": row["application"].full_name,
+                "email": row["application"].email,
+                "position": row["application"].position,
+                "status": row["application"].status,
+                "created_at": row["application"].created_at,
+                "rank": row["rank"],
+                "highlight": row["highlight"]
+            }
+            for row in result["items"]
+        ],
+        "next_cursor": result["next_cursor"]
+    }
+
+
+@router.get("/candidates/autocomplete", response_model=CandidateAutocomplete)
+async def autocomplete_candidates(
+    q: str,
+    limit: Optional[int] = None,
+    user = Depends(require_role(UserRole.HR)),
+    db: Session = Depends(get_db)
+):
+    """Typo-tolerant suggestions by part of a candidate's name, email or phone"""
+    q = q.strip()
+    if len(q) < 2:
+        return {"query": q, "items": []}
+    
+    limit = max(1, min(limit or settings.AUTOCOMPLETE_LIMIT, 20))
+    return {"query": q, "items": SearchService.autocomplete_candidates(db, q, limit)}
+
+
+@router.get("/applications/{application_id}/similar", response_model=SimilarApplications)
+async def get_similar_applications(
+    application_id: int,
+    limit: int = 10,
+    user = Depends(require_role(UserRole.HR)),
+    db: Session = Depends(get_db)
+):
+    """Past candidates with similar skills, position and experience (any status, including rejected)"""
+    application = ApplicationService.get_application(db, application_id)
+    if not application:
+        raise HTTPException(status_code=404, detail="Application not found")
+    
+    return {
+        "application_id": application_id,
+        "items": SimilarityService.find_similar(db, application, max(1, min(limit, 50)))
+    }
+
+
+@router.get("/applications/{application_id}", response_model=HRApplicationDetail)
 async def get_application_detail(
+    request: Request,
+    response: Response,
     application_id: int,
     user = Depends(require_role(UserRole.HR)),
     db: Session = Depends(get_db)
 ):
     """Get application details"""
+    version = ApplicationService.get_version(db, application_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+    
+    not_modified = check_etag(request, response, "hr-detail", application_id, version)
+    if not_modified:
+        return not_modified
     
     application = ApplicationService.get_application(db, application_id)
     if not application:
@@ -88,7 +236,8 @@ async def get_application_detail(
         "status": application.status,
         "rejection_reason": application.rejection_reason,
         "tech_interviewer_name": application.tech_interviewer.full_name if application.tech_interviewer else None,
-        "created_at": application.created_at.isoformat(),
+        "created_at": application.created_at,
+        "duplicate_of_id": application.duplicate_of_id,
         "feedbacks": [
             {
                 "interviewer_name": f.interviewer.full_name,
@@ -96,25 +245,25 @@ async def get_application_detail(
                 "pros": f.pros,
                 "cons": f.cons,
                 "summary": f.summary,
-                "created_at": f.created_at.isoformat()
+                "created_at": f.created_at
             }
             for f in application.feedbacks
         ] if application.feedbacks else [],
         "interviews": [
             {
                 "id": i.id,
-                "type": i.interview_type.value,
-                "location": i.location_type.value if i.location_type else None,
+                "type": i.interview_type,
+                "location": i.location_type,
                 "slots": [
                     {
                         "id": s.id,
-                        "start_time": s.start_time.isoformat(),
-                        "end_time": s.end_time.isoformat(),
+                        "start_time": s.start_time,
+                        "end_time": s.end_time,
                         "is_booked": s.is_booked
                     }
                     for s in i.slots
                 ],
-                "selected_time": i.selected_time.isoformat() if i.selected_time else None,
+                "selected_time": i.selected_time,
                 "confirmed": i.is_confirmed,
                 "link": i.meet_link,
                 "address": i.address
@@ -124,7 +273,7 @@ async def get_application_detail(
     }
 
 
-@router.post("/applications/{application_id}/accept")
+@router.post("/applications/{application_id}/accept", response_model=ApplicationStatusChange)
 async def accept_application_endpoint(
     request: Request,
     application_id: int,
@@ -140,7 +289,8 @@ async def accept_application_endpoint(
     await NotificationService.notify_application_accepted(
         request,
         application.candidate.telegram_id,
-        application.position
+        application.position,
+        application_id=application.id
     )
 
     # Notify other HRs that this application is taken
@@ -150,7 +300,8 @@ async def accept_application_endpoint(
         db,
         hr_name,
         application.full_name,
-        application.position
+        application.position,
+        application_id=application.id
     )
     
     return {
@@ -163,7 +314,7 @@ async def accept_application_endpoint(
     }
 
 
-@router.post("/applications/{application_id}/reject")
+@router.post("/applications/{application_id}/reject", response_model=ApplicationStatusChange)
 async def reject_application_endpoint(
     request: Request,
     application_id: int,
@@ -186,7 +337,8 @@ async def reject_application_endpoint(
         application.candidate.telegram_id,
         application.position,
         "rejected",
-        reason
+        reason,
+        application_id=application.id
     )
     return {
         "success": True,
@@ -198,7 +350,7 @@ async def reject_application_endpoint(
     }
 
 
-@router.post("/applications/{application_id}/hire")
+@router.post("/applications/{application_id}/hire", response_model=ApplicationStatusChange)
 async def hire_candidate_endpoint(
     request: Request,
     application_id: int,
@@ -215,7 +367,8 @@ async def hire_candidate_endpoint(
         request,
         application.candidate.telegram_id,
         application.position,
-        "hired"
+        "hired",
+        application_id=application.id
     )
     
     return {
@@ -277,7 +430,8 @@ async def start_screening(
             "hr_screening",
             slots,
             location_type or "online",
-            details
+            details,
+            interview_id=interview.id
         )
     
     return {"success": True, "interview_id": interview.id}
@@ -315,7 +469,8 @@ async def finalize_screening(
                 "hr_screening",
                 datetime_str,
                 location_type,
-                details or {}
+                details or {},
+                interview_id=interview.id
             )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -349,7 +504,8 @@ async def move_to_tech(
                 request,
                 interviewer.telegram_id,
                 app.full_name,
-                app.position
+                app.position,
+                application_id=application_id
             )
     elif mode == "pool":
         ApplicationService.move_to_tech_pool(db, application_id)
@@ -391,3 +547,27 @@ async def get_interviewers(
             for u in interviewers
         ]
     }
+
+
+@router.get("/subscriptions")
+async def get_subscriptions(
+    user = Depends(require_role(UserRole.HR)),
+    db: Session = Depends(get_db)
+):
+    """Get positions the HR is subscribed to (empty = all positions)"""
+    return {"positions": SubscriptionService.get_user_positions(db, user.id)}
+
+
+@router.post("/subscriptions")
+async def update_subscriptions(
+    data: Dict[str, Any],
+    user = Depends(require_role(UserRole.HR)),
+    db: Session = Depends(get_db)
+):
+    """Replace position subscriptions used for notification routing"""
+    positions = data.get("positions")
+    if not isinstance(positions, list) or not all(isinstance(p, str) for p in positions):
+        raise HTTPException(status_code=400, detail="Positions must be a list of strings")
+    
+    positions = SubscriptionService.set_user_positions(db, user.id, positions)
+    return {"success": True, "positions": positions}
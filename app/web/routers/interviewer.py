@@ -1,36 +1,59 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import traceback
+from datetime import datetime
 
 from app.database import get_db
 from app.services.interviewer_service import InterviewerService
 from app.services.application_service import ApplicationService
 from app.services.interview_service import InterviewService
 from app.services.notification_service import NotificationService
+from app.services.match_service import MatchService, parse_english_level
+from app.services.skill_service import SkillService, parse_skill_filter
+from app.web.conditional import check_etag
 from app.web.dependencies import require_role
+from app.web.sync import encode_cursor, parse_since
 from app.models.user import UserRole
 from app.models.interview import Interview, InterviewType, LocationType
 from app.models.application import Application, ApplicationStatus
+from app.utils.exceptions import BusinessError
+from app.schemas.application import (
+    InterviewerApplicationDetail,
+    InterviewerDashboard,
+    InterviewerFeedback,
+    PoolApplicationList
+)
 
 router = APIRouter(prefix="/interviewer", tags=["interviewer"])
 
-@router.get("/applications")
-async def get_dashboard_data(
-    user = Depends(require_role(UserRole.INTERVIEWER)),
-    db: Session = Depends(get_db)
-):
-    """Get dashboard data: assigned applications and pool"""
+def build_interviewer_dashboard(
+    db: Session,
+    interviewer_id: int,
+    updated_since: Optional[datetime] = None
+) -> Dict[str, Any]:
+    """Interviewer dashboard payload (shared with /web/bootstrap)"""
+    cursor = ApplicationService.get_sync_cursor(db)
+    
     # My Candidates: tech_interviewer_id == current_user.id (actively processing)
-    # Filter them to exclude archived ones for the main "My Candidates" list if needed, 
-    # but based on current logic let's keep it simple.
-    assigned = ApplicationService.get_all_applications(db, interviewer_id=user.id)
+    assigned = ApplicationService.get_application_rows(
+        db, ApplicationService.INTERVIEWER_LIST_COLUMNS, interviewer_id=interviewer_id, updated_since=updated_since
+    )
     
-    # Archive: HIRED/REJECTED/CANCELLED where tech_interviewer_id == user.id
-    archive = ApplicationService.get_all_applications(db, status="archive", interviewer_id=user.id)
+    # Archive: HIRED/REJECTED/CANCELLED where tech_interviewer_id == user.id - a subset of assigned
+    archive_statuses = ApplicationService.STATUS_GROUPS["archive"]
+    archive = [app for app in assigned if app.status in archive_statuses]
     
     # Pool: tech_pending AND tech_interviewer_id is None
-    pool = ApplicationService.get_all_applications(db, status="pool", interviewer_id=user.id)
+    pool = ApplicationService.get_application_rows(
+        db, ApplicationService.INTERVIEWER_LIST_COLUMNS, status="pool", interviewer_id=interviewer_id,
+        updated_since=updated_since
+    )
+    
+    removed = []
+    if updated_since is not None:
+        listed = {app.id for app in assigned} | {app.id for app in pool}
+        removed = [app_id for app_id in ApplicationService.get_changed_ids(db, updated_since) if app_id not in listed]
     
     def serialize(app):
         return {
@@ -41,17 +64,45 @@ async def get_dashboard_data(
             "experience_years": app.experience_years,
             "skills": app.skills,
             "english_level": app.english_level,
-            "created_at": app.created_at.isoformat(),
+            "created_at": app.created_at,
             "tech_interviewer_id": app.tech_interviewer_id
         }
 
     return {
-        "my_candidates": [serialize(app) for app in assigned if app.status not in ApplicationService.STATUS_GROUPS["archive"]],
+        "my_candidates": [serialize(app) for app in assigned if app.status not in archive_statuses],
         "archive": [serialize(app) for app in archive],
-        "pool": [serialize(app) for app in pool]
+        "pool": [serialize(app) for app in pool],
+        "cursor": encode_cursor(cursor),
+        "removed": removed
     }
 
-@router.get("/applications/{application_id}")
+
+@router.get("/applications", response_model=InterviewerDashboard)
+async def get_dashboard_data(
+    request: Request,
+    response: Response,
+    since: Optional[str] = None,
+    user = Depends(require_role(UserRole.INTERVIEWER)),
+    db: Session = Depends(get_db)
+):
+    """
+    Get dashboard data: assigned applications and pool.
+    With `since` only changed rows are returned; a changed row is listed in the section
+    it belongs to now (drop it from the others), or in `removed` if it left all of them.
+    """
+    updated_since = parse_since(since)
+    
+    # The pool is shared between interviewers, so fingerprint the whole table
+    not_modified = check_etag(
+        request, response, "interviewer-list", user.id, since,
+        *ApplicationService.get_collection_version(db)
+    )
+    if not_modified:
+        return not_modified
+    
+    return build_interviewer_dashboard(db, user.id, updated_since)
+
+@router.get("/applications/{application_id}", response_model=InterviewerApplicationDetail)
 async def get_application_detail(
     application_id: int,
     user = Depends(require_role(UserRole.INTERVIEWER)),
@@ -80,9 +131,9 @@ async def get_application_detail(
     if interview:
         interview_data = {
             "id": interview.id,
-            "selected_time": interview.selected_time.isoformat() if interview.selected_time else None,
+            "selected_time": interview.selected_time,
             "is_confirmed": interview.is_confirmed,
-            "location_type": interview.location_type.value if interview.location_type else None,
+            "location_type": interview.location_type,
             "link": interview.meet_link,
             "address": interview.address
         }
@@ -101,7 +152,7 @@ async def get_application_detail(
         "portfolio_url": app.portfolio_url,
         "additional_info": app.additional_info,
         "status": app.status,
-        "created_at": app.created_at.isoformat(),
+        "created_at": app.created_at,
         "tech_interviewer_id": app.tech_interviewer_id,
         "tech_interviewer_name": app.tech_interviewer.full_name if app.tech_interviewer else None,
         "feedbacks": [
@@ -111,14 +162,14 @@ async def get_application_detail(
                 "pros": f.pros,
                 "cons": f.cons,
                 "summary": f.summary,
-                "created_at": f.created_at.isoformat()
+                "created_at": f.created_at
             }
             for f in app.feedbacks
         ] if app.feedbacks else [],
         "active_interview": interview_data
     }
 
-@router.get("/applications/{application_id}/feedback")
+@router.get("/applications/{application_id}/feedback", response_model=InterviewerFeedback)
 async def get_feedback(
     application_id: int,
     user = Depends(require_role(UserRole.INTERVIEWER)),
@@ -191,32 +242,61 @@ async def claim_application(
         db,
         interviewer_name,
         app.full_name,
-        app.position
+        app.position,
+        application_id=app.id
     )
     
     return {"success": True, "message": "Application claimed"}
 
-@router.get("/pool")
+@router.get("/pool", response_model=PoolApplicationList)
 async def get_pool_applications(
+    skills: Optional[str] = None,
+    sort: str = "created",
+    english: Optional[str] = None,
+    experience: Optional[float] = Query(None, ge=0, le=70),
+    limit: int = Query(100, ge=1, le=1000),
     user = Depends(require_role(UserRole.INTERVIEWER)),
     db: Session = Depends(get_db)
 ):
-    """Get unassigned applications in the tech pool"""
-    apps = db.query(Application).filter(
+    """
+    Get unassigned applications in the tech pool (at most `limit`).
+
+    `skills` (e.g. `python:3,django`) filters the pool. With `sort=match` it describes the
+    position profile instead: together with `english` (e.g. `B2`) and `experience` (years)
+    it ranks the whole pool by match score, so partial matches are kept but ranked lower.
+    """
+    if sort not in ("created", "match"):
+        raise HTTPException(status_code=400, detail="Invalid sort")
+    
+    # Only the card columns - the long text fields are not part of the response
+    query = db.query(*ApplicationService.POOL_LIST_COLUMNS).filter(
         Application.status == ApplicationStatus.TECH_PENDING,
         Application.tech_interviewer_id == None
-    ).order_by(Application.created_at.asc()).all()
+    )
+    try:
+        if sort == "match":
+            rows = MatchService.rank(
+                db, query, parse_skill_filter(skills), parse_english_level(english), experience, limit
+            )
+        else:
+            skill_filter = SkillService.build_filter(db, parse_skill_filter(skills))
+            if skill_filter is not None:
+                query = query.filter(skill_filter)
+            rows = MatchService.rank(db, query, [], limit=limit)
+    except BusinessError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return {
         "applications": [
             {
-                "id": app.id,
-                "candidate_name": app.full_name,
-                "position": app.position,
-                "status": app.status,
-                "created_at": app.created_at.isoformat(),
+                "id": row.id,
+                "candidate_name": row.full_name,
+                "position": row.position,
+                "status": row.status,
+                "created_at": row.created_at,
+                "match_score": round(float(row.match_score), 4) if row.match_score is not None else None,
             }
-            for app in apps
+            for row in rows
         ]
     }
 
@@ -298,7 +378,8 @@ async def schedule_interview(
                 "technical",
                 slots,
                 location_type or "online",
-                details
+                details,
+                interview_id=interview.id
             )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -351,7 +432,8 @@ async def finalize_interview(
                 "technical",
                 datetime_str,
                 location_type,
-                details or {}
+                details or {},
+                interview_id=interview.id
             )
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
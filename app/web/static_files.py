@@ -0,0 +1,44 @@
+"""Роздача статики фронтенду із заздалегідь стиснутими варіантами (.br, .gz)"""
+import mimetypes
+import stat
+
+import anyio
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+
+from app.web.middleware import parse_accept_encoding
+
+# Розширення файлів, що створює scripts/precompress_static.py
+PRECOMPRESSED_VARIANTS = (("br", ".br"), ("gzip", ".gz"))
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Якщо поруч з файлом є app.js.br / app.js.gz і клієнт їх приймає,
+    віддаємо стиснутий варіант без стиснення на кожен запит.
+    """
+
+    async def get_response(self, path: str, scope) -> Response:
+        if scope["method"] in ("GET", "HEAD"):
+            accept = ""
+            for key, value in scope["headers"]:
+                if key == b"accept-encoding":
+                    accept = value.decode("latin-1")
+                    break
+            accepted = parse_accept_encoding(accept)
+
+            for encoding, extension in PRECOMPRESSED_VARIANTS:
+                if accepted.get(encoding, 0) <= 0:
+                    continue
+                full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + extension)
+                if stat_result and stat.S_ISREG(stat_result.st_mode):
+                    response = self.file_response(full_path, stat_result, scope)
+                    media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+                    if media_type.startswith("text/") or media_type == "application/javascript":
+                        media_type += "; charset=utf-8"
+                    response.headers["content-type"] = media_type
+                    response.headers["content-encoding"] = encoding
+                    response.headers["vary"] = "Accept-Encoding"
+                    return response
+
+        return await super().get_response(path, scope)
@@ -0,0 +1,45 @@
+"""Курсори дельта-синхронізації списків (?since=<cursor>)"""
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from fastapi import HTTPException
+from app.config import settings
+
+
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def encode_cursor(value: Optional[datetime]) -> Optional[str]:
+    """
+    Курсор - час останньої зміни в БД (годинник БД, а не сервера) у мікросекундах від epoch.
+    Лише цифри: isoformat з "+00:00" без percent-encoding у ?since= перетворюється на пробіл.
+    """
+    if not value:
+        return None
+    if value.tzinfo is None:
+        # SQLite зберігає CURRENT_TIMESTAMP без зони - це UTC
+        value = value.replace(tzinfo=timezone.utc)
+    return str((value - EPOCH) // timedelta(microseconds=1))
+
+
+def decode_cursor(cursor: str) -> datetime:
+    """Курсор -> datetime (UTC); ValueError, якщо курсор пошкоджений"""
+    if cursor.isdigit():
+        return EPOCH + timedelta(microseconds=int(cursor))
+    # Курсори попереднього формату (isoformat), "+" міг прийти як пробіл
+    return datetime.fromisoformat(cursor.replace(" ", "+"))
+
+
+def parse_since(since: Optional[str]) -> Optional[datetime]:
+    """
+    Межа для фільтра updated_at > межа.
+    Зсуваємо курсор назад на SYNC_CURSOR_OVERLAP_SECONDS: updated_at береться
+    на початку транзакції, тож пізно закомічений рядок може мати час, менший за курсор.
+    Клієнт отримає такі рядки повторно - оновлення за ID ідемпотентне.
+    """
+    if not since:
+        return None
+    try:
+        value = decode_cursor(since)
+    except (ValueError, OverflowError):
+        raise HTTPException(status_code=400, detail="Invalid sync cursor")
+    return value - timedelta(seconds=settings.SYNC_CURSOR_OVERLAP_SECONDS)
@@ -1,5 +1,6 @@
 """Скрипт для зміни ролі користувача"""
 import sys
+from app.config import settings
 from app.database import SessionLocal
 from app.models.user import User, UserRole
 from app.services.user_service import UserService
@@ -28,14 +29,15 @@ def change_user_role(telegram_id: int, new_role: str):
             return False
         
         old_role = user.role.value
-        user.role = role_map[new_role.lower()]
-        db.commit()
+        UserService.assign_role(db, user.id, role_map[new_role.lower()])
+        db.refresh(user)
         
         print(f"✅ Роль змінено!")
         print(f"   Telegram ID: {telegram_id}")
         print(f"   Ім'я: {user.first_name or user.username or 'Невідомо'}")
         print(f"   Стара роль: {old_role}")
         print(f"   Нова роль: {user.role.value}")
+        print(f"   Запущений сервер застосує зміну протягом {settings.USER_CACHE_TTL_SECONDS} с")
         return True
         
     except Exception as e:
@@ -2,7 +2,7 @@ import { useState, useEffect } from 'react';
 import { BrowserRouter, Routes, Route, Navigate } from 'react-router-dom';
 import { Layout } from './components/Layout';
 import { ProtectedRoute } from './components/ProtectedRoute';
-import { api } from './services/api';
+import { bootstrap } from './services/api';
 import { CandidateForm } from './views/CandidateForm';
 import { WaitingView } from './views/WaitingView';
 import { HRDashboard } from './views/HRDashboard';
@@ -20,8 +20,8 @@ function App() {
   useEffect(() => {
     const fetchUser = async () => {
       try {
-        const profile = await api.get('/me');
-        setUserProfile(profile);
+        const data = await bootstrap();
+        setUserProfile(data.profile);
       } catch (err) {
         console.error('Failed to fetch user profile', err);
       } finally {
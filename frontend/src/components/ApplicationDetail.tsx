@@ -14,10 +14,11 @@ interface ApplicationDetailProps {
     id: number;
     onClose: () => void;
     onUpdate: (newTab?: string) => void;
+    onOpen?: (id: number) => void;
     role?: 'hr' | 'interviewer';
 }
 
-export const ApplicationDetail: React.FC<ApplicationDetailProps> = ({ id, onClose, onUpdate, role = 'hr' }) => {
+export const ApplicationDetail: React.FC<ApplicationDetailProps> = ({ id, onClose, onUpdate, onOpen, role = 'hr' }) => {
     const [application, setApplication] = useState<any>(null);
     const [loading, setLoading] = useState(true);
     const [showSlotPicker, setShowSlotPicker] = useState(false);
@@ -279,6 +280,15 @@ export const ApplicationDetail: React.FC<ApplicationDetailProps> = ({ id, onClos
                     <div className="space-y-0.5">
                         <h2 className="text-lg font-extrabold text-white leading-tight">{application.candidate_name}</h2>
                         <p className="text-primary font-bold tracking-widest uppercase text-[9px] opacity-80">{application.position}</p>
+                        {application.duplicate_of_id && (
+                            <button
+                                onClick={() => onOpen?.(application.duplicate_of_id)}
+                                disabled={!onOpen}
+                                className="text-[10px] font-bold text-amber-400 hover:underline disabled:no-underline"
+                            >
+                                Можливий дублікат #{application.duplicate_of_id}
+                            </button>
+                        )}
                     </div>
                     <button
                         onClick={onClose}
@@ -1,11 +1,58 @@
 export const API_BASE = import.meta.env.VITE_API_URL || '/web';
 
-async function request(path: string, options: RequestInit = {}) {
+type Session = { token: string; expiresAt: number; refreshToken: string };
+
+let session: Session | null = null;
+let pendingSession: Promise<string | null> | null = null;
+
+async function openSession(): Promise<string | null> {
+    const tg = window.Telegram?.WebApp;
+    try {
+        let response: Response | null = null;
+        if (session) {
+            response = await fetch(`${API_BASE}/session/refresh`, {
+                method: 'POST',
+                headers: { 'Authorization': `Bearer ${session.refreshToken}` },
+            });
+        }
+        if (!response?.ok) {
+            response = await fetch(`${API_BASE}/session`, {
+                method: 'POST',
+                headers: { 'X-TG-Data': tg?.initData || '' },
+            });
+        }
+        if (!response.ok) {
+            session = null;
+            return null;
+        }
+        const data = await response.json();
+        session = { token: data.token, expiresAt: Date.now() + data.expires_in * 1000, refreshToken: data.refresh_token };
+        return session.token;
+    } catch {
+        session = null;
+        return null;
+    }
+}
+
+async function getSessionToken(): Promise<string | null> {
+    // Refresh a little before expiry so in-flight requests don't race it
+    if (session && Date.now() < session.expiresAt - 30_000) return session.token;
+    if (!pendingSession) {
+        pendingSession = openSession().finally(() => {
+            pendingSession = null;
+        });
+    }
+    return pendingSession;
+}
+
+async function request(path: string, options: RequestInit = {}, retry = true): Promise<any> {
     const tg = window.Telegram?.WebApp;
+    const token = await getSessionToken();
     const headers = {
         'Content-Type': 'application/json',
         'X-TG-Data': tg?.initData || '',
         'X-Telegram-User-Id': tg?.initDataUnsafe?.user?.id?.toString() || '',
+        ...(token ? { 'Authorization': `Bearer ${token}` } : {}),
         ...options.headers,
     };
 
@@ -14,6 +61,12 @@ async function request(path: string, options: RequestInit = {}) {
         headers,
     });
 
+    if (response.status === 401 && token && retry) {
+        // Token was rejected (e.g. secret rotated) - start a new session once
+        session = null;
+        return request(path, options, false);
+    }
+
     if (!response.ok) {
         const error = await response.json().catch(() => ({ detail: 'API Error' }));
         throw new Error(error.detail || 'Something went wrong');
@@ -23,6 +76,43 @@ async function request(path: string, options: RequestInit = {}) {
     return response.json();
 }
 
+let bootstrapData: any = null;
+
+// One request on startup: profile, session token and the first page of the role dashboard
+export async function bootstrap(): Promise<any> {
+    const tg = window.Telegram?.WebApp;
+    const token = session && Date.now() < session.expiresAt - 30_000 ? session.token : null;
+    const response = await fetch(`${API_BASE}/bootstrap`, {
+        headers: {
+            'X-TG-Data': tg?.initData || '',
+            'X-Telegram-User-Id': tg?.initDataUnsafe?.user?.id?.toString() || '',
+            ...(token ? { 'Authorization': `Bearer ${token}` } : {}),
+        },
+    });
+    if (!response.ok) {
+        const error = await response.json().catch(() => ({ detail: 'API Error' }));
+        throw new Error(error.detail || 'Something went wrong');
+    }
+    const data = await response.json();
+    if (data.session) {
+        session = {
+            token: data.session.token,
+            expiresAt: Date.now() + data.session.expires_in * 1000,
+            refreshToken: data.session.refresh_token,
+        };
+    }
+    bootstrapData = data;
+    return data;
+}
+
+// Hand a bootstrap section to the first view that asks for it (later loads go to the API)
+export function takeBootstrap(key: 'hr' | 'interviewer' | 'candidate'): any {
+    if (!bootstrapData) return null;
+    const value = bootstrapData[key] ?? null;
+    bootstrapData[key] = null;
+    return value;
+}
+
 export const api = {
     get: (path: string) => request(path),
     post: (path: string, data?: any) => request(path, {
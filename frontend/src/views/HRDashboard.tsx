@@ -1,5 +1,5 @@
 import React, { useState, useEffect } from 'react';
-import { api } from '../services/api';
+import { api, takeBootstrap } from '../services/api';
 import { ApplicationCard } from '../components/ApplicationCard';
 import { ApplicationDetail } from '../components/ApplicationDetail';
 
@@ -24,7 +24,8 @@ export const HRDashboard: React.FC = () => {
         try {
             const currentFilter = newTab || filter;
             const queryParams = currentFilter === 'all' ? '?status=all' : `?status=${currentFilter}`;
-            const response = await api.get(`/hr/applications${queryParams}`);
+            const initial = !newTab && currentFilter === 'pending' ? takeBootstrap('hr') : null;
+            const response = initial || await api.get(`/hr/applications${queryParams}`);
             setData(response);
         } catch (e) {
             console.error(e);
@@ -114,6 +115,7 @@ export const HRDashboard: React.FC = () => {
                     id={selectedId}
                     onClose={() => setSelectedId(null)}
                     onUpdate={fetchApplications}
+                    onOpen={setSelectedId}
                     role="hr"
                 />
             )}
@@ -1,5 +1,5 @@
 import { useState, useEffect } from 'react';
-import { api } from '../services/api';
+import { api, takeBootstrap } from '../services/api';
 import { ApplicationCard } from '../components/ApplicationCard';
 import { ApplicationDetail } from '../components/ApplicationDetail';
 import { cn } from '../utils/cn';
@@ -31,7 +31,7 @@ export const InterviewerDashboard: React.FC = () => {
     const fetchData = async () => {
         setLoading(true);
         try {
-            const data = await api.get('/interviewer/applications');
+            const data = takeBootstrap('interviewer') || await api.get('/interviewer/applications');
             setMyCandidates(data.my_candidates || []);
             setPool(data.pool || []);
             setArchive(data.archive || []);
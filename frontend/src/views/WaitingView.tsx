@@ -1,6 +1,6 @@
 import React, { useState, useEffect } from 'react';
 import { useTelegram } from '../hooks/useTelegram';
-import { api } from '../services/api';
+import { api, takeBootstrap } from '../services/api';
 import { Card } from '../components/Card';
 import { Badge } from '../components/Badge';
 import { useToast } from '../context/ToastContext';
@@ -16,6 +16,11 @@ export const WaitingView: React.FC = () => {
 
     const fetchData = async () => {
         try {
+            const initial = takeBootstrap('candidate');
+            if (initial) {
+                setData(initial);
+                return;
+            }
             const [apps, interviews] = await Promise.all([
                 api.get('/candidate/applications'),
                 api.get('/candidate/interviews')
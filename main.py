@@ -1,7 +1,7 @@
 """Main application entry point"""
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
 from app.config import settings
 from app.database import init_db
 # Import new routers
@@ -9,6 +9,9 @@ from app.web.routers import candidate_router, hr_router, analyst_router, directo
 from app.web.routers.general import api_router, spa_router
 from app.bot.bot import create_bot_application
 from app.utils.ngrok import setup_ngrok, close_ngrok
+from app.services.notification_dispatcher import notification_dispatcher
+from app.web.middleware import CompressionMiddleware, RateLimitMiddleware
+from app.web.static_files import PrecompressedStaticFiles
 from contextlib import asynccontextmanager
 import os
 
@@ -41,6 +44,9 @@ async def lifespan(app: FastAPI):
     await bot_app.start()
     await bot_app.updater.start_polling()
     
+    # Outbound notification queue (rate limited)
+    notification_dispatcher.start(bot_app.bot)
+    
     # Store bot_app in app state for access in routers
     app.state.bot_app = bot_app
     
@@ -49,6 +55,7 @@ async def lifespan(app: FastAPI):
     # Cleanup
     if ngrok_url:
         close_ngrok()
+    await notification_dispatcher.stop()
     await bot_app.updater.stop()
     await bot_app.stop()
     await bot_app.shutdown()
@@ -58,9 +65,16 @@ app = FastAPI(
     title="RecruitTG API",
     description="API for Recruitment System via Telegram",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
+# gzip/brotli for large JSON and SPA responses (innermost, after rate limiting)
+app.add_middleware(CompressionMiddleware)
+
+# Per-user API rate limits (CORS is added after it, so 429 responses get CORS headers too)
+app.add_middleware(RateLimitMiddleware)
+
 # CORS configuration
 app.add_middleware(
     CORSMiddleware,
@@ -73,7 +87,7 @@ app.add_middleware(
 # Static Files
 static_dir = os.path.join(os.path.dirname(__file__), "app", "web", "static")
 if os.path.exists(static_dir):
-    app.mount("/static", StaticFiles(directory=static_dir), name="static")
+    app.mount("/static", PrecompressedStaticFiles(directory=static_dir), name="static")
 
 # Include Routers
 # Prefix for API routes
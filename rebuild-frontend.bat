@@ -66,6 +66,9 @@ if %ERRORLEVEL% GEQ 8 (
 
 cd ..
 
+:: Precompressed .gz/.br variants served by the backend
+python scripts\precompress_static.py
+
 echo.
 echo ✨ SUCCESS: Frontend rebuilt and deployed!
 echo 📍 Destination: %STATIC_DIR%
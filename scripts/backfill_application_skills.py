@@ -0,0 +1,88 @@
+"""Заповнити application_skills для заявок, створених до появи довідника навичок
+
+Назви навичок у JSON заявок зводяться до канонічних за словником синонімів,
+а навички довідника, на які більше не посилається жодна заявка, видаляються.
+Ідемпотентний - можна перезапускати (зв'язки заявок пакета перезаписуються):
+    python scripts/backfill_application_skills.py --batch-size 1000
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import bindparam, delete, exists
+
+from app.database import SessionLocal
+from app.models.application import Application
+from app.models.skill import ApplicationSkill, Skill
+from app.services.skill_service import SkillService
+from app.utils.skill_aliases import skill_canonicalizer
+
+applications_table = Application.__table__
+
+# Один UPDATE на пакет (executemany); version збільшується, щоб ETag клієнтів став недійсним
+UPDATE_SKILLS = applications_table.update().where(
+    applications_table.c.id == bindparam("b_id")
+).values(
+    skills=bindparam("b_skills"),
+    version=applications_table.c.version + 1
+)
+
+
+def backfill(batch_size: int, dry_run: bool = False) -> None:
+    db = SessionLocal()
+    started = time.perf_counter()
+    last_id = 0
+    applications = links = rewritten = 0
+    try:
+        while True:
+            # Keyset по id - кожен пакет читається за PK-індексом, без OFFSET
+            rows = db.query(Application.id, Application.skills).filter(
+                Application.id > last_id
+            ).order_by(Application.id).limit(batch_size).all()
+            if not rows:
+                break
+
+            canonical_rows = []
+            changed = []
+            for application_id, skills in rows:
+                canonical = skill_canonicalizer.canonicalize_skills(skills)
+                canonical_rows.append((application_id, canonical))
+                if canonical != skills:
+                    changed.append({"b_id": application_id, "b_skills": canonical})
+
+            if changed and not dry_run:
+                db.execute(UPDATE_SKILLS, changed)
+            links += SkillService.sync_skills(db, canonical_rows)
+            if dry_run:
+                db.rollback()
+            else:
+                db.commit()
+            applications += len(rows)
+            rewritten += len(changed)
+            last_id = rows[-1][0]
+            print(f"  ... {applications} applications, {rewritten} rewritten, {links} skill links (last id {last_id})")
+
+        if not dry_run:
+            # Неканонічні навички ("py", "python 3") після перезапису залишились без заявок
+            orphans = db.execute(delete(Skill).where(
+                ~exists().where(ApplicationSkill.skill_id == Skill.id)
+            )).rowcount
+            db.commit()
+            print(f"Removed {orphans} unused skills")
+    finally:
+        db.close()
+    print(
+        f"Done: {applications} applications, {rewritten} rewritten, {links} skill links "
+        f"in {time.perf_counter() - started:.1f}s{' (dry run)' if dry_run else ''}"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    parser.add_argument("--dry-run", action="store_true", help="Нічого не записувати, лише порахувати")
+    args = parser.parse_args()
+    backfill(args.batch_size, args.dry_run)
@@ -0,0 +1,176 @@
+"""Бенчмарк запиту списку заявок HR (вкладка на 10k заявок)
+
+Порівнює старий шлях (повні ORM-об'єкти Application з усіма Text-полями
++ selectinload співбесід) з новим (ApplicationService.get_application_rows:
+лише колонки картки, скринінг корельованим підзапитом). Вимірює час та
+пікову пам'ять (tracemalloc) від запиту до готових словників відповіді:
+    python scripts/bench_list_queries.py --items 10000 --repeat 5
+    DATABASE_URL=postgresql://... python scripts/bench_list_queries.py --keep  # на копії бази
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Tuple
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+BENCH_DB = os.path.join(tempfile.gettempdir(), "bench_list_queries.db")
+os.environ.setdefault("BOT_TOKEN", "123456:fake-token")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{BENCH_DB}")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("ENVIRONMENT", "bench")
+
+from sqlalchemy.orm import selectinload
+
+from app.database import Base, SessionLocal, engine
+from app.models import Application, ApplicationStatus, Interview, InterviewType, User, UserRole
+from app.services.application_service import ApplicationService
+
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "Docker", "React", "TypeScript", "Kubernetes", "Go"]
+
+
+def seed(count: int, seed_value: int) -> None:
+    """Заявки з реалістично великими текстовими полями; третина - з HR-скринінгом"""
+    rnd = random.Random(seed_value)
+    db = SessionLocal()
+    try:
+        candidate = User(telegram_id=900000001, first_name="Bench", role=UserRole.CANDIDATE)
+        hr = User(telegram_id=900000002, first_name="Bench HR", role=UserRole.HR)
+        db.add_all([candidate, hr])
+        db.flush()
+        now = datetime.now(timezone.utc)
+        rows = [
+            {
+                "candidate_id": candidate.id,
+                "full_name": f"Candidate {i}",
+                "email": f"candidate{i}@example.com",
+                "phone": f"+38050{i:07d}",
+                "position": rnd.choice(["Backend Developer", "Frontend Developer", "QA Engineer", "DevOps"]),
+                "experience_years": rnd.randint(0, 15),
+                "skills": [{"name": s, "exp": rnd.randint(1, 8)} for s in rnd.sample(SKILLS, 4)],
+                "english_level": rnd.choice(["A2", "B1", "B2", "C1"]),
+                "education": "National Technical University, Computer Science. " * 5,
+                "previous_work": "Software engineer at a product company, built and operated services. " * 30,
+                "additional_info": "Open to relocation, available in two weeks. " * 10,
+                "portfolio_url": f"https://github.com/candidate{i}",
+                "status": ApplicationStatus.SCREENING_PENDING,
+                "created_at": now - timedelta(minutes=i),
+                "version": 1
+            }
+            for i in range(count)
+        ]
+        db.execute(Application.__table__.insert(), rows)
+        ids = [application_id for (application_id,) in db.query(Application.id)]
+        db.execute(Interview.__table__.insert(), [
+            {
+                "application_id": application_id,
+                "candidate_id": candidate.id,
+                "interviewer_id": hr.id,
+                "interview_type": InterviewType.HR_SCREENING,
+                "selected_time": now if application_id % 2 else None
+            }
+            for application_id in ids if application_id % 3 == 0
+        ])
+        db.commit()
+    finally:
+        db.close()
+
+
+def legacy_path() -> List[dict]:
+    db = SessionLocal()
+    try:
+        applications = db.query(Application).options(selectinload(Application.interviews)).filter(
+            Application.status == ApplicationStatus.SCREENING_PENDING,
+            Application.hr_id == None
+        ).order_by(Application.created_at.desc()).all()
+        return [
+            {
+                "id": app.id,
+                "candidate_name": app.full_name,
+                "position": app.position,
+                "education": app.education,
+                "previous_work": app.previous_work,
+                "additional_info": app.additional_info,
+                "status": app.status,
+                "created_at": app.created_at,
+                "screening_info": next((
+                    {"has_selected_time": i.selected_time is not None}
+                    for i in app.interviews if i.interview_type == InterviewType.HR_SCREENING
+                ), None)
+            }
+            for app in applications
+        ]
+    finally:
+        db.close()
+
+
+def rows_path() -> List[dict]:
+    db = SessionLocal()
+    try:
+        applications = ApplicationService.get_application_rows(
+            db, ApplicationService.HR_LIST_COLUMNS, status="pending", with_screening=True
+        )
+        return [
+            {
+                "id": app.id,
+                "candidate_name": app.full_name,
+                "position": app.position,
+                "status": app.status,
+                "created_at": app.created_at,
+                "screening_info": {
+                    "has_selected_time": bool(app.screening_selected)
+                } if app.screening_selected is not None else None
+            }
+            for app in applications
+        ]
+    finally:
+        db.close()
+
+
+def measure(fn: Callable[[], List[dict]], repeat: int) -> Tuple[List[float], float, int]:
+    count = len(fn())  # прогрів
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return timings, peak / 1024 / 1024, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HR application list query benchmark")
+    parser.add_argument("--items", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--keep", action="store_true", help="Використати наявні дані замість тестових")
+    args = parser.parse_args()
+
+    if not args.keep:
+        if engine.dialect.name != "sqlite":
+            sys.exit("Refusing to seed a non-SQLite database; use --keep to benchmark existing data")
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        seed(args.items, args.seed)
+
+    results = [("ORM rows + selectinload", measure(legacy_path, args.repeat)),
+               ("get_application_rows", measure(rows_path, args.repeat))]
+
+    print(f"Database: {engine.dialect.name}, rows in tab: {results[1][1][2]}, repeats: {args.repeat}")
+    for name, (timings, peak, _) in results:
+        print(f"{name:<26} median={statistics.median(timings):8.1f} ms  min={min(timings):8.1f} ms  peak={peak:7.1f} MiB")
+    legacy, rows = results[0][1], results[1][1]
+    print(f"Speedup: {statistics.median(legacy[0]) / statistics.median(rows[0]):.1f}x, memory: {legacy[1] / rows[1]:.1f}x less")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Бенчмарк відправки сповіщень та обробників бота проти scripts/fake_telegram_api.py
+
+Пропускна здатність черги сповіщень (сервер імітатора має бути запущений):
+    python scripts/fake_telegram_api.py --port 8081 --latency-ms 80 --retry-after-rate 0.01 --seed 1
+    python scripts/bench_notifications.py dispatcher --messages 2000
+
+Затримка обробників бота (додаток запущено з TELEGRAM_API_BASE_URL=http://localhost:8081):
+    python scripts/bench_notifications.py handlers --updates 200
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import List
+
+import httpx
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Бенчмарку черги не потрібні БД та справжній токен
+os.environ.setdefault("BOT_TOKEN", "123456:fake-token")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("ENVIRONMENT", "bench")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+async def bench_dispatcher(args: argparse.Namespace) -> None:
+    from telegram import Bot
+    from app.services.notification_dispatcher import NotificationDispatcher
+
+    api_url = args.api_url.rstrip("/")
+    bot = Bot(args.token, base_url=f"{api_url}/bot")
+    await bot.initialize()
+
+    dispatcher = NotificationDispatcher(
+        rate_per_second=args.rate,
+        max_queue=args.queue_size,
+        max_in_flight=args.in_flight,
+        max_retries=args.retries
+    )
+    dispatcher.start(bot)
+
+    latencies: List[float] = []
+    results = {"ok": 0, "failed": 0}
+    done = asyncio.Event()
+
+    def make_callback(enqueued_at: float):
+        def on_done(ok: bool) -> None:
+            latencies.append((time.monotonic() - enqueued_at) * 1000)
+            results["ok" if ok else "failed"] += 1
+            if results["ok"] + results["failed"] == args.messages:
+                done.set()
+        return on_done
+
+    started = time.monotonic()
+    for i in range(args.messages):
+        await dispatcher.enqueue(
+            1000 + i % args.recipients,
+            f"Benchmark message {i}",
+            parse_mode=None,
+            on_done=make_callback(time.monotonic())
+        )
+    await done.wait()
+    elapsed = time.monotonic() - started
+
+    await dispatcher.stop()
+    await bot.shutdown()
+
+    print(f"Messages:     {args.messages} ({results['ok']} ok, {results['failed']} failed)")
+    print(f"Elapsed:      {elapsed:.2f} s")
+    print(f"Throughput:   {args.messages / elapsed:.1f} msg/s (limit {args.rate}/s)")
+    print(f"Latency (enqueue -> done): p50={percentile(latencies, 50):.1f} ms "
+          f"p95={percentile(latencies, 95):.1f} ms max={max(latencies):.1f} ms")
+
+    async with httpx.AsyncClient() as client:
+        stats = (await client.get(f"{api_url}/_control/stats")).json()
+    print(f"Server calls: {stats['calls']}, injected errors: {stats['injected_errors']}")
+
+
+async def bench_handlers(args: argparse.Namespace) -> None:
+    api_url = args.api_url.rstrip("/")
+    async with httpx.AsyncClient() as client:
+        await client.post(f"{api_url}/_control/reset")
+
+        started = time.monotonic()
+        for i in range(args.updates):
+            await client.post(f"{api_url}/_control/message", json={"chat_id": 5000 + i, "text": args.text})
+
+        stats = {}
+        while time.monotonic() - started < args.timeout:
+            stats = (await client.get(f"{api_url}/_control/stats")).json()
+            if stats["handler_latency_ms"]["count"] >= args.updates:
+                break
+            await asyncio.sleep(0.2)
+        elapsed = time.monotonic() - started
+
+    latency = stats.get("handler_latency_ms", {})
+    print(f"Updates:      {args.updates} ({latency.get('count', 0)} answered) in {elapsed:.2f} s")
+    print(f"Handler latency (update -> reply): p50={latency.get('p50')} ms "
+          f"p95={latency.get('p95')} ms p99={latency.get('p99')} ms max={latency.get('max')} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Notification and bot handler benchmarks")
+    parser.add_argument("--api-url", default="http://127.0.0.1:8081", help="Fake Bot API server URL")
+    sub = parser.add_subparsers(dest="mode", required=True)
+
+    dispatcher = sub.add_parser("dispatcher", help="Outbound notification queue throughput")
+    dispatcher.add_argument("--token", default="123456:fake-token")
+    dispatcher.add_argument("--messages", type=int, default=1000)
+    dispatcher.add_argument("--recipients", type=int, default=100)
+    dispatcher.add_argument("--rate", type=float, default=25.0, help="Messages per second limit")
+    dispatcher.add_argument("--in-flight", type=int, default=10)
+    dispatcher.add_argument("--queue-size", type=int, default=1000)
+    dispatcher.add_argument("--retries", type=int, default=3)
+
+    handlers = sub.add_parser("handlers", help="Bot handler latency (app must use the fake server)")
+    handlers.add_argument("--updates", type=int, default=100)
+    handlers.add_argument("--text", default="/start")
+    handlers.add_argument("--timeout", type=float, default=60)
+
+    args = parser.parse_args()
+    if args.mode == "dispatcher":
+        asyncio.run(bench_dispatcher(args))
+    else:
+        asyncio.run(bench_handlers(args))
+
+
+if __name__ == "__main__":
+    main()
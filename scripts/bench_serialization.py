@@ -0,0 +1,107 @@
+"""Бенчмарк серіалізації списку заявок HR (/web/hr/applications)
+
+Порівнює старий шлях (словники з Enum -> jsonable_encoder -> JSONResponse)
+з новим (response_model на Pydantic v2 -> ORJSONResponse):
+    python scripts/bench_serialization.py --items 5000 --repeat 20
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+os.environ.setdefault("BOT_TOKEN", "123456:fake-token")
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("SECRET_KEY", "bench")
+os.environ.setdefault("ENVIRONMENT", "bench")
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from app.models.application import ApplicationStatus
+from app.schemas.application import HRApplicationList
+
+SKILLS = ["Python", "FastAPI", "PostgreSQL", "Docker", "React", "TypeScript", "Kubernetes", "Go"]
+
+
+def make_items(count: int, seed: int) -> List[dict]:
+    """Словники у тому вигляді, як їх будує роутер HR"""
+    rnd = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    statuses = list(ApplicationStatus)
+    return [
+        {
+            "id": i,
+            "candidate_name": f"Candidate {i}",
+            "email": f"candidate{i}@example.com",
+            "phone": f"+38050{i:07d}",
+            "position": rnd.choice(["Backend Developer", "Frontend Developer", "QA Engineer", "DevOps"]),
+            "experience_years": rnd.randint(0, 15),
+            "skills": [{"name": s, "exp": rnd.randint(1, 8)} for s in rnd.sample(SKILLS, 4)],
+            "english_level": rnd.choice(["A2", "B1", "B2", "C1"]),
+            "portfolio_url": f"https://github.com/candidate{i}",
+            "status": rnd.choice(statuses),
+            "created_at": now - timedelta(minutes=i),
+            "screening_info": {"has_selected_time": bool(i % 2)} if i % 3 else None
+        }
+        for i in range(count)
+    ]
+
+
+def legacy_payload(items: List[dict]) -> dict:
+    # Старі роутери віддавали дати рядками isoformat()
+    return {
+        "counts": {"pending": len(items)},
+        "applications": [dict(item, created_at=item["created_at"].isoformat()) for item in items]
+    }
+
+
+def measure(fn: Callable[[], bytes], repeat: int) -> List[float]:
+    fn()  # прогрів
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="HR application list serialization benchmark")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    items = make_items(args.items, args.seed)
+    legacy = legacy_payload(items)
+    typed = {"counts": {"pending": len(items)}, "applications": items}
+    field = create_response_field(name="Response_bench", type_=HRApplicationList)
+
+    def old_path() -> bytes:
+        return JSONResponse(jsonable_encoder(legacy)).body
+
+    def new_path() -> bytes:
+        content = asyncio.run(serialize_response(field=field, response_content=typed, is_coroutine=True))
+        return ORJSONResponse(content).body
+
+    results = [("jsonable_encoder + JSONResponse", measure(old_path, args.repeat)),
+               ("response_model + ORJSONResponse", measure(new_path, args.repeat))]
+
+    print(f"Items: {args.items}, payload: {len(new_path()) / 1024:.0f} KiB, repeats: {args.repeat}")
+    for name, timings in results:
+        print(f"{name:<34} median={statistics.median(timings):8.1f} ms  min={min(timings):8.1f} ms")
+    speedup = statistics.median(results[0][1]) / statistics.median(results[1][1])
+    print(f"Speedup: {speedup:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
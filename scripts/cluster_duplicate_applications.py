@@ -0,0 +1,132 @@
+"""Знайти дублікати серед існуючих заявок (той самий email чи телефон)
+
+1. Заповнює email_hash/phone_hash заявок, де їх ще немає (або змінилась нормалізація).
+2. Об'єднує заявки зі спільним email чи телефоном у кластери (транзитивно)
+   і проставляє duplicate_of_id = найперша заявка кластера.
+Ідемпотентний - можна запускати періодично:
+    python scripts/cluster_duplicate_applications.py --batch-size 1000
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import bindparam
+
+from app.database import SessionLocal
+from app.models.application import Application
+from app.utils.contacts import email_hash, phone_hash
+
+applications_table = Application.__table__
+
+# Хеші - службові поля: updated_at не чіпаємо, щоб не запускати дельта-синхронізацію клієнтів
+UPDATE_HASHES = applications_table.update().where(
+    applications_table.c.id == bindparam("b_id")
+).values(
+    email_hash=bindparam("b_email_hash"),
+    phone_hash=bindparam("b_phone_hash"),
+    updated_at=applications_table.c.updated_at
+)
+# Позначка дубліката видима HR - version збільшується, щоб ETag став недійсним
+UPDATE_DUPLICATE = applications_table.update().where(
+    applications_table.c.id == bindparam("b_id")
+).values(
+    duplicate_of_id=bindparam("b_duplicate_of_id"),
+    version=applications_table.c.version + 1
+)
+
+
+def fill_hashes(db, batch_size: int) -> int:
+    last_id = 0
+    updated = 0
+    while True:
+        rows = db.query(
+            Application.id, Application.email, Application.phone, Application.email_hash, Application.phone_hash
+        ).filter(Application.id > last_id).order_by(Application.id).limit(batch_size).all()
+        if not rows:
+            break
+        changed = []
+        for application_id, email, phone, current_email_hash, current_phone_hash in rows:
+            new_email_hash, new_phone_hash = email_hash(email), phone_hash(phone)
+            if (new_email_hash, new_phone_hash) != (current_email_hash, current_phone_hash):
+                changed.append({"b_id": application_id, "b_email_hash": new_email_hash, "b_phone_hash": new_phone_hash})
+        if changed:
+            db.execute(UPDATE_HASHES, changed)
+        db.commit()
+        updated += len(changed)
+        last_id = rows[-1][0]
+    return updated
+
+
+def cluster(db, batch_size: int) -> int:
+    # Union-find по id заявок; корінь - найменший id кластера
+    parent: Dict[int, int] = {}
+    first_by_key: Dict[str, int] = {}
+    current: Dict[int, int] = {}
+
+    def find(application_id: int) -> int:
+        root = application_id
+        while parent[root] != root:
+            root = parent[root]
+        while parent[application_id] != root:
+            parent[application_id], application_id = root, parent[application_id]
+        return root
+
+    def union(a: int, b: int) -> None:
+        root_a, root_b = find(a), find(b)
+        if root_a != root_b:
+            parent[max(root_a, root_b)] = min(root_a, root_b)
+
+    last_id = 0
+    while True:
+        rows = db.query(
+            Application.id, Application.email_hash, Application.phone_hash, Application.duplicate_of_id
+        ).filter(Application.id > last_id).order_by(Application.id).limit(batch_size).all()
+        if not rows:
+            break
+        for application_id, email_key, phone_key, duplicate_of_id in rows:
+            parent[application_id] = application_id
+            if duplicate_of_id is not None:
+                current[application_id] = duplicate_of_id
+            for key in (f"e:{email_key}" if email_key else None, f"p:{phone_key}" if phone_key else None):
+                if key is None:
+                    continue
+                if key in first_by_key:
+                    union(application_id, first_by_key[key])
+                else:
+                    first_by_key[key] = application_id
+        last_id = rows[-1][0]
+
+    changed: List[Dict[str, int]] = []
+    for application_id in parent:
+        root = find(application_id)
+        duplicate_of_id = root if root != application_id else None
+        if current.get(application_id) != duplicate_of_id:
+            changed.append({"b_id": application_id, "b_duplicate_of_id": duplicate_of_id})
+
+    for start in range(0, len(changed), batch_size):
+        db.execute(UPDATE_DUPLICATE, changed[start:start + batch_size])
+        db.commit()
+    return len(changed)
+
+
+def run(batch_size: int) -> None:
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        hashed = fill_hashes(db, batch_size)
+        print(f"  ... contact hashes updated for {hashed} applications")
+        marked = cluster(db, batch_size)
+    finally:
+        db.close()
+    print(f"Done: duplicate_of_id changed for {marked} applications in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+    run(args.batch_size)
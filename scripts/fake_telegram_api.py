@@ -0,0 +1,384 @@
+"""Локальний імітатор Telegram Bot API для навантажувального та хаос-тестування
+
+Підтримує методи, якими користується бот: getMe, sendMessage, editMessageText,
+getUpdates, answerCallbackQuery, setWebhook/deleteWebhook/getWebhookInfo.
+Затримку, частку помилок та відповіді 429 (RetryAfter) можна налаштувати
+при запуску або під час роботи через /_control/config.
+
+Запуск:
+    python scripts/fake_telegram_api.py --port 8081 --latency-ms 50 --error-rate 0.01 --retry-after-rate 0.02
+
+Бот (.env):
+    TELEGRAM_API_BASE_URL=http://localhost:8081
+
+Керування:
+    POST /_control/message   {"chat_id": 1, "text": "/start"}      - імітувати повідомлення користувача
+    POST /_control/callback  {"chat_id": 1, "data": "back_menu"}   - імітувати натискання кнопки
+    POST /_control/config    {"latency_ms": 100, "error_rate": 0.1} - змінити параметри хаосу
+    GET  /_control/stats                                            - лічильники та затримки обробників
+    POST /_control/reset                                            - скинути стан
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, deque
+from typing import Any, Deque, Dict, List, Optional
+
+import httpx
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class ChaosConfig:
+    """Параметри штучної затримки та помилок"""
+
+    def __init__(
+        self,
+        latency_ms: float = 0,
+        jitter_ms: float = 0,
+        error_rate: float = 0,
+        retry_after_rate: float = 0,
+        retry_after_seconds: int = 1,
+        seed: Optional[int] = None
+    ):
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.retry_after_rate = retry_after_rate
+        self.retry_after_seconds = retry_after_seconds
+        self.seed = seed
+        self.random = random.Random(seed)
+
+    def update(self, data: Dict[str, Any]) -> None:
+        for field in ("latency_ms", "jitter_ms", "error_rate", "retry_after_rate", "retry_after_seconds"):
+            if field in data:
+                setattr(self, field, type(getattr(self, field))(data[field]))
+        if "seed" in data:
+            self.seed = data["seed"]
+            self.random = random.Random(self.seed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "error_rate": self.error_rate,
+            "retry_after_rate": self.retry_after_rate,
+            "retry_after_seconds": self.retry_after_seconds,
+            "seed": self.seed
+        }
+
+
+class FakeTelegramState:
+    """Стан імітатора: оновлення, повідомлення, статистика"""
+
+    def __init__(self, chaos: ChaosConfig):
+        self.chaos = chaos
+        self.reset()
+
+    def reset(self) -> None:
+        # Будимо long polling, що чекає на старій події, інакше він простоїть до таймауту
+        if getattr(self, "new_updates", None):
+            self.new_updates.set()
+        # update_id не скидаємо: бот уже передає offset, і нові оновлення мають бути після нього
+        self.update_id = getattr(self, "update_id", 0)
+        self.message_id = 0
+        self.updates: Deque[Dict[str, Any]] = deque()
+        self.new_updates = asyncio.Event()
+        self.webhook_url: Optional[str] = None
+        self.calls: Counter = Counter()
+        self.injected_errors: Counter = Counter()
+        self.sent_messages: Deque[Dict[str, Any]] = deque(maxlen=1000)
+        # chat_id -> момент імітованої дії користувача, що ще чекає на відповідь бота
+        self.awaiting_reply: Dict[int, float] = {}
+        self.handler_latencies: Deque[float] = deque(maxlen=10000)
+        self.started_at = time.monotonic()
+
+    def next_message_id(self) -> int:
+        self.message_id += 1
+        return self.message_id
+
+    def push_update(self, update: Dict[str, Any], chat_id: int) -> Dict[str, Any]:
+        self.update_id += 1
+        update["update_id"] = self.update_id
+        self.updates.append(update)
+        self.awaiting_reply.setdefault(chat_id, time.monotonic())
+        self.new_updates.set()
+        return update
+
+    def record_reply(self, chat_id: int) -> None:
+        started = self.awaiting_reply.pop(chat_id, None)
+        if started is not None:
+            self.handler_latencies.append((time.monotonic() - started) * 1000)
+
+
+BOT_USER = {"id": 1, "is_bot": True, "first_name": "FakeBot", "username": "fake_recruit_bot"}
+
+
+def make_user(chat_id: int) -> Dict[str, Any]:
+    return {"id": chat_id, "is_bot": False, "first_name": f"User{chat_id}", "username": f"user{chat_id}"}
+
+
+def make_message(state: FakeTelegramState, chat_id: int, text: str, from_user: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "message_id": state.next_message_id(),
+        "date": int(time.time()),
+        "chat": {"id": chat_id, "type": "private"},
+        "from": from_user,
+        "text": text
+    }
+
+
+def ok(result: Any) -> JSONResponse:
+    return JSONResponse({"ok": True, "result": result})
+
+
+def error(code: int, description: str, parameters: Optional[Dict[str, Any]] = None) -> JSONResponse:
+    body: Dict[str, Any] = {"ok": False, "error_code": code, "description": description}
+    if parameters:
+        body["parameters"] = parameters
+    return JSONResponse(body, status_code=code)
+
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 2)
+
+
+async def parse_params(request: Request) -> Dict[str, Any]:
+    """Параметри запиту: JSON, form-data або query string (вкладені значення - JSON-рядки)"""
+    params: Dict[str, Any] = dict(request.query_params)
+    content_type = request.headers.get("content-type", "")
+    if "application/json" in content_type:
+        body = await request.body()
+        if body:
+            params.update(json.loads(body))
+    elif content_type:
+        form = await request.form()
+        params.update({key: value for key, value in form.items() if isinstance(value, str)})
+
+    for key, value in list(params.items()):
+        if isinstance(value, str) and value[:1] in ("{", "["):
+            try:
+                params[key] = json.loads(value)
+            except ValueError:
+                pass
+    return params
+
+
+def create_app(chaos: ChaosConfig) -> FastAPI:
+    app = FastAPI(title="Fake Telegram Bot API")
+    state = FakeTelegramState(chaos)
+    app.state.fake = state
+
+    async def send_message(params: Dict[str, Any]) -> JSONResponse:
+        chat_id = int(params["chat_id"])
+        message = make_message(state, chat_id, params.get("text", ""), BOT_USER)
+        state.sent_messages.append(message)
+        state.record_reply(chat_id)
+        return ok(message)
+
+    async def edit_message_text(params: Dict[str, Any]) -> JSONResponse:
+        chat_id = int(params.get("chat_id", 0))
+        message = {
+            "message_id": int(params.get("message_id", 0)),
+            "date": int(time.time()),
+            "edit_date": int(time.time()),
+            "chat": {"id": chat_id, "type": "private"},
+            "from": BOT_USER,
+            "text": params.get("text", "")
+        }
+        state.record_reply(chat_id)
+        return ok(message)
+
+    async def get_updates(params: Dict[str, Any]) -> JSONResponse:
+        if state.webhook_url:
+            return error(409, "Conflict: can't use getUpdates method while webhook is active")
+
+        offset = int(params.get("offset", 0) or 0)
+        limit = int(params.get("limit", 100) or 100)
+        timeout = float(params.get("timeout", 0) or 0)
+
+        while state.updates and state.updates[0]["update_id"] < offset:
+            state.updates.popleft()
+
+        if not state.updates and timeout > 0:
+            state.new_updates.clear()
+            try:
+                await asyncio.wait_for(state.new_updates.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        return ok(list(state.updates)[:limit])
+
+    async def set_webhook(params: Dict[str, Any]) -> JSONResponse:
+        state.webhook_url = params.get("url") or None
+        return ok(True)
+
+    async def delete_webhook(params: Dict[str, Any]) -> JSONResponse:
+        state.webhook_url = None
+        if str(params.get("drop_pending_updates", "")).lower() in ("true", "1"):
+            state.updates.clear()
+        return ok(True)
+
+    async def get_webhook_info(params: Dict[str, Any]) -> JSONResponse:
+        return ok({
+            "url": state.webhook_url or "",
+            "has_custom_certificate": False,
+            "pending_update_count": len(state.updates)
+        })
+
+    async def answer_callback_query(params: Dict[str, Any]) -> JSONResponse:
+        return ok(True)
+
+    async def get_me(params: Dict[str, Any]) -> JSONResponse:
+        return ok({**BOT_USER, "can_join_groups": True, "can_read_all_group_messages": False, "supports_inline_queries": False})
+
+    async def simple_true(params: Dict[str, Any]) -> JSONResponse:
+        return ok(True)
+
+    methods = {
+        "getme": get_me,
+        "sendmessage": send_message,
+        "editmessagetext": edit_message_text,
+        "getupdates": get_updates,
+        "answercallbackquery": answer_callback_query,
+        "setwebhook": set_webhook,
+        "deletewebhook": delete_webhook,
+        "getwebhookinfo": get_webhook_info,
+        "logout": simple_true,
+        "close": simple_true,
+        "setmycommands": simple_true,
+    }
+
+    @app.api_route("/bot{token}/{method}", methods=["GET", "POST"])
+    async def bot_api(token: str, method: str, request: Request):
+        name = method.lower()
+        handler = methods.get(name)
+        if not handler:
+            return error(404, "Not Found: method not found")
+        state.calls[method] += 1
+        params = await parse_params(request)
+
+        # getUpdates - це long polling, штучні помилки для нього лише заважають
+        if name != "getupdates":
+            delay = chaos.latency_ms + chaos.random.uniform(0, chaos.jitter_ms)
+            if delay > 0:
+                await asyncio.sleep(delay / 1000)
+
+            roll = chaos.random.random()
+            if roll < chaos.retry_after_rate:
+                state.injected_errors["429"] += 1
+                return error(
+                    429,
+                    f"Too Many Requests: retry after {chaos.retry_after_seconds}",
+                    {"retry_after": chaos.retry_after_seconds}
+                )
+            if roll < chaos.retry_after_rate + chaos.error_rate:
+                state.injected_errors["500"] += 1
+                return error(500, "Internal Server Error")
+
+        try:
+            return await handler(params)
+        except (KeyError, ValueError) as e:
+            return error(400, f"Bad Request: {e}")
+
+    async def deliver(update: Dict[str, Any], chat_id: int) -> Dict[str, Any]:
+        if state.webhook_url:
+            state.awaiting_reply.setdefault(chat_id, time.monotonic())
+            async with httpx.AsyncClient() as client:
+                await client.post(state.webhook_url, json=update)
+            return update
+        return state.push_update(update, chat_id)
+
+    @app.post("/_control/message")
+    async def inject_message(data: Dict[str, Any]):
+        chat_id = int(data["chat_id"])
+        message = make_message(state, chat_id, data.get("text", "/start"), make_user(chat_id))
+        if message["text"].startswith("/"):
+            command = message["text"].split()[0]
+            message["entities"] = [{"type": "bot_command", "offset": 0, "length": len(command)}]
+        return await deliver({"message": message}, chat_id)
+
+    @app.post("/_control/callback")
+    async def inject_callback(data: Dict[str, Any]):
+        chat_id = int(data["chat_id"])
+        message = make_message(state, chat_id, data.get("message_text", "menu"), BOT_USER)
+        if "message_id" in data:
+            message["message_id"] = int(data["message_id"])
+        callback = {
+            "id": str(state.update_id + 1),
+            "from": make_user(chat_id),
+            "chat_instance": str(chat_id),
+            "message": message,
+            "data": data.get("data", "back_menu")
+        }
+        return await deliver({"callback_query": callback}, chat_id)
+
+    @app.post("/_control/config")
+    async def update_config(data: Dict[str, Any]):
+        chaos.update(data)
+        return chaos.to_dict()
+
+    @app.get("/_control/stats")
+    async def stats():
+        latencies = list(state.handler_latencies)
+        return {
+            "uptime_seconds": round(time.monotonic() - state.started_at, 2),
+            "config": chaos.to_dict(),
+            "calls": dict(state.calls),
+            "injected_errors": dict(state.injected_errors),
+            "messages_sent": state.calls.get("sendMessage", 0),
+            "pending_updates": len(state.updates),
+            "awaiting_reply": len(state.awaiting_reply),
+            "handler_latency_ms": {
+                "count": len(latencies),
+                "p50": percentile(latencies, 50),
+                "p95": percentile(latencies, 95),
+                "p99": percentile(latencies, 99),
+                "max": round(max(latencies), 2) if latencies else None
+            }
+        }
+
+    @app.get("/_control/messages")
+    async def messages(limit: int = 50):
+        return {"messages": list(state.sent_messages)[-limit:]}
+
+    @app.post("/_control/reset")
+    async def reset():
+        state.reset()
+        return {"success": True}
+
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fake Telegram Bot API server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8081)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Base latency per call")
+    parser.add_argument("--jitter-ms", type=float, default=0, help="Extra random latency (uniform 0..jitter)")
+    parser.add_argument("--error-rate", type=float, default=0, help="Share of calls answered with HTTP 500")
+    parser.add_argument("--retry-after-rate", type=float, default=0, help="Share of calls answered with 429")
+    parser.add_argument("--retry-after-seconds", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=None, help="RNG seed for repeatable runs")
+    args = parser.parse_args()
+
+    chaos = ChaosConfig(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        retry_after_rate=args.retry_after_rate,
+        retry_after_seconds=args.retry_after_seconds,
+        seed=args.seed
+    )
+    uvicorn.run(create_app(chaos), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
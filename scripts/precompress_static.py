@@ -0,0 +1,75 @@
+"""Створити стиснуті варіанти (.gz, .br) зібраних файлів фронтенду в app/web/static
+
+Запускається після збірки фронтенду (rebuild-frontend.bat):
+    python scripts/precompress_static.py
+"""
+import argparse
+import gzip
+import os
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app", "web", "static")
+EXTENSIONS = (".js", ".css", ".html", ".svg", ".json", ".map", ".txt")
+
+
+def is_fresh(source: str, target: str) -> bool:
+    return os.path.exists(target) and os.path.getmtime(target) >= os.path.getmtime(source)
+
+
+def write_variant(target: str, data: bytes, source_size: int) -> bool:
+    # Стиснутий варіант, що не менший за оригінал, лише шкодить
+    if len(data) >= source_size:
+        if os.path.exists(target):
+            os.remove(target)
+        return False
+    with open(target, "wb") as f:
+        f.write(data)
+    return True
+
+
+def precompress(directory: str, min_size: int, force: bool) -> None:
+    total_source = total_gzip = total_brotli = 0
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if not name.endswith(EXTENSIONS):
+                continue
+            source = os.path.join(root, name)
+            with open(source, "rb") as f:
+                data = f.read()
+            if len(data) < min_size:
+                continue
+            total_source += len(data)
+
+            gz_path = source + ".gz"
+            if force or not is_fresh(source, gz_path):
+                write_variant(gz_path, gzip.compress(data, compresslevel=9, mtime=0), len(data))
+            total_gzip += os.path.getsize(gz_path) if os.path.exists(gz_path) else len(data)
+
+            if brotli is not None:
+                br_path = source + ".br"
+                if force or not is_fresh(source, br_path):
+                    write_variant(br_path, brotli.compress(data, quality=11), len(data))
+                total_brotli += os.path.getsize(br_path) if os.path.exists(br_path) else len(data)
+
+    print(f"Source: {total_source / 1024:.1f} KiB, gzip: {total_gzip / 1024:.1f} KiB", end="")
+    if brotli is not None:
+        print(f", brotli: {total_brotli / 1024:.1f} KiB")
+    else:
+        print(" (brotli is not installed, .br files skipped)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Precompress built frontend assets")
+    parser.add_argument("--dir", default=STATIC_DIR)
+    parser.add_argument("--min-size", type=int, default=1024)
+    parser.add_argument("--force", action="store_true", help="Recompress even if variants are up to date")
+    args = parser.parse_args()
+    precompress(args.dir, args.min_size, args.force)
+
+
+if __name__ == "__main__":
+    main()
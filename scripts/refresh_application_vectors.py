@@ -0,0 +1,63 @@
+"""Перебудувати вектори схожості для нових та змінених заявок
+
+Обробляє лише заявки без вектора або змінені після його побудови
+(updated_at > built_at), тож запускається періодично:
+    python scripts/refresh_application_vectors.py --batch-size 500
+    python scripts/refresh_application_vectors.py --full  # перебудувати всі
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import or_
+
+from app.database import SessionLocal
+from app.models.application import Application
+from app.models.similarity import ApplicationVector
+from app.services.similarity_service import SimilarityService
+
+
+def refresh(batch_size: int, full: bool = False) -> None:
+    db = SessionLocal()
+    started = time.perf_counter()
+    last_id = 0
+    applications = postings = 0
+    try:
+        while True:
+            # Keyset по id; застарілість перевіряється в тому ж запиті через PK application_vectors
+            query = db.query(
+                Application.id,
+                Application.skills,
+                Application.position,
+                Application.previous_work,
+                Application.updated_at
+            ).outerjoin(
+                ApplicationVector, ApplicationVector.application_id == Application.id
+            ).filter(Application.id > last_id)
+            if not full:
+                query = query.filter(or_(
+                    ApplicationVector.application_id == None,
+                    Application.updated_at > ApplicationVector.built_at
+                ))
+            rows = query.order_by(Application.id).limit(batch_size).all()
+            if not rows:
+                break
+            postings += SimilarityService.index_applications(db, rows)
+            db.commit()
+            applications += len(rows)
+            last_id = rows[-1][0]
+            print(f"  ... {applications} applications, {postings} terms (last id {last_id})")
+    finally:
+        db.close()
+    print(f"Done: {applications} applications, {postings} terms in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--full", action="store_true", help="Перебудувати вектори всіх заявок")
+    args = parser.parse_args()
+    refresh(args.batch_size, args.full)